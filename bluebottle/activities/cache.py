@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+
+def get_stats_key(name, pk):
+    return '{}.activity_stats.{}.{}'.format(connection.tenant.schema_name, name, pk)
+
+
+def get_stats(name, pk, calculate):
+    """
+    Return the cached stats for `name` (e.g. `initiative`) with `pk`, or store the result
+    of `calculate` if they are not cached yet.
+    """
+    key = get_stats_key(name, pk)
+    stats = cache.get(key)
+
+    if stats is None:
+        stats = calculate()
+        cache.set(key, stats, settings.ACTIVITY_STATS_CACHE_TIMEOUT)
+
+    return stats
+
+
+def invalidate_stats(name, pks):
+    cache.delete_many([get_stats_key(name, pk) for pk in pks])
@@ -9,8 +9,11 @@ from elasticsearch_dsl.query import (
 )
 from elasticsearch_dsl.function import ScriptScore
 from bluebottle.activities.documents import activity
+from bluebottle.activities.utils import get_user_location
 from bluebottle.utils.filters import ElasticSearchFilter
 
+DISTANCE_RE = re.compile(r'^(?P<distance>\d+(\.\d+)?)\s*(?P<unit>km|mi|m)?$')
+
 
 class ActivitySearchFilter(ElasticSearchFilter):
     document = activity
@@ -20,6 +23,7 @@ class ActivitySearchFilter(ElasticSearchFilter):
         'alphabetical': ('title_keyword', ),
         'popularity': 'relevancy',
         'relevancy': 'relevancy',
+        'distance': 'distance',
     }
     default_sort_field = 'relevancy'
 
@@ -33,6 +37,7 @@ class ActivitySearchFilter(ElasticSearchFilter):
         'status',
         'initiative_location.id',
         'segment',
+        'distance',
     )
 
     search_fields = (
@@ -130,7 +135,7 @@ class ActivitySearchFilter(ElasticSearchFilter):
                 filter=Q('term', is_online=True)
             )
 
-            location = request.user.location or request.user.place
+            location = get_user_location(request)
             if location and location.position:
                 matching = matching | ConstantScore(
                     filter=Q(
@@ -147,6 +152,54 @@ class ActivitySearchFilter(ElasticSearchFilter):
 
         return score
 
+    def get_position(self, request):
+        """
+        The position to filter and sort on distance from: `filter[position]` (`lat,lon`), or the
+        position of the office or place of the user
+        """
+        try:
+            latitude, longitude = request.GET['filter[position]'].split(',')
+            return {'lat': float(latitude), 'lon': float(longitude)}
+        except (KeyError, ValueError):
+            location = get_user_location(request)
+            if location and location.position:
+                return {'lat': location.position.y, 'lon': location.position.x}
+
+    def get_sort(self, request):
+        sort = super(ActivitySearchFilter, self).get_sort(request)
+
+        if sort == 'distance':
+            position = self.get_position(request)
+            if not position:
+                return self.sort_fields[self.default_sort_field]
+
+            # Activities without a position are sorted last
+            return ({
+                '_geo_distance': {
+                    'position': position,
+                    'order': 'asc',
+                    'unit': 'km',
+                    'mode': 'min',
+                }
+            }, )
+
+        return sort
+
+    def get_distance_filter(self, value, request):
+        """
+        Activities within `value` (e.g. `10km`, `5mi`, or a number of kilometers) of the
+        position, see `get_position`. Online activities have no position and are left out.
+        """
+        match = DISTANCE_RE.match(value.strip())
+        position = self.get_position(request)
+
+        if match and position:
+            return Q(
+                'geo_distance',
+                distance='{}{}'.format(match.group('distance'), match.group('unit') or 'km'),
+                position=position
+            )
+
     def get_type_filter(self, value, request):
         if value == 'time_based':
             return Term(type='dateactivity') | Term(type='periodactivity')
@@ -0,0 +1,62 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from bluebottle.activities.views import ActivityList
+from bluebottle.clients.models import Client
+from bluebottle.clients.utils import LocalTenant
+
+
+class Command(BaseCommand):
+    help = (
+        'Time the anonymous activity list with the full serializer '
+        'and with the list projection (`?projection=list`).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tenant', type=str, required=True,
+            help='The schema name of the tenant to run the benchmark on.'
+        )
+        parser.add_argument(
+            '--sizes', type=int, nargs='+', default=[25, 100, 500],
+            help='The page sizes to request.'
+        )
+
+    def request(self, size, projection):
+        params = {'page[size]': size}
+        if projection:
+            params['projection'] = 'list'
+
+        request = APIRequestFactory().get('/api/activities/search', params)
+
+        with CaptureQueriesContext(connection) as queries:
+            start = time.time()
+            response = ActivityList.as_view()(request)
+            response.render()
+            duration = time.time() - start
+
+        if response.status_code != 200:
+            raise CommandError('Request failed: {}'.format(response.content))
+
+        return duration, len(queries), len(response.content)
+
+    def handle(self, *args, **options):
+        try:
+            client = Client.objects.get(schema_name=options['tenant'])
+        except Client.DoesNotExist:
+            raise CommandError('Unknown tenant: {}'.format(options['tenant']))
+
+        with LocalTenant(client, clear_tenant=True):
+            for size in options['sizes']:
+                for projection in (False, True):
+                    duration, queries, length = self.request(size, projection)
+                    self.stdout.write(
+                        '{} items, {}: {:.3f}s, {} queries, {} bytes'.format(
+                            size, 'projection' if projection else 'serializer',
+                            duration, queries, length
+                        )
+                    )
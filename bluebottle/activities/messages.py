@@ -1,4 +1,3 @@
-from pytz import timezone
 
 from django.urls import reverse
 from django.template.defaultfilters import time, date
@@ -225,7 +224,7 @@ class MatchingActivitiesNotification(TransitionMessage):
                 slot = slots[0]
 
                 if slot.location and not slot.is_online:
-                    tz = timezone(slot.location.timezone)
+                    tz = slot.location.tzinfo
                 else:
                     tz = get_current_timezone()
 
@@ -7,6 +7,9 @@ from bluebottle.utils.permissions import ResourcePermission, ResourceOwnerPermis
 
 class ActivityOwnerPermission(ResourceOwnerPermission):
     def has_object_action_permission(self, action, user, obj):
+        if not user.is_authenticated:
+            return action == 'POST' and obj.initiative.status == 'approved' and obj.initiative.is_open
+
         try:
             owner = obj.owner
         except Activity.owner.RelatedObjectDoesNotExist:
@@ -52,16 +55,45 @@ class ActivityStatusPermission(ResourcePermission):
 
 class ActivitySegmentPermission(BasePermission):
 
+    def __init__(self, *args, **kwargs):
+        super(ActivitySegmentPermission, self).__init__(*args, **kwargs)
+        self.closed_segments = {}
+
+    def prepare_objects(self, user, objs):
+        ids = [obj.pk for obj in objs if obj.pk not in self.closed_segments]
+        if not ids:
+            return
+
+        for activity_id in ids:
+            self.closed_segments[activity_id] = set()
+
+        for activity_id, segment_id in Activity.segments.through.objects.filter(
+            activity_id__in=ids, segment__closed=True
+        ).values_list('activity_id', 'segment_id'):
+            self.closed_segments[activity_id].add(segment_id)
+
+    def get_closed_segments(self, obj):
+        if obj.pk not in self.closed_segments:
+            self.prepare_objects(None, [obj])
+
+        return self.closed_segments[obj.pk]
+
+    def get_user_segments(self, user):
+        if not hasattr(self, '_user_segments'):
+            self._user_segments = set(
+                user.segments.filter(closed=True).values_list('pk', flat=True)
+            )
+
+        return self._user_segments
+
     def has_object_action_permission(self, action, user, obj):
-        activity_segments = obj.segments.filter(closed=True)
+        activity_segments = self.get_closed_segments(obj)
         if activity_segments:
             if not user.is_authenticated:
                 return False
             elif user.is_staff:
                 return True
-            elif any(
-                    segment in activity_segments for segment in user.segments.filter(closed=True)
-            ):
+            elif activity_segments & self.get_user_segments(user):
                 return True
             else:
                 return False
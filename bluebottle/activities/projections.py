@@ -0,0 +1,294 @@
+import hashlib
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, Q
+from django.urls import reverse
+from moneyed import Money
+from rest_framework_json_api.utils import format_field_names
+
+from bluebottle.activities.models import Activity
+from bluebottle.activities.serializers import ActivityImageSerializer, ActivityListSerializer
+from bluebottle.clients import properties
+from bluebottle.collect.models import CollectActivity
+from bluebottle.deeds.models import Deed
+from bluebottle.funding.models import Funding, FundingTotal
+from bluebottle.time_based.models import DateActivity, DateActivitySlot, PeriodActivity
+from bluebottle.utils.exchange_rates import convert
+
+
+class ActivityListProjection(object):
+    """
+    Read-only projection of activities for the anonymous activity list.
+
+    Only the columns the list renders are fetched with `values()`, and the JSON:API
+    resources are assembled from the resulting dicts. No model instances, state machines,
+    permissions, transitions or matching properties are involved.
+
+    Funding amounts are read from the stored totals, and the slots of date activities are
+    summarized as `slot_count` and `is_online`, each with a single grouped query per page.
+    """
+
+    fields = (
+        'id', 'polymorphic_ctype_id', 'slug', 'title', 'status', 'highlight',
+        'created', 'updated',
+        'initiative_id', 'initiative__title', 'initiative__slug',
+        'initiative__theme_id', 'initiative__theme__slug',
+        'initiative__location_id', 'initiative__location__name',
+        'image_id', 'image__file',
+    )
+
+    location_fields = (
+        'location_id', 'location__locality', 'location__formatted_address', 'location__position',
+    )
+
+    type_fields = {
+        Funding: (
+            'deadline', 'duration', 'target', 'target_currency',
+            'amount_matching', 'amount_matching_currency',
+        ),
+        Deed: ('start', 'end'),
+        CollectActivity: ('start', 'end') + location_fields,
+        DateActivity: ('capacity', 'registration_deadline'),
+        PeriodActivity: (
+            'capacity', 'registration_deadline', 'start', 'deadline', 'is_online',
+        ) + location_fields,
+    }
+
+    money_fields = ('target', 'amount_matching')
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    @classmethod
+    def get_queryset(cls):
+        return Activity.objects.values(*cls.fields)
+
+    @property
+    def resource_names(self):
+        return dict(
+            (serializer.Meta.model, serializer.JSONAPIMeta.resource_name)
+            for serializer in ActivityListSerializer.polymorphic_serializers
+        )
+
+    def get_money(self, amount, currency):
+        if amount is None:
+            return None
+
+        return {'amount': amount, 'currency': str(currency)}
+
+    def get_type_attributes(self, models):
+        """
+        The type specific attributes, with one query per activity type on the page
+        """
+        attributes = {}
+        for model, ids in models.items():
+            fields = self.type_fields.get(model, ())
+            if not fields:
+                continue
+
+            for values in model.objects.filter(pk__in=ids).values('pk', *fields):
+                pk = values.pop('pk')
+                for field in self.money_fields:
+                    if field in values:
+                        values[field] = self.get_money(
+                            values[field], values.pop('{}_currency'.format(field))
+                        )
+
+                attributes[pk] = values
+
+        if Funding in models:
+            self.add_funding_amounts(models[Funding], attributes)
+
+        if DateActivity in models:
+            self.add_slot_info(models[DateActivity], attributes)
+
+        return attributes
+
+    def add_funding_amounts(self, ids, attributes):
+        """
+        Add the amounts donated and raised, converted to the target currency like
+        `Funding.amount_donated` and `Funding.amount_raised`
+        """
+        totals = defaultdict(list)
+        for activity_id, currency, amount in FundingTotal.objects.filter(
+            activity_id__in=ids
+        ).values_list('activity_id', 'currency', 'amount'):
+            totals[activity_id].append(Money(amount, currency))
+
+        for pk in ids:
+            values = attributes[pk]
+            currency = values['target']['currency'] if values['target'] else properties.DEFAULT_CURRENCY
+
+            donated = sum(
+                convert(amount, currency) for amount in totals[pk]
+            ) or Money(0, currency)
+
+            raised = donated
+            matching = values['amount_matching']
+            if matching and matching['amount']:
+                raised += convert(Money(matching['amount'], matching['currency']), currency)
+
+            values['amount_donated'] = self.get_money(donated.amount, donated.currency)
+            values['amount_raised'] = self.get_money(raised.amount, raised.currency)
+
+    def add_slot_info(self, ids, attributes):
+        """
+        Add the number of slots, and whether all of them are online, like the
+        `location_info` of the date activity serializer
+        """
+        for pk in ids:
+            attributes[pk].update({'slot_count': 0, 'is_online': False})
+
+        slots = DateActivitySlot.objects.filter(
+            activity_id__in=ids
+        ).exclude(
+            status__in=['draft', 'cancelled']
+        ).order_by().values('activity_id').annotate(
+            total=Count('id'), online=Count('id', filter=Q(is_online=True))
+        )
+
+        for slot in slots:
+            attributes[slot['activity_id']].update({
+                'slot_count': slot['total'],
+                'is_online': slot['total'] == slot['online'],
+            })
+
+    def get_location(self, values):
+        position = values.pop('location__position')
+        return {
+            'type': 'geolocations',
+            'id': str(values['location_id']),
+            'attributes': format_field_names({
+                'locality': values.pop('location__locality'),
+                'formatted_address': values.pop('location__formatted_address'),
+                'position': {
+                    'latitude': position.coords[1],
+                    'longitude': position.coords[0],
+                } if position else None,
+            }),
+        }
+
+    def get_image(self, row):
+        hash = hashlib.md5(row['image__file'].encode('utf-8')).hexdigest()
+        return {
+            'type': 'images',
+            'id': str(row['image_id']),
+            'attributes': {
+                'links': dict(
+                    (
+                        key,
+                        reverse(
+                            ActivityImageSerializer.content_view_name, args=(row['id'], size, )
+                        ) + '?_={}'.format(hash)
+                    ) for key, size in ActivityImageSerializer.sizes.items()
+                )
+            },
+        }
+
+    def get_initiative(self, row):
+        relationships = {
+            'theme': {'data': None},
+            'location': {'data': None},
+        }
+        if row['initiative__theme_id']:
+            relationships['theme']['data'] = {
+                'type': 'themes', 'id': str(row['initiative__theme_id'])
+            }
+        if row['initiative__location_id']:
+            relationships['location']['data'] = {
+                'type': 'locations', 'id': str(row['initiative__location_id'])
+            }
+
+        return {
+            'type': 'initiatives',
+            'id': str(row['initiative_id']),
+            'attributes': {
+                'title': row['initiative__title'],
+                'slug': row['initiative__slug'],
+            },
+            'relationships': relationships,
+        }
+
+    def get_theme(self, row):
+        return {
+            'type': 'themes',
+            'id': str(row['initiative__theme_id']),
+            'attributes': {
+                'slug': row['initiative__theme__slug'],
+            },
+        }
+
+    def get_office(self, row):
+        return {
+            'type': 'locations',
+            'id': str(row['initiative__location_id']),
+            'attributes': {
+                'name': row['initiative__location__name'],
+            },
+        }
+
+    @property
+    def data(self):
+        """
+        A tuple of the resources and the included resources
+        """
+        resource_names = self.resource_names
+        models = defaultdict(list)
+        for row in self.rows:
+            row['model'] = ContentType.objects.get_for_id(row['polymorphic_ctype_id']).model_class()
+            models[row['model']].append(row['id'])
+
+        type_attributes = self.get_type_attributes(models)
+
+        resources = []
+        included = {}
+        for row in self.rows:
+            attributes = {
+                'slug': row['slug'],
+                'title': row['title'],
+                'status': row['status'],
+                'highlight': row['highlight'],
+            }
+            attributes.update(type_attributes.get(row['id'], {}))
+
+            relationships = {
+                'initiative': {'data': {'type': 'initiatives', 'id': str(row['initiative_id'])}},
+                'image': {'data': None},
+            }
+            included[('initiatives', row['initiative_id'])] = self.get_initiative(row)
+
+            if row['initiative__theme_id']:
+                included[('themes', row['initiative__theme_id'])] = self.get_theme(row)
+
+            if row['initiative__location_id']:
+                included[('locations', row['initiative__location_id'])] = self.get_office(row)
+
+            if 'location_id' in attributes:
+                relationships['location'] = {'data': None}
+                if attributes['location_id']:
+                    location = self.get_location(attributes)
+                    relationships['location']['data'] = {
+                        'type': 'geolocations', 'id': location['id']
+                    }
+                    included[('geolocations', attributes['location_id'])] = location
+
+                for field in self.location_fields:
+                    attributes.pop(field, None)
+
+            if row['image_id']:
+                relationships['image']['data'] = {'type': 'images', 'id': str(row['image_id'])}
+                included[('images', row['image_id'])] = self.get_image(row)
+
+            resources.append({
+                'type': resource_names[row['model']],
+                'id': str(row['id']),
+                'attributes': format_field_names(attributes),
+                'relationships': relationships,
+                'meta': {
+                    'created': row['created'],
+                    'updated': row['updated'],
+                },
+            })
+
+        return resources, list(included.values())
@@ -0,0 +1,55 @@
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from bluebottle.activities.cache import invalidate_stats
+from bluebottle.activities.models import Activity, Contribution
+
+
+def get_amount(value):
+    # Money values are loaded from the database as their plain amount
+    return getattr(value, 'amount', value)
+
+
+def invalidate_contribution_stats(contribution):
+    activity = Activity.objects.filter(
+        contributors=contribution.contributor_id
+    ).values_list('pk', 'initiative_id').first()
+
+    if activity:
+        activity_id, initiative_id = activity
+        invalidate_stats('initiative', [initiative_id])
+        invalidate_stats(
+            'segment',
+            Activity.segments.through.objects.filter(
+                activity_id=activity_id
+            ).values_list('segment_id', flat=True)
+        )
+
+
+@receiver(post_save)
+def invalidate_stats_on_save(sender, instance, created, **kwargs):
+    if isinstance(instance, Contribution):
+        if created:
+            changed = instance.status == 'succeeded'
+        else:
+            previous = instance._initial_values.get('status')
+            changed = previous != instance.status and 'succeeded' in (previous, instance.status)
+
+            if not changed and instance.status == 'succeeded' and hasattr(instance, 'value'):
+                changed = get_amount(instance._initial_values.get('value')) != get_amount(instance.value)
+
+        if changed:
+            invalidate_contribution_stats(instance)
+
+
+@receiver(post_delete)
+def invalidate_stats_on_delete(sender, instance, **kwargs):
+    if isinstance(instance, Contribution) and instance.status == 'succeeded':
+        invalidate_contribution_stats(instance)
+
+
+@receiver(m2m_changed)
+def invalidate_segment_stats(sender, instance, action, pk_set, **kwargs):
+    # Segments might not be loaded yet when this module is imported, so the sender is checked here
+    if sender is Activity.segments.through and action in ('post_add', 'post_remove'):
+        invalidate_stats('segment', pk_set if isinstance(instance, Activity) else [instance.pk])
@@ -1,24 +1,29 @@
 import logging
+from itertools import chain
 
 from celery.schedules import crontab
 from celery.task import periodic_task
+from django.core.cache import cache
+from django.db import connection
 
 from bluebottle.clients.models import Client
 from bluebottle.clients.utils import LocalTenant
 
+from elasticsearch_dsl import MultiSearch
 from elasticsearch_dsl.query import Nested, Q, FunctionScore, ConstantScore, MatchAll
 
 from bluebottle.initiatives.models import InitiativePlatformSettings
 from bluebottle.activities.documents import activity
-from bluebottle.activities.models import Activity
+from bluebottle.activities.models import Activity, Contributor
 from bluebottle.activities.messages import MatchingActivitiesNotification
 from bluebottle.members.models import Member
+from bluebottle.notifications.messages import bulk_send
 
 
 logger = logging.getLogger('bluebottle')
 
 
-def get_matching_activities(user):
+def get_matching_search(user):
     search = activity.search().filter(
         Q('terms', status=['open', 'running']) &
         Q('terms', type=['dateactivity', 'periodactivity'])
@@ -47,7 +52,7 @@ def get_matching_activities(user):
                 query=Q(
                     'terms',
                     expertise__id=[
-                        skill.pk for skill in user.skills.all()
+                        skill.pk for skill in skills
                     ]
                 )
             )
@@ -77,29 +82,117 @@ def get_matching_activities(user):
             )
         )
 
-    result = search.query(
+    return search.query(
         FunctionScore(
             score_mode='sum',
             query=query
         )
-    ).extra(explain=True).execute()
+    )
+
+
+def get_matches(result):
+    """
+    Split a search result in the ids of matching and partially matching activities
+    """
+    matched = [int(hit.meta.id) for hit in result if hit.meta.score > 2]
+    partially_matched = [int(hit.meta.id) for hit in result if hit.meta.score == 2]
+    return matched, partially_matched
+
+
+def get_matching_activities(user):
+    return get_matching_activities_for_users([user])[user.pk]
 
-    matched = [activity for activity in result if activity.meta.score > 2]
-    activities = list(
-        Activity.objects.filter(
-            pk__in=[int(match.meta.id) for match in matched],
-        ).exclude(contributors__user=user)
+
+def get_matching_activities_for_users(users):
+    """
+    Find matching activities for a list of users.
+
+    All searches are sent to elasticsearch in a single multi search, the activities are loaded
+    from the database once and already joined activities are excluded with a single query.
+    Returns a dict mapping user ids to a list of activities.
+    """
+    users = list(users)
+    if not users:
+        return {}
+
+    search = MultiSearch()
+    for user in users:
+        search = search.add(get_matching_search(user))
+
+    matches = dict(
+        (user.pk, get_matches(result)) for user, result in zip(users, search.execute())
     )
 
-    if len(activities) < 3:
-        partially_matched = [activity for activity in result if activity.meta.score == 2]
-        activities += list(
-            Activity.objects.filter(
-                pk__in=[int(match.meta.id) for match in partially_matched],
-            ).exclude(contributors__user=user)
+    ids = set(
+        chain.from_iterable(matched + partial for matched, partial in matches.values())
+    )
+    activities = list(Activity.objects.filter(pk__in=ids)) if ids else []
+    joined = set(
+        Contributor.objects.filter(
+            user__in=users, activity_id__in=ids
+        ).values_list('user_id', 'activity_id')
+    ) if ids else set()
+
+    def get_activities(user, matched_ids):
+        return [
+            activity for activity in activities
+            if activity.pk in matched_ids and (user.pk, activity.pk) not in joined
+        ]
+
+    result = {}
+    for user in users:
+        matched, partially_matched = matches[user.pk]
+        result[user.pk] = get_activities(user, set(matched))
+
+        if len(result[user.pk]) < 3:
+            result[user.pk] += get_activities(user, set(partially_matched))
+
+    return result
+
+
+def get_checkpoint_key():
+    return '{}.recommend_checkpoint'.format(connection.tenant.schema_name)
+
+
+RECOMMEND_CHUNK_SIZE = 250
+RECOMMEND_CHECKPOINT_TIMEOUT = 60 * 60 * 24 * 7
+
+
+def recommend_for_tenant():
+    """
+    Send matching activities to all subscribed members of the current tenant.
+
+    Members are processed in chunks, ordered by id. After every chunk the last processed id is stored
+    in the cache, so that a run that was interrupted resumes where it stopped.
+    """
+    checkpoint_key = get_checkpoint_key()
+    members = Member.objects.filter(subscribed=True).select_related(
+        'place', 'location'
+    ).prefetch_related(
+        'favourite_themes', 'skills'
+    ).order_by('pk')
+
+    while True:
+        checkpoint = cache.get(checkpoint_key)
+        if checkpoint:
+            chunk = list(members.filter(pk__gt=checkpoint)[:RECOMMEND_CHUNK_SIZE])
+        else:
+            chunk = list(members[:RECOMMEND_CHUNK_SIZE])
+
+        if not chunk:
+            break
+
+        recommendations = get_matching_activities_for_users(chunk)
+        bulk_send(
+            (
+                MatchingActivitiesNotification(user),
+                {'activities': recommendations[user.pk]}
+            )
+            for user in chunk if recommendations[user.pk]
         )
+        cache.set(checkpoint_key, chunk[-1].pk, RECOMMEND_CHECKPOINT_TIMEOUT)
 
-    return activities
+    cache.delete(checkpoint_key)
 
 
 @periodic_task(
@@ -112,14 +205,4 @@ def recommend():
         with LocalTenant(tenant, clear_tenant=True):
             settings = InitiativePlatformSettings.objects.get()
             if settings.enable_matching_emails:
-                for user in Member.objects.filter(subscribed=True):
-                    activities = get_matching_activities(user)
-
-                    if activities:
-                        notification = MatchingActivitiesNotification(user)
-                        try:
-                            notification.compose_and_send(
-                                activities=activities
-                            )
-                        except Exception as e:
-                            logger.error(e)
+                recommend_for_tenant()
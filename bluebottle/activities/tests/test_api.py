@@ -1,3 +1,4 @@
+import base64
 from builtins import str
 import json
 from datetime import timedelta, date
@@ -10,6 +11,7 @@ from django.test.utils import override_settings
 from django.urls import reverse
 from django.utils.timezone import now
 from django_elasticsearch_dsl.test import ESTestCase
+from moneyed import Money
 from rest_framework import status
 
 from bluebottle.files.tests.factories import ImageFactory
@@ -17,6 +19,7 @@ from bluebottle.files.tests.factories import ImageFactory
 from bluebottle.deeds.tests.factories import DeedFactory, DeedParticipantFactory
 from bluebottle.collect.tests.factories import CollectContributorFactory
 
+from bluebottle.funding.models import Funding, FundingTotal
 from bluebottle.funding.tests.factories import FundingFactory, DonorFactory
 from bluebottle.time_based.tests.factories import (
     DateActivityFactory, PeriodActivityFactory, DateParticipantFactory, PeriodParticipantFactory,
@@ -59,6 +62,51 @@ class ActivityListSearchAPITestCase(ESTestCase, BluebottleTestCase):
                 'images'
             )
 
+    def get_cursor_pages(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url, user=self.owner)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            data = response.json()
+            self.assertTrue(len(data['data']) <= 2)
+            self.assertFalse('count' in data['meta']['pagination'])
+
+            ids += [activity['id'] for activity in data['data']]
+            url = data['links']['next']
+
+        return ids
+
+    def test_cursor(self):
+        activities = DateActivityFactory.create_batch(5, status='open')
+
+        ids = self.get_cursor_pages(self.url + '?page[size]=2&page[cursor]=')
+
+        self.assertEqual(len(ids), 5)
+        self.assertEqual(set(ids), set(str(activity.pk) for activity in activities))
+
+    def test_cursor_same_sort_value(self):
+        # All activities have the same title, so only the `_id` tie breaker orders them
+        activities = DateActivityFactory.create_batch(5, status='open', title='Same title')
+
+        ids = self.get_cursor_pages(self.url + '?page[size]=2&page[cursor]=&sort=alphabetical')
+
+        self.assertEqual(len(ids), 5)
+        self.assertEqual(set(ids), set(str(activity.pk) for activity in activities))
+
+    def test_cursor_invalid(self):
+        DateActivityFactory.create_batch(3, status='open')
+
+        response = self.client.get(self.url + '?page[cursor]=invalid', user=self.owner)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        # A valid cursor, but not for this sort
+        cursor = base64.urlsafe_b64encode(json.dumps(['a']).encode('utf-8')).decode('ascii')
+        response = self.client.get(
+            self.url + '?sort=alphabetical&page[cursor]=' + cursor, user=self.owner
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_no_filter(self):
         succeeded = DateActivityFactory.create(
             owner=self.owner, status='succeeded'
@@ -1040,6 +1088,82 @@ class ActivityListSearchAPITestCase(ESTestCase, BluebottleTestCase):
         self.assertEqual(data['data'][3]['id'], str(second.pk))
         self.assertEqual(data['data'][4]['id'], str(first.pk))
 
+    def test_filter_distance(self):
+        self.owner.place = PlaceFactory.create(position=Point(20.0, 10.0))
+        self.owner.save()
+
+        near = PeriodActivityFactory.create(
+            status='open',
+            is_online=False,
+            location=GeolocationFactory.create(position=Point(20.1, 10.1))
+        )
+        far = PeriodActivityFactory.create(
+            status='open',
+            is_online=False,
+            location=GeolocationFactory.create(position=Point(25.0, 15.0))
+        )
+        PeriodActivityFactory.create(status='open', is_online=True, location=None)
+
+        response = self.client.get(
+            self.url + '?filter[distance]=50km',
+            user=self.owner
+        )
+        data = json.loads(response.content)
+        self.assertEqual(data['meta']['pagination']['count'], 1)
+        self.assertEqual(data['data'][0]['id'], str(near.pk))
+
+        response = self.client.get(
+            self.url + '?filter[distance]=50&filter[position]=15.0,25.0',
+            user=self.owner
+        )
+        data = json.loads(response.content)
+        self.assertEqual(data['meta']['pagination']['count'], 1)
+        self.assertEqual(data['data'][0]['id'], str(far.pk))
+
+        # Without a position the filter is ignored
+        response = self.client.get(self.url + '?filter[distance]=50km')
+        data = json.loads(response.content)
+        self.assertEqual(data['meta']['pagination']['count'], 3)
+
+    def test_sort_distance(self):
+        self.owner.location = LocationFactory.create(position=Point(20.0, 10.0))
+        self.owner.save()
+
+        online = PeriodActivityFactory.create(status='open', is_online=True, location=None)
+        far = PeriodActivityFactory.create(
+            status='open',
+            is_online=False,
+            location=GeolocationFactory.create(position=Point(25.0, 15.0))
+        )
+        near = DateActivityFactory.create(status='open', slots=[])
+        DateActivitySlotFactory.create(
+            activity=near,
+            is_online=False,
+            location=GeolocationFactory.create(position=Point(20.1, 10.1))
+        )
+        DateActivitySlotFactory.create(
+            activity=near,
+            is_online=False,
+            location=GeolocationFactory.create(position=Point(30.0, 20.0))
+        )
+
+        response = self.client.get(
+            self.url + '?sort=distance',
+            user=self.owner
+        )
+        data = json.loads(response.content)
+
+        self.assertEqual(
+            [activity['id'] for activity in data['data']],
+            [str(near.pk), str(far.pk), str(online.pk)]
+        )
+        self.assertEqual(
+            data['data'][0]['meta']['matching-properties']['location'], True
+        )
+        self.assertEqual(
+            data['data'][1]['meta']['matching-properties']['location'], False
+        )
+
     def test_sort_contribution_count(self):
 
         deadline = now() + timedelta(days=2)
@@ -1244,6 +1368,101 @@ class ActivityListSearchAPITestCase(ESTestCase, BluebottleTestCase):
         )
         self.assertEqual(len(response.json()['data']), 3)
 
+    def test_projection(self):
+        funding = FundingFactory.create(status='open', image=ImageFactory.create())
+        date_activity = DateActivityFactory.create(status='open', capacity=10)
+
+        response = self.client.get(self.url + '?projection=list&sort=alphabetical')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+
+        self.assertEqual(data['meta']['pagination']['count'], 2)
+        resources = dict((resource['id'], resource) for resource in data['data'])
+
+        funding_data = resources[str(funding.pk)]
+        self.assertEqual(funding_data['type'], 'activities/fundings')
+        self.assertEqual(funding_data['attributes']['title'], funding.title)
+        self.assertEqual(funding_data['attributes']['target']['currency'], 'EUR')
+        self.assertEqual(
+            funding_data['relationships']['image']['data'],
+            {'type': 'images', 'id': str(funding.image.pk)}
+        )
+        self.assertFalse('permissions' in funding_data['meta'])
+
+        date_data = resources[str(date_activity.pk)]
+        self.assertEqual(date_data['type'], 'activities/time-based/dates')
+        self.assertEqual(date_data['attributes']['capacity'], 10)
+        self.assertEqual(date_data['relationships']['image']['data'], None)
+
+        included = dict(
+            ((resource['type'], resource['id']), resource) for resource in data['included']
+        )
+        self.assertEqual(
+            included[('initiatives', str(funding.initiative.pk))]['attributes']['title'],
+            funding.initiative.title
+        )
+        self.assertTrue(
+            'large' in included[('images', str(funding.image.pk))]['attributes']['links']
+        )
+
+    def test_projection_related(self):
+        office = LocationFactory.create()
+        funding = FundingFactory.create(
+            status='open', initiative=InitiativeFactory.create(location=office)
+        )
+        Funding.objects.filter(pk=funding.pk).update(amount_matching=Money(50, 'EUR'))
+        FundingTotal.objects.create(activity=funding, currency='EUR', amount=100)
+
+        date_activity = DateActivityFactory.create(status='open')
+        date_activity.slots.update(status='open', is_online=True)
+        DateActivitySlotFactory.create(activity=date_activity, status='cancelled')
+
+        period_activity = PeriodActivityFactory.create(status='open')
+
+        response = self.client.get(self.url + '?projection=list')
+        data = response.json()
+        resources = dict((resource['id'], resource) for resource in data['data'])
+        included = dict(
+            ((resource['type'], resource['id']), resource) for resource in data['included']
+        )
+
+        funding_data = resources[str(funding.pk)]
+        self.assertEqual(float(funding_data['attributes']['amount-donated']['amount']), 100)
+        self.assertEqual(float(funding_data['attributes']['amount-raised']['amount']), 150)
+        self.assertEqual(funding_data['attributes']['amount-raised']['currency'], 'EUR')
+
+        initiative = included[('initiatives', str(funding.initiative.pk))]
+        self.assertEqual(
+            initiative['relationships']['location']['data'],
+            {'type': 'locations', 'id': str(office.pk)}
+        )
+        self.assertEqual(included[('locations', str(office.pk))]['attributes']['name'], office.name)
+        self.assertEqual(
+            included[('themes', str(funding.initiative.theme.pk))]['attributes']['slug'],
+            funding.initiative.theme.slug
+        )
+
+        date_data = resources[str(date_activity.pk)]
+        self.assertEqual(date_data['attributes']['slot-count'], 1)
+        self.assertTrue(date_data['attributes']['is-online'])
+
+        period_data = resources[str(period_activity.pk)]
+        self.assertEqual(
+            period_data['relationships']['location']['data'],
+            {'type': 'geolocations', 'id': str(period_activity.location.pk)}
+        )
+        self.assertFalse('location-id' in period_data['attributes'])
+        self.assertEqual(
+            included[('geolocations', str(period_activity.location.pk))]['attributes']['locality'],
+            period_activity.location.locality
+        )
+
+    def test_projection_authenticated(self):
+        DateActivityFactory.create(status='open')
+
+        response = self.client.get(self.url + '?projection=list', user=self.owner)
+        self.assertTrue('permissions' in response.json()['data'][0]['meta'])
+
 
 class ActivityRelatedImageAPITestCase(BluebottleTestCase):
     def setUp(self):
@@ -1412,6 +1631,32 @@ class ContributorListAPITestCase(BluebottleTestCase):
                 self.assertTrue('slug' in i['attributes'])
                 self.assertTrue('title' in i['attributes'])
 
+    def test_get_cursor(self):
+        ids = []
+        url = self.url + '?page[size]=4&page[cursor]='
+
+        while url:
+            response = self.client.get(url, user=self.user)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            data = response.json()
+            self.assertTrue(len(data['data']) <= 4)
+            self.assertFalse('count' in data['meta']['pagination'])
+
+            ids += [contributor['id'] for contributor in data['data']]
+            url = data['links']['next']
+
+        self.assertEqual(len(ids), 10)
+        self.assertEqual(len(set(ids)), 10)
+
+    def test_get_invalid_cursor(self):
+        response = self.client.get(
+            self.url + '?page[cursor]=invalid',
+            user=self.user
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_get_anonymous(self):
         response = self.client.get(
             self.url
@@ -0,0 +1,53 @@
+from django.contrib.auth.models import AnonymousUser
+
+from bluebottle.activities.permissions import ActivitySegmentPermission
+from bluebottle.segments.tests.factories import SegmentFactory
+from bluebottle.test.factory_models.accounts import BlueBottleUserFactory
+from bluebottle.test.utils import BluebottleTestCase
+from bluebottle.time_based.tests.factories import DateActivityFactory
+
+
+class ActivitySegmentPermissionTestCase(BluebottleTestCase):
+    def setUp(self):
+        super(ActivitySegmentPermissionTestCase, self).setUp()
+        self.closed_segment = SegmentFactory.create(closed=True)
+        self.other_closed_segment = SegmentFactory.create(closed=True)
+        self.open_segment = SegmentFactory.create()
+
+        self.without_segment = DateActivityFactory.create()
+
+        self.with_open_segment = DateActivityFactory.create()
+        self.with_open_segment.segments.add(self.open_segment)
+
+        self.with_closed_segment = DateActivityFactory.create()
+        self.with_closed_segment.segments.add(self.closed_segment)
+
+        self.with_other_closed_segment = DateActivityFactory.create()
+        self.with_other_closed_segment.segments.add(self.other_closed_segment)
+
+        self.activities = [
+            self.without_segment, self.with_open_segment,
+            self.with_closed_segment, self.with_other_closed_segment
+        ]
+
+        self.user = BlueBottleUserFactory.create()
+        self.user.segments.add(self.closed_segment)
+
+    def check(self, user):
+        permission = ActivitySegmentPermission()
+        with self.assertNumQueries(2 if user.is_authenticated and not user.is_staff else 1):
+            permission.prepare_objects(user, self.activities)
+            return [
+                permission.has_object_action_permission('GET', user, activity)
+                for activity in self.activities
+            ]
+
+    def test_anonymous(self):
+        self.assertEqual(self.check(AnonymousUser()), [True, True, False, False])
+
+    def test_user(self):
+        self.assertEqual(self.check(self.user), [True, True, True, False])
+
+    def test_staff(self):
+        staff = BlueBottleUserFactory.create(is_staff=True)
+        self.assertEqual(self.check(staff), [True, True, True, True])
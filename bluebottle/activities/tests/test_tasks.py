@@ -2,6 +2,8 @@ from django.test.utils import override_settings
 from django.test import tag
 from django.contrib.gis.geos import Point
 from django.core import mail
+from django.core.cache import cache
+from django.db import connection
 
 from django_elasticsearch_dsl.test import ESTestCase
 
@@ -276,3 +278,38 @@ class RecommendTaskTestCase(ESTestCase, BluebottleTestCase):
         recommend()
 
         self.assertEqual(len(mail.outbox), 0)
+
+    def test_multiple_users(self):
+        other = BlueBottleUserFactory.create(subscribed=True)
+        other.place = PlaceFactory.create(position=self.amsterdam)
+        other.favourite_themes.add(self.user.favourite_themes.first())
+        other.skills.add(self.user.skills.first())
+        other.save()
+
+        applied = self.non_matches[-2]
+        PeriodParticipantFactory.create(activity=self.matches[0], user=other)
+
+        recommend()
+
+        self.assertEqual(len(mail.outbox), 2)
+        bodies = dict((message.to[0], message.body) for message in mail.outbox)
+
+        for activity in self.matches:
+            self.assertTrue(activity.title in bodies[self.user.email])
+        self.assertFalse(applied.title in bodies[self.user.email])
+
+        self.assertFalse(self.matches[0].title in bodies[other.email])
+        self.assertTrue(applied.title in bodies[other.email])
+
+    def test_resume_from_checkpoint(self):
+        cache.set('{}.recommend_checkpoint'.format(connection.tenant.schema_name), self.user.pk)
+
+        recommend()
+
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertIsNone(
+            cache.get('{}.recommend_checkpoint'.format(connection.tenant.schema_name))
+        )
+
+        recommend()
+        self.assertEqual(len(mail.outbox), 1)
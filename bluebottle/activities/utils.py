@@ -1,7 +1,9 @@
-from bluebottle.collect.models import CollectContribution
+import math
+
 from django.conf import settings
 from builtins import object
 
+from django.contrib.contenttypes.models import ContentType
 from django.db.models import Count, Sum, Q
 from django.utils.translation import gettext_lazy as _
 from moneyed import Money
@@ -9,20 +11,50 @@ from rest_framework import serializers
 from rest_framework_json_api.relations import ResourceRelatedField
 from rest_framework_json_api.serializers import ModelSerializer
 
-from geopy.distance import distance, lonlat
-
-from bluebottle.activities.models import Activity, Contributor, Contribution, Organizer, EffortContribution
+from bluebottle.activities.cache import get_stats
+from bluebottle.activities.models import Activity, Contributor, Contribution, Organizer
 from bluebottle.clients import properties
-from bluebottle.funding.models import MoneyContribution
 from bluebottle.impact.models import ImpactGoal
 from bluebottle.members.models import Member
 from bluebottle.fsm.serializers import AvailableTransitionsField
-from bluebottle.time_based.models import TimeContribution
 from bluebottle.utils.exchange_rates import convert
 from bluebottle.utils.fields import FSMField, ValidationErrorsField, RequiredErrorsField
 
 from bluebottle.utils.serializers import ResourcePermissionField, AnonymizedResourceRelatedField
 
+# Mean earth radius in km
+EARTH_RADIUS = 6371.0088
+
+
+def get_user_location(request):
+    """
+    The office or place of the user, resolved once per request
+    """
+    if not hasattr(request, '_matching_location'):
+        user = request.user
+        request._matching_location = (user.location or user.place) if user.is_authenticated else None
+
+    return request._matching_location
+
+
+def get_origin(position):
+    latitude = math.radians(position.y)
+    return latitude, math.radians(position.x), math.cos(latitude)
+
+
+def get_distance(origin, position):
+    """
+    The great-circle distance in km from `origin` (see `get_origin`) to a (lon, lat) tuple
+    """
+    latitude, longitude, cos_latitude = origin
+    other_latitude, other_longitude = math.radians(position[1]), math.radians(position[0])
+
+    a = (
+        math.sin((other_latitude - latitude) / 2) ** 2 +
+        cos_latitude * math.cos(other_latitude) * math.sin((other_longitude - longitude) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(min(1, math.sqrt(a)))
+
 
 class MatchingPropertiesField(serializers.ReadOnlyField):
     def __init__(self, **kwargs):
@@ -44,7 +76,9 @@ class MatchingPropertiesField(serializers.ReadOnlyField):
                 self.context['themes'] = user.favourite_themes.all()
 
             if 'location' not in self.context:
-                self.context['location'] = user.location or user.place
+                self.context['location'] = get_user_location(self.context['request'])
+                if self.context['location'] and self.context['location'].position:
+                    self.context['origin'] = get_origin(self.context['location'].position)
 
             if self.context['skills']:
                 matching['skill'] = False
@@ -88,15 +122,11 @@ class MatchingPropertiesField(serializers.ReadOnlyField):
                     except AttributeError:
                         pass
 
-                if positions and self.context['location'].position:
-                    dist = min(
-                        distance(
-                            lonlat(*pos),
-                            lonlat(*self.context['location'].position.tuple)
-                        ) for pos in positions
-                    )
-
-                    if dist.km < settings.MATCHING_DISTANCE:
+                if positions and 'origin' in self.context:
+                    if any(
+                        get_distance(self.context['origin'], position) < settings.MATCHING_DISTANCE
+                        for position in positions
+                    ):
                         matching['location'] = True
 
         return matching
@@ -367,96 +397,86 @@ class BaseContributionSerializer(ModelSerializer):
 
 
 def get_stats_for_activities(activities):
+    """
+    Impact stats for `activities`.
 
+    Everything is aggregated over the succeeded contributions, with a filter per
+    contribution type: one query for the counts and one for the totals per currency
+    and per collect type.
+    """
     ids = activities.values_list('id', flat=True)
 
     default_currency = properties.DEFAULT_CURRENCY
 
-    effort = EffortContribution.objects.filter(
-        contribution_type='deed',
-        status='succeeded',
-        contributor__activity__id__in=ids
-    ).aggregate(
-        count=Count('id', distinct=True),
-        activities=Count('contributor__activity', distinct=True)
-    )
-
-    time = TimeContribution.objects.filter(
+    contributions = Contribution.objects.filter(
         status='succeeded',
         contributor__activity__id__in=ids
-    ).aggregate(
-        count=Count('id', distinct=True),
-        activities=Count('contributor__activity', distinct=True),
-        value=Sum('value')
-    )
-
-    money = MoneyContribution.objects.filter(
-        status='succeeded',
-        contributor__activity__id__in=ids
-    ).aggregate(
-        count=Count('id', distinct=True),
-        activities=Count('contributor__activity', distinct=True)
-    )
+    ).order_by()
 
-    collect = CollectContribution.objects.filter(
-        status='succeeded',
-        contributor__user__isnull=False,
-        contributor__activity__id__in=ids
-    ).aggregate(
-        count=Count('id', distinct=True),
-        activities=Count('contributor__activity', distinct=True)
+    effort = Q(effortcontribution__contribution_type='deed')
+    time = Q(timecontribution__isnull=False)
+    money = Q(moneycontribution__isnull=False)
+    collect = Q(collectcontribution__isnull=False)
+    anonymous = Q(contributor__user__isnull=True)
+
+    organizer_type = ContentType.objects.get_for_model(Organizer)
+
+    totals = contributions.aggregate(
+        effort=Count('id', filter=effort),
+        effort_activities=Count('contributor__activity', distinct=True, filter=effort),
+        time_activities=Count('contributor__activity', distinct=True, filter=time),
+        money_activities=Count('contributor__activity', distinct=True, filter=money),
+        collect_activities=Count('contributor__activity', distinct=True, filter=collect & ~anonymous),
+        hours=Sum('timecontribution__value'),
+        contributors=Count(
+            'contributor__user', distinct=True,
+            filter=~Q(contributor__polymorphic_ctype=organizer_type)
+        ),
+        anonymous_donations=Count('id', filter=money & anonymous),
     )
 
-    amounts = MoneyContribution.objects.filter(
-        status='succeeded',
-        contributor__activity__id__in=ids
-    ).values(
-        'value_currency'
+    amounts = contributions.filter(money | collect).values(
+        'moneycontribution__value_currency', 'collectcontribution__type'
     ).annotate(
-        amount=Sum('value')
-    ).order_by()
-
-    contributor_count = Contributor.objects.filter(
-        user__isnull=False,
-        activity__id__in=ids,
-        contributions__status='succeeded',
-    ).exclude(
-        Q(instance_of=Organizer)
-    ).values('user_id').distinct().count()
-
-    anonymous_donations = MoneyContribution.objects.filter(
-        contributor__user__isnull=True,
-        status='succeeded',
-        contributor__activity__id__in=ids
-    ).count()
+        amount=Sum('moneycontribution__value'),
+        collected=Sum('collectcontribution__value')
+    )
 
-    contributor_count += anonymous_donations
+    amount = 0
+    collected = {}
+    for row in amounts:
+        if row['moneycontribution__value_currency']:
+            if row['amount']:
+                amount += convert(
+                    Money(row['amount'], row['moneycontribution__value_currency']),
+                    default_currency
+                ).amount
+        else:
+            collected[row['collectcontribution__type']] = row['collected']
 
-    collected = CollectContribution.objects.filter(
-        status='succeeded',
-        contributor__activity__id__in=ids
-    ).values(
-        'type_id'
-    ).annotate(
-        amount=Sum('value')
-    ).order_by()
-
-    amount = {
-        'amount': sum(
-            convert(
-                Money(c['amount'], c['value_currency']),
-                default_currency
-            ).amount
-            for c in amounts if c['amount']
+    return {
+        'hours': totals['hours'].total_seconds() / 3600 if totals['hours'] else 0,
+        'effort': totals['effort'],
+        'collected': collected,
+        'activities': sum(
+            totals['{}_activities'.format(name)] for name in ('effort', 'time', 'money', 'collect')
         ),
-        'currency': default_currency
+        'contributors': totals['contributors'] + totals['anonymous_donations'],
+        'amount': {
+            'amount': amount,
+            'currency': default_currency
+        }
     }
 
-    return {
-        'hours': time['value'].total_seconds() / 3600 if time['value'] else 0,
-        'effort': effort['count'],
-        'collected': dict((stat['type_id'], stat['amount']) for stat in collected),
-        'activities': sum(stat['activities'] for stat in [effort, time, money, collect]),
-        'contributors': contributor_count,
-        'amount': amount
-    }
+
+def get_cached_stats_for_activities(instance, activities):
+    """
+    `get_stats_for_activities`, cached per `instance` (an initiative or a segment).
+
+    The cache is invalidated when a contribution of one of the activities succeeds or stops
+    being succeeded, see `bluebottle.activities.signals`.
+    """
+    return get_stats(
+        instance._meta.model_name, instance.pk,
+        lambda: get_stats_for_activities(activities)
+    )
@@ -4,8 +4,9 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework_json_api.views import AutoPrefetchMixin
 
 from bluebottle.activities.filters import ActivitySearchFilter
-from bluebottle.activities.models import Activity, Contributor
+from bluebottle.activities.models import Activity, Contributor, Contribution
 from bluebottle.activities.permissions import ActivityOwnerPermission
+from bluebottle.activities.projections import ActivityListProjection
 from bluebottle.activities.serializers import (
     ActivitySerializer,
     ActivityTransitionSerializer,
@@ -13,19 +14,29 @@ from bluebottle.activities.serializers import (
     ActivityListSerializer,
     ContributorListSerializer
 )
-from bluebottle.files.models import RelatedImage
+from bluebottle.files.models import File, RelatedImage
 from bluebottle.files.views import ImageContentView
-from bluebottle.collect.models import CollectContributor
-from bluebottle.funding.models import Donor
+from bluebottle.collect.models import CollectContributor, CollectType
+from bluebottle.funding.models import (
+    BankAccount, BudgetLine, Donor, FundingTotal, PaymentProvider, PayoutAccount, Reward
+)
 from bluebottle.deeds.models import DeedParticipant
-from bluebottle.time_based.models import DateParticipant, PeriodParticipant
+from bluebottle.geo.models import Geolocation, Location
+from bluebottle.impact.models import ImpactGoal, ImpactType
+from bluebottle.initiatives.models import Initiative, Theme
+from bluebottle.members.models import Member
+from bluebottle.organizations.models import Organization
+from bluebottle.segments.models import Segment
+from bluebottle.time_based.models import (
+    ActivitySlot, DateParticipant, PeriodParticipant, SlotParticipant, Skill
+)
 from bluebottle.transitions.views import TransitionList
 from bluebottle.utils.permissions import (
     OneOf, ResourcePermission
 )
 from bluebottle.utils.views import (
     ListAPIView, JsonApiViewMixin, RetrieveUpdateDestroyAPIView,
-    CreateAPIView
+    CreateAPIView, CachedResponseMixin, JsonApiCursorPagination
 )
 
 
@@ -43,6 +54,7 @@ class ActivityList(JsonApiViewMixin, ListAPIView):
     ).prefetch_related('initiative__activity_managers')
     serializer_class = ActivityListSerializer
     model = Activity
+    pagination_class = JsonApiCursorPagination
 
     filter_backends = (
         ActivitySearchFilter,
@@ -59,13 +71,56 @@ class ActivityList(JsonApiViewMixin, ListAPIView):
         'owner': ['owner'],
     }
 
+    projection_class = ActivityListProjection
+
+    @property
+    def use_projection(self):
+        # Anonymous users can ask for a compact list, without permissions and other
+        # user specific fields: `?projection=list`
+        return (
+            self.request.query_params.get('projection') == 'list' and
+            not self.request.user.is_authenticated
+        )
+
+    def get_queryset(self):
+        if self.use_projection:
+            return self.projection_class.get_queryset()
+
+        return super(ActivityList, self).get_queryset()
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_projection:
+            return super(ActivityList, self).list(request, *args, **kwargs)
 
-class ActivityDetail(JsonApiViewMixin, AutoPrefetchMixin, RetrieveUpdateDestroyAPIView):
+        rows = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        data, included = self.projection_class(rows).data
+
+        # The document is complete, so the renderer should not build it from a serializer
+        self.resource_name = False
+        response = self.get_paginated_response(data)
+        response.data = {
+            'data': response.data['results'],
+            'included': included,
+            'links': response.data['links'],
+            'meta': response.data['meta'],
+        }
+        return response
+
+
+class ActivityDetail(CachedResponseMixin, JsonApiViewMixin, AutoPrefetchMixin, RetrieveUpdateDestroyAPIView):
     queryset = Activity.objects.all()
     serializer_class = ActivitySerializer
     model = Activity
     lookup_field = 'pk'
 
+    # Everything the activity serializers render, including the funding and collect details
+    cache_models = (
+        Activity, Contributor, Contribution, ActivitySlot, SlotParticipant, Initiative, Segment,
+        ImpactGoal, ImpactType, Geolocation, Location, Member, File, RelatedImage, Theme,
+        Organization, Skill, CollectType, FundingTotal, Reward, BudgetLine, PayoutAccount,
+        BankAccount, PaymentProvider,
+    )
+
     permission_classes = (
         OneOf(ResourcePermission, ActivityOwnerPermission),
     )
@@ -78,6 +133,11 @@ class ActivityDetail(JsonApiViewMixin, AutoPrefetchMixin, RetrieveUpdateDestroyA
     }
 
 
+class ContributorPagination(JsonApiCursorPagination):
+    # All contributions are returned, unless the client asks for a cursor
+    paginate_without_cursor = False
+
+
 class ContributorList(JsonApiViewMixin, ListAPIView):
     model = Contributor
 
@@ -104,7 +164,8 @@ class ContributorList(JsonApiViewMixin, ListAPIView):
 
     serializer_class = ContributorListSerializer
 
-    pagination_class = None
+    pagination_class = ContributorPagination
+    cursor_ordering = ('-created', '-id')
 
     permission_classes = (IsAuthenticated, )
 
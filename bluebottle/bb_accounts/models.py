@@ -409,6 +409,10 @@ def connect_to_segments(sender, instance, created, **kwargs):
 
     USER_MODEL = get_user_model()
     if isinstance(instance, USER_MODEL) and created and '@' in instance.email:
+        from bluebottle.members.models import UserSegment
+
         user_email_domain = instance.email.split('@')[1]
-        for segment in Segment.objects.filter(email_domains__contains=[user_email_domain]).all():
-            instance.segments.add(segment)
+        UserSegment.objects.bulk_create(
+            UserSegment(member=instance, segment=segment)
+            for segment in Segment.objects.filter(email_domains__contains=[user_email_domain])
+        )
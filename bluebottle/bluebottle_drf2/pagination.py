@@ -1,6 +1,149 @@
+import base64
+import json
+from collections.abc import Mapping
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class CursorPaginationMixin(object):
+    """
+    Keyset pagination, used when the request contains `cursor_query_param`.
+
+    The cursor holds the values of `cursor_ordering` for the last item on the page, and
+    the next page continues after those values. This needs no `COUNT(*)` and no `OFFSET`,
+    so deep pages are as cheap as the first one.
+
+    `cursor_ordering` (on the view or the pagination class) should be on indexed, non-null
+    columns, and end with a unique one. Without a cursor, the normal pagination is used,
+    unless `paginate_without_cursor` is False.
+    """
+    cursor_query_param = 'cursor'
+    cursor_ordering = ('-created', '-id', )
+    paginate_without_cursor = True
+
+    cursor = None
+    cursor_page = None
+    use_cursor_pagination = False
+
+    def use_cursor(self, request):
+        return self.cursor_query_param in request.query_params
+
+    def encode_value(self, value):
+        # Keep the microseconds, DjangoJSONEncoder would round them to milliseconds
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        return str(value)
+
+    def encode_cursor(self, values):
+        return base64.urlsafe_b64encode(
+            json.dumps(values, default=self.encode_value).encode('utf-8')
+        ).decode('ascii')
+
+    def decode_cursor(self, cursor):
+        try:
+            return json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound('Invalid cursor')
+
+    def get_cursor_ordering(self, view):
+        return getattr(view, 'cursor_ordering', self.cursor_ordering)
+
+    def get_cursor_page_size(self, request):
+        return self.get_page_size(request)
+
+    def get_keyset_filter(self, model, ordering, values):
+        if len(values) != len(ordering):
+            raise NotFound('Invalid cursor')
+
+        result = Q()
+        equal = Q()
+        for field, value in zip(ordering, values):
+            name = field.lstrip('-')
+            try:
+                value = model._meta.get_field(name).to_python(value)
+            except Exception:
+                raise NotFound('Invalid cursor')
+
+            lookup = '{}__lt' if field.startswith('-') else '{}__gt'
+            result |= equal & Q(**{lookup.format(name): value})
+            equal &= Q(**{name: value})
+
+        return result
+
+    def get_value(self, item, name):
+        # Rows of `values()` querysets are dicts
+        if isinstance(item, Mapping):
+            return item[name]
+
+        return getattr(item, name)
+
+    def paginate_cursor(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_cursor_page_size(request)
+
+        ordering = self.get_cursor_ordering(view)
+        queryset = queryset.order_by(*ordering)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            queryset = queryset.filter(
+                self.get_keyset_filter(queryset.model, ordering, self.decode_cursor(cursor))
+            )
+
+        results = list(queryset[:page_size + 1])
+        page = results[:page_size]
+
+        if len(results) > page_size:
+            self.cursor = self.encode_cursor([
+                self.get_value(page[-1], field.lstrip('-')) for field in ordering
+            ])
+        else:
+            self.cursor = None
+
+        self.cursor_page = page
+        return page
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.use_cursor_pagination = self.use_cursor(request)
+        if self.use_cursor_pagination:
+            return self.paginate_cursor(queryset, request, view)
+
+        if not self.paginate_without_cursor:
+            return None
+
+        return super(CursorPaginationMixin, self).paginate_queryset(queryset, request, view)
+
+    def get_cursor_link(self, cursor):
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, cursor
+        )
+
+    def get_next_cursor_link(self):
+        if self.cursor:
+            return self.get_cursor_link(self.cursor)
+
+    def get_cursor_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_cursor_link(),
+            'previous': None,
+            'results': data
+        })
+
+    def get_paginated_response(self, data):
+        if self.use_cursor_pagination:
+            return self.get_cursor_paginated_response(data)
+
+        return super(CursorPaginationMixin, self).get_paginated_response(data)
 
 
 class BluebottlePagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = 'page_size'
+
+
+class BluebottleCursorPagination(CursorPaginationMixin, BluebottlePagination):
+    pass
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from bluebottle.clients.models import Client
+from bluebottle.utils.cache import get_statistics
+
+
+class Command(BaseCommand):
+    help = 'Print the hits and misses of the API response cache for each tenant'
+
+    def handle(self, *args, **options):
+        for client in Client.objects.order_by('schema_name'):
+            statistics = get_statistics(client.schema_name)
+            total = statistics['hits'] + statistics['misses']
+
+            self.stdout.write(
+                '{}: {} hits, {} misses ({:.0%} hit rate)'.format(
+                    client.schema_name, statistics['hits'], statistics['misses'],
+                    float(statistics['hits']) / total if total else 0
+                )
+            )
@@ -0,0 +1,163 @@
+import random
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import connection
+from django.utils.translation import get_language
+
+from bluebottle.activities.models import Activity
+from bluebottle.cms.models import (
+    ActivitiesContent, HomepageStatisticsContent, ShareResultsContent, StatsContent,
+    SupporterTotalContent, WelcomeContent
+)
+
+# Pages are assembled from the cached blocks, so they should not be kept longer than the blocks.
+PAGE_TIMEOUT = 5 * 60
+
+CONTENT_TIMEOUT = 24 * 60 * 60
+
+# Statistics themselves are memoized for an hour, see `Statistics.timeout`
+STATISTICS_TIMEOUT = 60 * 60
+
+# Blocks that show a random selection are rotated every five minutes
+RANDOM_TIMEOUT = 5 * 60
+
+# (block classes, group, timeout, anonymous only)
+BLOCKS = (
+    (
+        (StatsContent, HomepageStatisticsContent, ShareResultsContent, SupporterTotalContent),
+        'statistics', STATISTICS_TIMEOUT, False
+    ),
+    ((ActivitiesContent, ), 'activities', RANDOM_TIMEOUT, True),
+    ((WelcomeContent, ), 'content', RANDOM_TIMEOUT, False),
+)
+
+
+def get_version_key(group):
+    return '{}.cms.{}_version'.format(connection.tenant.schema_name, group)
+
+
+def get_version(group):
+    version = cache.get(get_version_key(group))
+    if version is None:
+        version = uuid4().hex
+        cache.set(get_version_key(group), version, None)
+
+    return version
+
+
+def invalidate(*groups):
+    """
+    Invalidate all cached pages and blocks that depend on `groups`.
+    Groups are 'content', 'statistics' and 'activities'.
+    """
+    for group in groups:
+        cache.set(get_version_key(group), uuid4().hex, None)
+
+
+def get_block_settings(block):
+    for classes, group, timeout, anonymous_only in BLOCKS:
+        if isinstance(block, classes):
+            return group, timeout, anonymous_only
+
+    return 'content', CONTENT_TIMEOUT, False
+
+
+def is_anonymous(context):
+    request = context.get('request')
+    return not (request and request.user.is_authenticated)
+
+
+def get_cached_block(block, context, render):
+    """
+    Return the representation of a content block from the cache, or render and cache it.
+    Each type of block has its own timeout, and is invalidated when its group changes.
+    """
+    group, timeout, anonymous_only = get_block_settings(block)
+    anonymous = is_anonymous(context)
+
+    if anonymous_only and not anonymous:
+        return render()
+
+    key = '{}.cms.block.{}.{}.{}.{}.{}.{}'.format(
+        connection.tenant.schema_name,
+        get_version('content'),
+        get_version(group),
+        get_language(),
+        block.__class__.__name__,
+        block.pk,
+        'anonymous' if anonymous else 'authenticated'
+    )
+
+    data = cache.get(key)
+    if data is None:
+        data = render()
+        cache.set(key, data, timeout)
+
+    return data
+
+
+def get_cached_page(page, render):
+    """
+    Return the representation of a homepage or result page for anonymous users from the cache,
+    or render and cache it.
+    """
+    key = '{}.cms.page.{}.{}.{}.{}.{}.{}'.format(
+        connection.tenant.schema_name,
+        get_version('content'),
+        get_version('statistics'),
+        get_version('activities'),
+        get_language(),
+        page.__class__.__name__,
+        page.pk,
+    )
+
+    data = cache.get(key)
+    if data is None:
+        data = render()
+        cache.set(key, data, PAGE_TIMEOUT)
+
+    return data
+
+
+HIDDEN_STATUSES = (
+    'draft', 'needs_work', 'submitted', 'deleted', 'cancelled', 'rejected', 'expired',
+)
+
+
+def get_highlighted_activity_ids():
+    """
+    Return the ids of all highlighted activities that can be shown on the homepage.
+    The pool is refreshed when the 'activities' group is invalidated.
+    """
+    key = '{}.cms.highlighted_activities.{}'.format(
+        connection.tenant.schema_name, get_version('activities')
+    )
+
+    ids = cache.get(key)
+    if ids is None:
+        ids = list(
+            Activity.objects.filter(
+                highlight=True
+            ).exclude(
+                segments__closed=True
+            ).exclude(
+                status__in=HIDDEN_STATUSES
+            ).order_by().values_list('id', flat=True).distinct()
+        )
+        cache.set(key, ids, CONTENT_TIMEOUT)
+
+    return ids
+
+
+def get_highlighted_activities(count):
+    """
+    Return `count` random highlighted activities
+    """
+    ids = get_highlighted_activity_ids()
+    sample = random.sample(ids, min(count, len(ids)))
+
+    activities = dict(
+        (activity.pk, activity) for activity in Activity.objects.filter(pk__in=sample)
+    )
+    return [activities[pk] for pk in sample if pk in activities]
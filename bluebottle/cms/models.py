@@ -625,3 +625,6 @@ class SitePlatformSettings(TranslatableModel, BasePlatformSettings):
     class Meta:
         verbose_name_plural = _('site platform settings')
         verbose_name = _('site platform settings')
+
+
+from . import signals  # noqa
@@ -6,12 +6,12 @@ from fluent_contents.plugins.rawhtml.models import RawHtmlItem
 from fluent_contents.plugins.text.models import TextItem
 from rest_framework import serializers
 
-from bluebottle.activities.models import Activity
 from bluebottle.activities.serializers import ActivityListSerializer
 from bluebottle.bluebottle_drf2.serializers import (
     ImageSerializer, SorlImageField
 )
 from bluebottle.categories.serializers import CategorySerializer
+from bluebottle.cms.cache import get_cached_block, get_highlighted_activities
 from bluebottle.cms.models import (
     Stat, StatsContent, ResultPage, HomePage, QuotesContent, Quote,
     ShareResultsContent, ProjectsMapContent, SupporterTotalContent, CategoriesContent, StepsContent, LocationsContent,
@@ -193,17 +193,7 @@ class ActivitiesContentSerializer(serializers.ModelSerializer):
 
     def get_activities(self, obj):
         if obj.highlighted:
-            activities = Activity.objects.filter(
-                highlight=True
-            ).exclude(
-                segments__closed=True
-            ).exclude(
-                status__in=[
-                    'draft', 'needs_work', 'submitted',
-                    'deleted', 'cancelled', 'rejected',
-                    'expired',
-                ]
-            ).order_by('?')[0:4]
+            activities = get_highlighted_activities(4)
         else:
             activities = obj.activities
 
@@ -496,7 +486,13 @@ class BlockSerializer(serializers.Serializer):
         else:
             serializer = DefaultBlockSerializer
 
-        return serializer(obj, context=self.context).to_representation(obj)
+        def render():
+            return serializer(obj, context=self.context).to_representation(obj)
+
+        if self.context.get('cache_blocks'):
+            return get_cached_block(obj, self.context, render)
+
+        return render()
 
 
 class ResultPageSerializer(serializers.ModelSerializer):
@@ -0,0 +1,61 @@
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+from fluent_contents.models import ContentItem, Placeholder
+from parler.models import TranslatedFieldsModel
+
+from bluebottle.activities.models import Activity
+from bluebottle.categories.models import Category
+from bluebottle.cms.cache import invalidate
+from bluebottle.cms.models import (
+    HomePage, ResultPage, Stat, Quote, Slide, Step, Logo, ContentLink, Greeting,
+    ActivitiesContent, CategoriesContent, LocationsContent
+)
+from bluebottle.geo.models import Location
+from bluebottle.segments.models import Segment
+from bluebottle.slides.models import Slide as HomepageSlide
+from bluebottle.statistics.models import BaseStatistic
+
+CONTENT_MODELS = (
+    HomePage, ResultPage, Placeholder, ContentItem, Stat, Quote, Slide, Step, Logo,
+    ContentLink, Greeting, HomepageSlide, Category, Location
+)
+
+
+def get_groups(instance):
+    if isinstance(instance, TranslatedFieldsModel):
+        instance = instance.master
+
+    if isinstance(instance, Activity):
+        if instance.highlight or instance._initial_values.get('highlight'):
+            return ('activities', )
+    elif isinstance(instance, Segment):
+        return ('activities', )
+    elif isinstance(instance, (Stat, BaseStatistic)):
+        return ('content', 'statistics', )
+    elif isinstance(instance, CONTENT_MODELS):
+        return ('content', )
+
+    return ()
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_page_cache(sender, instance, **kwargs):
+    groups = get_groups(instance)
+    if groups:
+        invalidate(*groups)
+
+
+@receiver(m2m_changed, sender=ActivitiesContent.activities.through)
+@receiver(m2m_changed, sender=CategoriesContent.categories.through)
+@receiver(m2m_changed, sender=LocationsContent.locations.through)
+def invalidate_page_cache_relations(sender, instance, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate('content')
+
+
+@receiver(m2m_changed, sender=Activity.segments.through)
+def invalidate_highlighted_activities(sender, instance, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        if not isinstance(instance, Activity) or instance.highlight:
+            invalidate('activities')
@@ -16,6 +16,7 @@ from fluent_contents.plugins.text.models import TextItem
 from moneyed.classes import Money
 from rest_framework import status
 
+from bluebottle.cms.cache import get_highlighted_activity_ids
 from bluebottle.cms.models import (
     StatsContent, QuotesContent, ShareResultsContent, ProjectsMapContent,
     SupporterTotalContent, HomePage, SlidesContent, SitePlatformSettings,
@@ -24,6 +25,7 @@ from bluebottle.cms.models import (
 from bluebottle.contentplugins.models import PictureItem
 from bluebottle.time_based.tests.factories import DateActivityFactory
 from bluebottle.funding.tests.factories import FundingFactory, DonorFactory
+from bluebottle.segments.tests.factories import SegmentFactory
 from bluebottle.pages.models import DocumentItem, ImageTextItem, ActionItem, ColumnsItem
 from bluebottle.test.factory_models.accounts import BlueBottleUserFactory
 from bluebottle.test.factory_models.cms import (
@@ -275,6 +277,7 @@ class HomePageTestCase(BluebottleTestCase):
 
     def setUp(self):
         super(HomePageTestCase, self).setUp()
+        cache.clear()
         HomePage.objects.get(pk=1).delete()
         self.page = HomePageFactory(pk=1)
         self.placeholder = Placeholder.objects.create_for_object(self.page, slot='content')
@@ -454,6 +457,56 @@ class HomePageTestCase(BluebottleTestCase):
         self.assertEqual(block['preamble'], 'Hi')
         self.assertTrue(block['greeting'] in greetings)
 
+    def test_cached(self):
+        item = RawHtmlItem.objects.create_for_placeholder(self.placeholder, html='<p>Test content</p>')
+        self.client.get(self.url)
+
+        RawHtmlItem.objects.filter(pk=item.pk).update(html='<p>Changed</p>')
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['blocks'][0]['html'], '<p>Test content</p>')
+
+        item.html = '<p>Updated</p>'
+        item.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['blocks'][0]['html'], '<p>Updated</p>')
+
+    def test_cached_highlighted_activities(self):
+        ActivitiesContent.objects.create_for_placeholder(self.placeholder, highlighted=True)
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.data['blocks'][0]['activities']), 0)
+
+        DateActivityFactory.create(status='open', highlight=True)
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.data['blocks'][0]['activities']), 1)
+
+    def test_highlighted_activities_pool(self):
+        activities = DateActivityFactory.create_batch(3, status='open', highlight=True)
+        DateActivityFactory.create(status='draft', highlight=True)
+        DateActivityFactory.create(status='open', highlight=False)
+
+        self.assertEqual(
+            set(get_highlighted_activity_ids()),
+            set(activity.pk for activity in activities)
+        )
+
+        with self.assertNumQueries(0):
+            get_highlighted_activity_ids()
+
+        segment = SegmentFactory.create(closed=False)
+        activities[0].segments.add(segment)
+        segment.closed = True
+        segment.save()
+
+        self.assertEqual(
+            set(get_highlighted_activity_ids()),
+            set(activity.pk for activity in activities[1:])
+        )
+
+        activities[1].highlight = False
+        activities[1].save()
+
+        self.assertEqual(get_highlighted_activity_ids(), [activities[2].pk])
+
 
 class NewsItemTestCase(BluebottleTestCase):
     """
@@ -4,8 +4,10 @@ from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.http.response import Http404
 from pytz import timezone
+from rest_framework.response import Response
 
 from bluebottle.clients import properties
+from bluebottle.cms.cache import get_cached_page
 from bluebottle.cms.models import ResultPage, HomePage
 from bluebottle.cms.serializers import (
     ResultPageSerializer, HomePageSerializer, NewsItemSerializer,
@@ -17,7 +19,29 @@ from bluebottle.utils.utils import get_language_from_request
 from bluebottle.utils.views import RetrieveAPIView
 
 
-class ResultPageDetail(RetrieveAPIView):
+class CachedPageMixin(object):
+    """
+    Serve pages to anonymous users from the cache, and cache the separate blocks
+    for everyone.
+    """
+    def get_serializer_context(self):
+        context = super(CachedPageMixin, self).get_serializer_context()
+        context['cache_blocks'] = True
+        return context
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+
+        def render():
+            return self.get_serializer(instance).data
+
+        if request.user.is_authenticated:
+            return Response(render())
+
+        return Response(get_cached_page(instance, render))
+
+
+class ResultPageDetail(CachedPageMixin, RetrieveAPIView):
     queryset = ResultPage.objects.all()
     serializer_class = ResultPageSerializer
 
@@ -41,7 +65,7 @@ class ResultPageDetail(RetrieveAPIView):
         return context
 
 
-class HomePageDetail(RetrieveAPIView):
+class HomePageDetail(CachedPageMixin, RetrieveAPIView):
     queryset = HomePage.objects.all()
     serializer_class = HomePageSerializer
 
@@ -0,0 +1,98 @@
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from bluebottle.clients.models import Client
+from bluebottle.clients.utils import LocalTenant
+from bluebottle.fsm.state import TransitionNotPossible
+
+
+def full_scan(machine, automatic=True, **kwargs):
+    # Check every transition like `possible_transitions` did before the source index:
+    # the conditions run first and are not shared, then the automatic flag, source and permission
+    result = []
+    for transition in machine.transitions.values():
+        try:
+            transition.is_valid(machine)
+
+            if (not automatic and transition.automatic) or not transition.is_source(machine.state):
+                continue
+
+            transition.check_permission(machine, **kwargs)
+            result.append(transition)
+        except TransitionNotPossible:
+            pass
+
+    return result
+
+
+class Command(BaseCommand):
+    help = (
+        'Time `possible_transitions` for all registered state machines, '
+        'and compare it with checking every transition.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tenant', type=str, required=True,
+            help='The schema name of the tenant to run the benchmark on.'
+        )
+        parser.add_argument(
+            '--instances', type=int, default=100,
+            help='The number of instances per model to check.'
+        )
+        parser.add_argument(
+            '--manual', action='store_true', default=False,
+            help='Only look at the transitions that can be started manually, like the API does.'
+        )
+
+    def measure(self, machines, method, **kwargs):
+        with CaptureQueriesContext(connection) as queries:
+            start = time.time()
+            for machine in machines:
+                method(machine, **kwargs)
+            duration = time.time() - start
+
+        return duration, len(queries)
+
+    def benchmark(self, model, name, machine_class, count, **kwargs):
+        # Use the concrete model, so that polymorphic children use their own machine
+        instances = list(model.objects.order_by('-pk')[:count])
+        if not instances:
+            return
+
+        machines = [
+            getattr(instance, name) for instance in instances
+            if type(getattr(instance, name)) is machine_class
+        ]
+
+        indexed = self.measure(
+            machines, lambda machine, **kwargs: machine.possible_transitions(**kwargs), **kwargs
+        )
+        scanned = self.measure(machines, full_scan, **kwargs)
+
+        self.stdout.write(
+            '{}.{} ({} instances): indexed {:.3f}s, {} queries; full scan {:.3f}s, {} queries'.format(
+                model.__name__, name, len(machines),
+                indexed[0], indexed[1], scanned[0], scanned[1]
+            )
+        )
+
+    def handle(self, *args, **options):
+        try:
+            client = Client.objects.get(schema_name=options['tenant'])
+        except Client.DoesNotExist:
+            raise CommandError('Unknown tenant: {}'.format(options['tenant']))
+
+        kwargs = {'automatic': False} if options['manual'] else {}
+
+        with LocalTenant(client, clear_tenant=True):
+            for model in apps.get_models():
+                if model._meta.proxy or '_state_machines' not in model.__dict__:
+                    continue
+
+                for name, machine_class in model._state_machines.items():
+                    self.benchmark(model, name, machine_class, options['instances'], **kwargs)
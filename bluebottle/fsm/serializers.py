@@ -27,8 +27,7 @@ class AvailableTransitionsField(ReadOnlyField):
                 'target': transition.target.value,
                 'available': True,
             }
-            for transition in states.possible_transitions(user=user)
-            if not transition.automatic
+            for transition in states.possible_transitions(user=user, automatic=False)
         )
 
     def get_attribute(self, instance):
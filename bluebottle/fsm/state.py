@@ -48,29 +48,48 @@ class BaseTransition(object):
     def source_values(self):
         return [source.value for source in self.sources]
 
-    def is_valid(self, machine):
-        if not all(condition(machine) for condition in self.conditions):
-            raise TransitionNotPossible(
-                _('Conditions not met for transition')
-            )
-
-    def can_execute(self, machine, automatic=True, **kwargs):
-        self.is_valid(machine)
+    def is_valid(self, machine, condition_results=None):
+        """
+        Check the conditions of the transition.
+
+        `condition_results` can be used to share the results of conditions between transitions
+        """
+        for condition in self.conditions:
+            if condition_results is None:
+                valid = condition(machine)
+            else:
+                if condition not in condition_results:
+                    condition_results[condition] = condition(machine)
+                valid = condition_results[condition]
+
+            if not valid:
+                raise TransitionNotPossible(
+                    _('Conditions not met for transition')
+                )
+
+    def is_source(self, state):
+        return state in self.source_values or AllStates() in self.sources
+
+    def check_permission(self, machine, **kwargs):
+        pass
+
+    def can_execute(self, machine, automatic=True, condition_results=None, **kwargs):
+        # Check the cheap things first, conditions often need the database
         if not automatic and self.automatic:
             raise TransitionNotPossible(
                 _('Cannot transition from {} to {}').format(
                     machine.state, self.target)
             )
 
-        if not (
-            machine.state in self.source_values or
-            (AllStates() in self.sources)
-        ):
+        if not self.is_source(machine.state):
             raise TransitionNotPossible(
                 _('Cannot transition from {} to {}').format(
                     machine.state, self.target)
             )
 
+        self.check_permission(machine, **kwargs)
+        self.is_valid(machine, condition_results)
+
     def on_execute(self, machine):
         machine.state = self.target.value
 
@@ -105,16 +124,11 @@ class Transition(BaseTransition):
         self.permission = kwargs.get('permission')
         super(Transition, self).__init__(sources, target, *args, **kwargs)
 
-    def can_execute(self, machine, user=None, **kwargs):
-        result = super(Transition, self).can_execute(machine, **kwargs)
-
+    def check_permission(self, machine, user=None, **kwargs):
         if self.permission and user and not self.permission(machine, user):
             raise TransitionNotPossible(
                 _('You are not allowed to perform this transition')
             )
-            return result and (not user or self.permission(machine, user))
-        else:
-            return result
 
     def on_execute(self, machine, save=False, **kwargs):
         pre_state_transition.send(
@@ -207,24 +221,37 @@ class StateMachineMeta(type):
 
         result.transitions = transitions
 
+        # Index the transitions by source state, so that we only have to look at the
+        # transitions that can start from the current state.
+        ordered = [transitions[key] for key in sorted(transitions)]
+        result.any_state_transitions = [
+            transition for transition in ordered if AllStates() in transition.sources
+        ]
+        sources = set(
+            value for transition in ordered for value in transition.source_values
+        )
+        transitions_by_source = dict(
+            (value, [transition for transition in ordered if transition.is_source(value)])
+            for value in sources
+        )
+        result.transitions_by_source = transitions_by_source
+        result.initial_transitions = [
+            transition for transition in ordered if EmptyState() in transition.sources
+        ]
+
         return result
 
 
 class StateMachine(with_metaclass(StateMachineMeta, object)):
     @property
     def initial_transition(self):
-        initial_transitions = [
-            transition
-            for transition in list(self.transitions.values())
-            if EmptyState() in transition.sources
-        ]
-        if (len(initial_transitions)) > 1:
+        if (len(self.initial_transitions)) > 1:
             raise AssertionError(
                 'Found multiple transitions from empty state'
             )
 
-        if initial_transitions:
-            return initial_transitions[0]
+        if self.initial_transitions:
+            return self.initial_transitions[0]
 
     @property
     def current_state(self):
@@ -232,11 +259,23 @@ class StateMachine(with_metaclass(StateMachineMeta, object)):
             if state.value == self.state:
                 return state
 
+    def transitions_from(self, state, automatic=True):
+        """
+        All transitions that start from `state`. Pass `automatic=False` to only get the
+        transitions that can be started manually.
+        """
+        transitions = self.transitions_by_source.get(state, self.any_state_transitions)
+        if not automatic:
+            transitions = [transition for transition in transitions if not transition.automatic]
+
+        return transitions
+
     def possible_transitions(self, **kwargs):
         result = []
-        for transition in list(self.transitions.values()):
+        condition_results = {}
+        for transition in self.transitions_from(self.state, kwargs.get('automatic', True)):
             try:
-                transition.can_execute(self, **kwargs)
+                transition.can_execute(self, condition_results=condition_results, **kwargs)
                 result.append(transition)
             except TransitionNotPossible:
                 pass
@@ -0,0 +1,93 @@
+from bluebottle.fsm.state import (
+    AllStates, EmptyState, State, StateMachine, Transition, TransitionNotPossible
+)
+from bluebottle.test.utils import BluebottleTestCase
+
+
+class ExampleStateMachine(StateMachine):
+    calls = []
+
+    draft = State('draft', 'draft')
+    submitted = State('submitted', 'submitted')
+    closed = State('closed', 'closed')
+
+    def is_complete(self):
+        self.calls.append('is_complete')
+        return True
+
+    def is_not_complete(self):
+        self.calls.append('is_not_complete')
+        return False
+
+    def is_owner(self, user):
+        return user == 'owner'
+
+    initiate = Transition(EmptyState(), draft)
+
+    submit = Transition(
+        draft, submitted, name='Submit', automatic=False, conditions=[is_complete], permission=is_owner
+    )
+    auto_submit = Transition(draft, submitted, conditions=[is_complete])
+    force_submit = Transition(draft, submitted, conditions=[is_not_complete])
+    close = Transition(AllStates(), closed, name='Close', automatic=False)
+
+    def __init__(self, state):
+        self.state = state
+        self.calls[:] = []
+
+
+class StateMachineIndexTestCase(BluebottleTestCase):
+    def test_transitions_by_source(self):
+        self.assertEqual(
+            ExampleStateMachine.transitions_by_source['draft'],
+            [
+                ExampleStateMachine.auto_submit, ExampleStateMachine.close,
+                ExampleStateMachine.force_submit, ExampleStateMachine.submit
+            ]
+        )
+        self.assertEqual(
+            ExampleStateMachine('submitted').transitions_from('submitted'),
+            [ExampleStateMachine.close]
+        )
+
+    def test_transitions_from_unknown_state(self):
+        machine = ExampleStateMachine('unknown')
+        self.assertEqual(machine.transitions_from('unknown'), [ExampleStateMachine.close])
+
+    def test_initial_transition(self):
+        self.assertEqual(ExampleStateMachine('').initial_transition, ExampleStateMachine.initiate)
+
+    def test_possible_transitions(self):
+        machine = ExampleStateMachine('draft')
+        self.assertEqual(
+            machine.possible_transitions(),
+            [ExampleStateMachine.auto_submit, ExampleStateMachine.close, ExampleStateMachine.submit]
+        )
+
+        # Conditions are only evaluated once per call
+        self.assertEqual(machine.calls, ['is_complete', 'is_not_complete'])
+
+    def test_possible_transitions_manual(self):
+        machine = ExampleStateMachine('draft')
+        self.assertEqual(
+            machine.possible_transitions(automatic=False, user='owner'),
+            [ExampleStateMachine.close, ExampleStateMachine.submit]
+        )
+        self.assertEqual(machine.calls, ['is_complete'])
+
+    def test_possible_transitions_permission(self):
+        machine = ExampleStateMachine('draft')
+        self.assertEqual(
+            machine.possible_transitions(automatic=False, user='someone'),
+            [ExampleStateMachine.close]
+        )
+
+        # The permission is checked before the conditions
+        self.assertEqual(machine.calls, [])
+
+    def test_execute_wrong_source(self):
+        machine = ExampleStateMachine('submitted')
+        with self.assertRaisesMessage(TransitionNotPossible, 'Cannot transition from submitted'):
+            machine.auto_submit()
+
+        self.assertEqual(machine.calls, [])
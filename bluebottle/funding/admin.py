@@ -30,7 +30,7 @@ from bluebottle.funding.forms import RefundConfirmationForm
 from bluebottle.funding.models import (
     Funding, Donor, Payment, PaymentProvider,
     BudgetLine, PayoutAccount, LegacyPayment, BankAccount, PaymentCurrency, PlainPayoutAccount, Payout, Reward,
-    FundingPlatformSettings, MoneyContribution)
+    FundingPlatformSettings, MoneyContribution, WebhookEvent)
 from bluebottle.funding.states import DonorStateMachine
 from bluebottle.funding_flutterwave.models import FlutterwavePaymentProvider, FlutterwaveBankAccount, \
     FlutterwavePayment
@@ -711,6 +711,20 @@ class PayoutAdmin(StateMachineAdmin):
         return fieldsets
 
 
+@admin.register(WebhookEvent)
+class WebhookEventAdmin(admin.ModelAdmin):
+    list_display = ['created', 'provider', 'event_type', 'payment_key', 'status', 'attempts']
+    list_filter = ['provider', 'status']
+    search_fields = ['payment_key', 'idempotency_key']
+    readonly_fields = [
+        'provider', 'event_type', 'idempotency_key', 'payment_key', 'payload',
+        'status', 'attempts', 'error', 'created', 'processed'
+    ]
+
+    def has_add_permission(self, request):
+        return False
+
+
 @admin.register(FundingPlatformSettings)
 class FundingPlatformSettingsAdmin(BasePlatformSettingsAdmin):
     pass
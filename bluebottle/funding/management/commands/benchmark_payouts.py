@@ -0,0 +1,92 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+from moneyed import Money
+from polymorphic.models import PolymorphicModel
+
+from bluebottle.clients.models import Client
+from bluebottle.clients.utils import LocalTenant
+from bluebottle.funding.models import Donor, Funding, LegacyPayment, Payout
+from bluebottle.funding_pledge.models import PledgePayment
+
+
+class Command(BaseCommand):
+    help = (
+        'Time payout generation for a funding with many donations. '
+        'The donations are created in a transaction that is rolled back afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tenant', type=str, required=True,
+            help='The schema name of the tenant to run the benchmark on.'
+        )
+        parser.add_argument(
+            '--funding', type=int, default=None,
+            help='The id of the funding to add the donations to. Defaults to the first funding.'
+        )
+        parser.add_argument(
+            '--donations', type=int, nargs='+', default=[10000, 50000],
+            help='The number of donations to generate payouts for.'
+        )
+
+    def create_donations(self, funding, count):
+        # Save without triggers, the benchmark only needs the rows
+        for index in range(count):
+            currency = ('EUR', 'USD')[index % 2]
+            donor = Donor(
+                activity=funding,
+                status='new',
+                client_secret='benchmark',
+                amount=Money(10, currency),
+                payout_amount=Money(10, currency),
+            )
+            PolymorphicModel.save(donor)
+
+            payment_class = (LegacyPayment, PledgePayment)[(index // 2) % 2]
+            payment = payment_class(donation=donor, status='succeeded', updated=timezone.now())
+            if payment_class is LegacyPayment:
+                payment.method = 'benchmark'
+                payment.data = ''
+            PolymorphicModel.save(payment)
+
+        Donor.objects.filter(activity=funding, client_secret='benchmark').update(status='succeeded')
+
+    def benchmark(self, funding, count):
+        with transaction.atomic():
+            self.create_donations(funding, count)
+
+            with CaptureQueriesContext(connection) as queries:
+                start = time.time()
+                Payout.generate(funding)
+                duration = time.time() - start
+
+            self.stdout.write(
+                '{} donations: {} payouts in {:.2f}s, {} queries'.format(
+                    count, Payout.objects.filter(activity=funding).count(),
+                    duration, len(queries)
+                )
+            )
+
+            transaction.set_rollback(True)
+
+    def handle(self, *args, **options):
+        try:
+            client = Client.objects.get(schema_name=options['tenant'])
+        except Client.DoesNotExist:
+            raise CommandError('Unknown tenant: {}'.format(options['tenant']))
+
+        with LocalTenant(client, clear_tenant=True), override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False):
+            fundings = Funding.objects.all()
+            if options['funding']:
+                fundings = fundings.filter(pk=options['funding'])
+
+            funding = fundings.first()
+            if not funding:
+                raise CommandError('No funding found')
+
+            for count in options['donations']:
+                self.benchmark(funding, count)
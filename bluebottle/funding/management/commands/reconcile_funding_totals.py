@@ -0,0 +1,83 @@
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+
+from bluebottle.clients.models import Client
+from bluebottle.clients.utils import LocalTenant
+from bluebottle.funding.models import Funding, FundingTotal
+
+
+class Command(BaseCommand):
+    help = 'Verify the stored funding totals against the donations, and optionally fix them.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tenant', type=str, default=None,
+            help='Only reconcile the totals for the tenant with this schema name.'
+        )
+        parser.add_argument(
+            '--fix', action='store_true', default=False,
+            help='Store the recalculated totals for fundings that do not match.'
+        )
+
+    def get_stored(self, funding):
+        return dict(
+            (
+                total.currency,
+                {
+                    'amount': total.amount,
+                    'pledged': total.pledged,
+                    'donor_count': total.donor_count
+                }
+            )
+            for total in funding.totals.all()
+        )
+
+    def normalize(self, totals):
+        return dict(
+            (
+                currency,
+                {
+                    'amount': Decimal(values['amount']).quantize(Decimal('0.01')),
+                    'pledged': Decimal(values['pledged']).quantize(Decimal('0.01')),
+                    'donor_count': values['donor_count'],
+                }
+            )
+            for currency, values in totals.items()
+        )
+
+    def reconcile(self, client, fix):
+        mismatches = 0
+
+        with LocalTenant(client, clear_tenant=True):
+            for funding in Funding.objects.prefetch_related('totals'):
+                expected = self.normalize(FundingTotal.calculate(funding))
+                stored = self.normalize(self.get_stored(funding))
+
+                if expected != stored:
+                    mismatches += 1
+                    self.stdout.write(
+                        '{}: funding {} has totals {}, expected {}'.format(
+                            client.schema_name, funding.pk, stored, expected
+                        )
+                    )
+
+                    if fix:
+                        FundingTotal.refresh(funding)
+
+        return mismatches
+
+    def handle(self, *args, **options):
+        clients = Client.objects.all()
+        if options['tenant']:
+            clients = clients.filter(schema_name=options['tenant'])
+
+        mismatches = sum(
+            self.reconcile(client, options['fix']) for client in clients
+        )
+
+        self.stdout.write(
+            '{} funding(s) with incorrect totals{}'.format(
+                mismatches, ', fixed' if options['fix'] and mismatches else ''
+            )
+        )
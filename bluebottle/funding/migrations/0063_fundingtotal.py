@@ -0,0 +1,58 @@
+# Generated by Django 2.2.24 on 2026-10-19 12:21
+
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+import django.db.models.deletion
+
+
+def set_totals(apps, schema_editor):
+    Donor = apps.get_model('funding', 'Donor')
+    FundingTotal = apps.get_model('funding', 'FundingTotal')
+
+    counted = Q(status__in=('succeeded', 'activity_refunded'))
+    totals = Donor.objects.order_by().values(
+        'activity_id', 'amount_currency'
+    ).annotate(
+        total_amount=Sum('amount', filter=counted),
+        total_pledged=Sum('amount', filter=counted & Q(payment__pledgepayment__isnull=False)),
+        total_donor_count=Count('user', filter=Q(status='succeeded'))
+    )
+
+    FundingTotal.objects.bulk_create(
+        FundingTotal(
+            activity_id=total['activity_id'],
+            currency=total['amount_currency'],
+            amount=total['total_amount'] or 0,
+            pledged=total['total_pledged'] or 0,
+            donor_count=total['total_donor_count'],
+        )
+        for total in totals
+        if total['total_amount'] or total['total_donor_count']
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('funding', '0062_auto_20201222_1241'),
+        ('funding_pledge', '0005_auto_20191111_1331'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FundingTotal',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('currency', models.CharField(max_length=3)),
+                ('amount', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('pledged', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('donor_count', models.PositiveIntegerField(default=0)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('activity', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='totals', to='funding.Funding')),
+            ],
+            options={
+                'unique_together': {('activity', 'currency')},
+            },
+        ),
+        migrations.RunPython(set_totals, migrations.RunPython.noop)
+    ]
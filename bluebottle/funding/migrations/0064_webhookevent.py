@@ -0,0 +1,37 @@
+# Generated by Django 2.2.24 on 2026-10-19 13:02
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('funding', '0063_fundingtotal'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WebhookEvent',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.CharField(max_length=50)),
+                ('event_type', models.CharField(max_length=100)),
+                ('idempotency_key', models.CharField(max_length=255)),
+                ('payment_key', models.CharField(db_index=True, max_length=255)),
+                ('payload', django.contrib.postgres.fields.jsonb.JSONField(default=dict)),
+                ('status', models.CharField(choices=[('new', 'new'), ('processed', 'processed'), ('failed', 'failed')], default='new', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('created', models.DateTimeField(default=django.utils.timezone.now)),
+                ('processed', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'webhook event',
+                'verbose_name_plural': 'webhook events',
+                'ordering': ('created', 'id'),
+                'unique_together': {('provider', 'idempotency_key')},
+            },
+        ),
+    ]
@@ -7,12 +7,15 @@ from builtins import object
 from builtins import range
 
 from babel.numbers import get_currency_name
-from django.core.cache import cache
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.fields import JSONField
 from django.db import connection
-from django.db import models
-from django.db.models import Count
+from django.db import models, transaction
+from django.db.models import Count, Q
 from django.db.models import SET_NULL
 from django.db.models.aggregates import Sum
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -182,10 +185,7 @@ class Funding(Activity):
         )
 
     def update_amounts(self):
-        cache_key = '{}.{}.amount_donated'.format(connection.tenant.schema_name, self.id)
-        cache.delete(cache_key)
-        cache_key = '{}.{}.genuine_amount_donated'.format(connection.tenant.schema_name, self.id)
-        cache.delete(cache_key)
+        FundingTotal.refresh(self)
 
     @property
     def activity_date(self):
@@ -195,73 +195,41 @@ class Funding(Activity):
     def donations(self):
         return self.contributors.instance_of(Donor)
 
+    def get_total(self, field):
+        """
+        The sum of `field` over the stored totals, converted to the targets currency
+        """
+        if self.target and self.target.currency:
+            currency = self.target.currency
+        else:
+            currency = properties.DEFAULT_CURRENCY
+
+        amounts = [
+            convert(Money(getattr(total, field), total.currency), currency)
+            for total in self.totals.all()
+        ]
+        return sum(amounts) or Money(0, currency)
+
     @property
     def amount_donated(self):
         """
         The sum of all contributors (donations) converted to the targets currency
         """
-        from .states import DonorStateMachine
-        from bluebottle.funding.utils import calculate_total
-        cache_key = '{}.{}.amount_donated'.format(connection.tenant.schema_name, self.id)
-        total = cache.get(cache_key)
-        if not total:
-            donations = self.donations.filter(
-                status__in=(
-                    DonorStateMachine.succeeded.value,
-                    DonorStateMachine.activity_refunded.value,
-                )
-            )
-            if self.target and self.target.currency:
-                total = calculate_total(donations, self.target.currency)
-            else:
-                total = calculate_total(donations, properties.DEFAULT_CURRENCY)
-            cache.set(cache_key, total)
-        return total
+        return self.get_total('amount')
 
     @property
     def genuine_amount_donated(self):
         """
         The sum of all contributors (donations) without pledges converted to the targets currency
         """
-        from .states import DonorStateMachine
-        from bluebottle.funding.utils import calculate_total
-        cache_key = '{}.{}.genuine_amount_donated'.format(connection.tenant.schema_name, self.id)
-        total = cache.get(cache_key)
-        if not total:
-            donations = self.donations.filter(
-                status__in=(
-                    DonorStateMachine.succeeded.value,
-                    DonorStateMachine.activity_refunded.value,
-                ),
-                donor__payment__pledgepayment__isnull=True
-            )
-            if self.target and self.target.currency:
-                total = calculate_total(donations, self.target.currency)
-            else:
-                total = calculate_total(donations, properties.DEFAULT_CURRENCY)
-            cache.set(cache_key, total)
-        return total
+        return self.get_total('genuine')
 
-    @cached_property
+    @property
     def amount_pledged(self):
         """
-        The sum of all contributors (donations) converted to the targets currency
+        The sum of all pledged contributors (donations) converted to the targets currency
         """
-        from .states import DonorStateMachine
-        from bluebottle.funding.utils import calculate_total
-        donations = self.donations.filter(
-            status__in=(
-                DonorStateMachine.succeeded.value,
-                DonorStateMachine.activity_refunded.value,
-            ),
-            donor__payment__pledgepayment__isnull=False
-        )
-        if self.target and self.target.currency:
-            total = calculate_total(donations, self.target.currency)
-        else:
-            total = calculate_total(donations, properties.DEFAULT_CURRENCY)
-
-        return total
+        return self.get_total('pledged')
 
     @property
     def amount_raised(self):
@@ -282,12 +250,9 @@ class Funding(Activity):
 
     @property
     def stats(self):
-        from .states import DonorStateMachine
-        stats = self.donations.filter(
-            status=DonorStateMachine.succeeded.value
-        ).aggregate(
-            count=Count('user__id')
-        )
+        stats = {
+            'count': sum(total.donor_count for total in self.totals.all())
+        }
         stats['amount'] = {'amount': self.amount_raised.amount, 'currency': str(self.amount_raised.currency)}
         return stats
 
@@ -456,25 +421,37 @@ class Payout(TriggerMixin, models.Model):
                 payout.delete()
             elif payout.donations.count() == 0:
                 raise AssertionError('Payout without donations already started!')
-        ready_donations = activity.donations.filter(status='succeeded', donor__payout__isnull=True)
-        groups = set([
-            (don.payout_amount_currency, don.payment.provider) for don in
-            ready_donations
-        ])
-        for currency, provider in groups:
-            donations = [
-                don for don in
-                ready_donations.filter(donor__payout_amount_currency=currency)
-                if don.payment.provider == provider
-            ]
-            payout = cls.objects.create(
+        ready_donations = Donor.objects.filter(
+            activity=activity, status='succeeded', payout__isnull=True, payment__isnull=False
+        )
+        groups = ready_donations.order_by().values(
+            'payout_amount_currency', 'payment__polymorphic_ctype'
+        ).distinct()
+
+        # The provider is a property of the payment class, so group on the payment type
+        payouts = {}
+        for group in groups:
+            provider = ContentType.objects.get_for_id(
+                group['payment__polymorphic_ctype']
+            ).model_class().provider
+            payouts.setdefault((group['payout_amount_currency'], provider), []).append(
+                group['payment__polymorphic_ctype']
+            )
+
+        created = cls.objects.bulk_create([
+            cls(
                 activity=activity,
                 provider=provider,
-                currency=currency
-            )
-            for donation in donations:
-                donation.payout = payout
-                donation.save()
+                currency=currency,
+                status=PayoutStateMachine.new.value
+            ) for (currency, provider) in payouts
+        ])
+
+        for payout, content_types in zip(created, payouts.values()):
+            ready_donations.filter(
+                payout_amount_currency=payout.currency,
+                payment__polymorphic_ctype__in=content_types
+            ).update(payout=payout)
 
     @property
     def total_amount(self):
@@ -536,6 +513,111 @@ class Donor(Contributor):
         resource_name = 'contributors/donations'
 
 
+class FundingTotal(models.Model):
+    """
+    Totals of the donations of a funding activity, per currency. These are kept up to date
+    by the donor effects, so that the amounts of an activity can be read without aggregating
+    all donations.
+    """
+    activity = models.ForeignKey(
+        'funding.Funding', related_name='totals', on_delete=models.CASCADE
+    )
+    currency = models.CharField(max_length=3)
+
+    amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    pledged = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    donor_count = models.PositiveIntegerField(default=0)
+
+    updated = models.DateTimeField(auto_now=True)
+
+    @property
+    def genuine(self):
+        return self.amount - self.pledged
+
+    @classmethod
+    def calculate(cls, funding):
+        """
+        Calculate the totals for `funding` from its donors, with a single grouped query.
+        Returns a dict with the totals per currency.
+        """
+        from .states import DonorStateMachine
+
+        counted = Q(
+            status__in=(
+                DonorStateMachine.succeeded.value,
+                DonorStateMachine.activity_refunded.value,
+            )
+        )
+        totals = Donor.objects.filter(activity=funding).order_by().values(
+            'amount_currency'
+        ).annotate(
+            total_amount=Sum('amount', filter=counted),
+            total_pledged=Sum('amount', filter=counted & Q(payment__pledgepayment__isnull=False)),
+            total_donor_count=Count('user', filter=Q(status=DonorStateMachine.succeeded.value))
+        )
+
+        return dict(
+            (
+                total['amount_currency'],
+                {
+                    'amount': total['total_amount'] or 0,
+                    'pledged': total['total_pledged'] or 0,
+                    'donor_count': total['total_donor_count'],
+                }
+            )
+            for total in totals
+            if total['total_amount'] or total['total_donor_count']
+        )
+
+    @classmethod
+    def refresh(cls, funding):
+        """
+        Recalculate and store the totals for `funding`.
+
+        The funding row is locked while the totals are updated, so that concurrent donations
+        do not overwrite each others totals.
+        """
+        with transaction.atomic():
+            list(
+                Activity.objects.non_polymorphic().select_for_update().filter(
+                    pk=funding.pk
+                ).values_list('pk')
+            )
+
+            totals = cls.calculate(funding)
+            cls.objects.filter(activity=funding).exclude(currency__in=totals.keys()).delete()
+
+            for currency, values in totals.items():
+                cls.objects.update_or_create(
+                    activity=funding, currency=currency, defaults=values
+                )
+
+    class Meta(object):
+        unique_together = (('activity', 'currency'), )
+
+
+@receiver(post_save, sender=Donor)
+def update_totals_for_new_donor(sender, instance, created, **kwargs):
+    if created and instance.status in ('succeeded', 'activity_refunded'):
+        instance.activity.update_amounts()
+
+
+@receiver(post_delete, sender=Donor)
+def update_totals_for_deleted_donor(sender, instance, **kwargs):
+    if instance.status in ('succeeded', 'activity_refunded'):
+        try:
+            instance.activity.update_amounts()
+        except Activity.DoesNotExist:
+            pass
+
+
+@receiver(post_save)
+def update_totals_for_new_payment(sender, instance, created, **kwargs):
+    if isinstance(instance, Payment) and created and \
+            instance.donation.status in ('succeeded', 'activity_refunded'):
+        instance.donation.activity.update_amounts()
+
+
 @python_2_unicode_compatible
 class MoneyContribution(Contribution):
 
@@ -725,6 +807,40 @@ class BankAccount(TriggerMixin, PolymorphicModel):
         ordering = ('id',)
 
 
+class WebhookEvent(models.Model):
+    """
+    A verified webhook event from a payment provider. Events are stored when they are received
+    and processed in the background, in order, per payment.
+    """
+    STATUSES = (
+        ('new', _('new')),
+        ('processed', _('processed')),
+        ('failed', _('failed')),
+    )
+
+    provider = models.CharField(max_length=50)
+    event_type = models.CharField(max_length=100)
+    idempotency_key = models.CharField(max_length=255)
+    payment_key = models.CharField(max_length=255, db_index=True)
+    payload = JSONField(default=dict)
+
+    status = models.CharField(max_length=20, choices=STATUSES, default='new')
+    attempts = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True, null=True)
+
+    created = models.DateTimeField(default=timezone.now)
+    processed = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return '{} {} ({})'.format(self.provider, self.event_type, self.idempotency_key)
+
+    class Meta(object):
+        ordering = ('created', 'id')
+        unique_together = (('provider', 'idempotency_key'), )
+        verbose_name = _('webhook event')
+        verbose_name_plural = _('webhook events')
+
+
 class FundingPlatformSettings(BasePlatformSettings):
 
     allow_anonymous_rewards = models.BooleanField(
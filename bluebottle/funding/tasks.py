@@ -1,5 +1,6 @@
 import logging
 
+from celery import shared_task
 from celery.schedules import crontab
 from celery.task import periodic_task
 from djmoney.contrib.exchange.backends import OpenExchangeRatesBackend
@@ -30,3 +31,17 @@ def funding_tasks():
 )
 def update_rates():
     OpenExchangeRatesBackend().update_rates()
+
+
+@shared_task(bind=True, max_retries=8)
+def process_webhook_events(self, provider, payment_key, tenant):
+    from bluebottle.funding.webhooks import process_events, WebhookRetry
+
+    with LocalTenant(tenant, clear_tenant=True):
+        try:
+            process_events(
+                provider, payment_key, final=self.request.retries >= self.max_retries
+            )
+        except WebhookRetry as e:
+            logger.warning('Retrying webhook events for {} {}: {}'.format(provider, payment_key, e))
+            raise self.retry(exc=e, countdown=min(2 ** self.request.retries * 30, 3600))
@@ -464,7 +464,13 @@ class FundingDetailTestCase(BluebottleTestCase):
         export_url = data['data']['attributes']['supporters-export-url']['url']
 
         export_response = self.client.get(export_url)
-        self.assertTrue(b'Email,Name,Donor Date' in export_response.content)
+        content = b''.join(export_response.streaming_content).decode()
+        rows = content.splitlines()
+        self.assertTrue(rows[0].startswith('Email,Name,Donor Date'))
+        self.assertEqual(len(rows), 6)
+        self.assertTrue(
+            '{},{}'.format(co_financer.email, co_financer.full_name) in content
+        )
 
         wrong_signature_response = self.client.get(export_url + '111')
         self.assertEqual(
@@ -1,7 +1,11 @@
 from builtins import str
 from datetime import timedelta
+from io import StringIO
 
 import mock
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import now
 from moneyed import Money
 
@@ -12,6 +16,7 @@ from bluebottle.funding_stripe.tests.factories import StripePaymentFactory, Stri
     ExternalAccountFactory
 from bluebottle.initiatives.tests.factories import InitiativeFactory
 from bluebottle.test.utils import BluebottleTestCase
+from bluebottle.utils.exchange_rates import convert
 
 
 class FundingTestCase(BluebottleTestCase):
@@ -203,3 +208,78 @@ class PayoutTestCase(BluebottleTestCase):
         self.assertTrue(Money(2000, 'EUR') in payout_amounts)
         self.assertTrue(Money(2250, 'EUR') in payout_amounts)
         self.assertTrue(Money(750, 'EUR') in payout_amounts)
+
+    def test_generate_payouts_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            Payout.generate(self.funding)
+
+        self.assertEqual(self.funding.payouts.count(), 3)
+        self.assertTrue(len(queries) < 10)
+        self.assertEqual(
+            self.funding.donations.filter(donor__payout__isnull=True).count(), 0
+        )
+
+
+class FundingTotalTestCase(BluebottleTestCase):
+    def setUp(self):
+        super(FundingTotalTestCase, self).setUp()
+        self.funding = FundingFactory.create(target=Money(1000, 'EUR'))
+
+        for amount in [Money(100, 'EUR'), Money(50, 'EUR'), Money(100, 'USD')]:
+            donation = DonorFactory.create(activity=self.funding, amount=amount)
+            donation.states.succeed(save=True)
+
+        self.pledge = DonorFactory.create(activity=self.funding, amount=Money(25, 'EUR'))
+        self.pledge.states.succeed(save=True)
+        PledgePaymentFactory.create(donation=self.pledge)
+
+    def test_totals(self):
+        totals = dict((total.currency, total) for total in self.funding.totals.all())
+
+        self.assertEqual(totals['EUR'].amount, 175)
+        self.assertEqual(totals['EUR'].pledged, 25)
+        self.assertEqual(totals['EUR'].donor_count, 3)
+        self.assertEqual(totals['USD'].amount, 100)
+        self.assertEqual(totals['USD'].donor_count, 1)
+
+        self.assertEqual(self.funding.stats['count'], 4)
+
+    def test_amounts(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                self.funding.amount_donated,
+                Money(175, 'EUR') + convert(Money(100, 'USD'), 'EUR')
+            )
+
+        self.assertEqual(self.funding.amount_pledged, Money(25, 'EUR'))
+        self.assertEqual(
+            self.funding.genuine_amount_donated,
+            Money(150, 'EUR') + convert(Money(100, 'USD'), 'EUR')
+        )
+
+    def test_fail(self):
+        self.pledge.states.fail(save=True)
+
+        totals = dict((total.currency, total) for total in self.funding.totals.all())
+        self.assertEqual(totals['EUR'].amount, 150)
+        self.assertEqual(totals['EUR'].pledged, 0)
+        self.assertEqual(totals['EUR'].donor_count, 2)
+
+    def test_delete(self):
+        self.funding.donations.filter(donor__amount_currency='USD').get().delete()
+
+        self.assertEqual(
+            [total.currency for total in self.funding.totals.all()], ['EUR']
+        )
+
+    def test_reconcile(self):
+        self.funding.totals.update(amount=0, donor_count=0)
+
+        out = StringIO()
+        call_command('reconcile_funding_totals', stdout=out)
+        self.assertTrue('1 funding(s) with incorrect totals' in out.getvalue())
+        self.assertEqual(self.funding.totals.get(currency='USD').amount, 0)
+
+        call_command('reconcile_funding_totals', '--fix', stdout=out)
+        self.assertEqual(self.funding.totals.get(currency='USD').amount, 100)
+        self.assertEqual(self.funding.totals.get(currency='EUR').donor_count, 3)
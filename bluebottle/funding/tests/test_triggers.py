@@ -110,6 +110,13 @@ class DonorTriggerTests(BluebottleTestCase):
         self.assertEqual(contribution.value, Money(250, 'USD'))
         self.assertEqual(self.funding.amount_donated, Money(200, 'EUR'))
 
+    def test_change_donor_amount_only(self):
+        self.donor.amount = Money(300, 'EUR')
+        self.donor.save()
+
+        self.funding.refresh_from_db()
+        self.assertEqual(self.funding.amount_donated, Money(300, 'EUR'))
+
     def test_donor_activity_refunded(self):
         """
         Test that donation ends up as activity_refund when refunding a funding activity
@@ -0,0 +1,93 @@
+import mock
+
+from bluebottle.funding import webhooks
+from bluebottle.funding.exception import PaymentException
+from bluebottle.funding.models import WebhookEvent
+from bluebottle.test.utils import BluebottleTestCase
+
+
+class WebhookInboxTestCase(BluebottleTestCase):
+    def setUp(self):
+        super(WebhookInboxTestCase, self).setUp()
+        self.processed = []
+        self.errors = {}
+
+        def handler(event):
+            if event.payload.get('fail') in self.errors:
+                raise self.errors[event.payload['fail']]
+            self.processed.append(event.payload['value'])
+
+        handlers = dict(webhooks.handlers, test=handler)
+        patcher = mock.patch.object(webhooks, 'handlers', handlers)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_receive(self):
+        event = webhooks.receive('test', 'update', {'value': 1}, 'payment-1', idempotency_key='evt_1')
+
+        event.refresh_from_db()
+        self.assertEqual(event.status, 'processed')
+        self.assertEqual(event.attempts, 1)
+        self.assertEqual(self.processed, [1])
+
+    def test_duplicate(self):
+        webhooks.receive('test', 'update', {'value': 1}, 'payment-1', idempotency_key='evt_1')
+        webhooks.receive('test', 'update', {'value': 1}, 'payment-1', idempotency_key='evt_1')
+
+        self.assertEqual(WebhookEvent.objects.count(), 1)
+        self.assertEqual(self.processed, [1])
+
+    def test_without_idempotency_key(self):
+        webhooks.receive('test', 'update', {'value': 1}, 'payment-1')
+        webhooks.receive('test', 'update', {'value': 1}, 'payment-1')
+
+        self.assertEqual(WebhookEvent.objects.count(), 2)
+        self.assertEqual(self.processed, [1, 1])
+
+    def test_order(self):
+        with mock.patch('bluebottle.funding.tasks.process_webhook_events.delay'):
+            for value in range(3):
+                webhooks.receive('test', 'update', {'value': value}, 'payment-1')
+
+        self.assertEqual(self.processed, [])
+        webhooks.process_events('test', 'payment-1')
+
+        self.assertEqual(self.processed, [0, 1, 2])
+        self.assertEqual(
+            WebhookEvent.objects.filter(status='processed').count(), 3
+        )
+
+    def test_payment_exception(self):
+        self.errors['payment'] = PaymentException('Something went wrong')
+        event = webhooks.receive('test', 'update', {'fail': 'payment'}, 'payment-1')
+
+        event.refresh_from_db()
+        self.assertEqual(event.status, 'failed')
+        self.assertEqual(event.error, 'Something went wrong')
+
+    def test_retry(self):
+        self.errors['retry'] = ValueError('Not there yet')
+
+        with mock.patch('bluebottle.funding.tasks.process_webhook_events.delay'):
+            failing = webhooks.receive('test', 'update', {'fail': 'retry'}, 'payment-1')
+            later = webhooks.receive('test', 'update', {'value': 2}, 'payment-1')
+
+        with self.assertRaises(webhooks.WebhookRetry):
+            webhooks.process_events('test', 'payment-1')
+
+        failing.refresh_from_db()
+        later.refresh_from_db()
+        self.assertEqual(failing.status, 'new')
+        self.assertEqual(failing.attempts, 1)
+        self.assertEqual(failing.error, 'Not there yet')
+        self.assertEqual(later.status, 'new')
+        self.assertEqual(self.processed, [])
+
+        webhooks.process_events('test', 'payment-1', final=True)
+
+        failing.refresh_from_db()
+        later.refresh_from_db()
+        self.assertEqual(failing.status, 'failed')
+        self.assertEqual(failing.attempts, 2)
+        self.assertEqual(later.status, 'processed')
+        self.assertEqual(self.processed, [2])
@@ -375,6 +375,7 @@ class DonorTriggers(ContributorTriggers):
             effects=[
                 RelatedTransitionEffect('contributions', DonationStateMachine.fail),
                 RelatedTransitionEffect('payment', BasePaymentStateMachine.request_refund),
+                UpdateFundingAmountsEffect,
                 NotificationEffect(DonationActivityRefundedDonorMessage)
             ]
         ),
@@ -387,6 +388,13 @@ class DonorTriggers(ContributorTriggers):
             ]
         ),
 
+        ModelChangedTrigger(
+            'amount',
+            effects=[
+                UpdateFundingAmountsEffect
+            ]
+        ),
+
     ]
 
 
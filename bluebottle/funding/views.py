@@ -1,6 +1,8 @@
 import csv
+import itertools
 
-from django.http.response import HttpResponse
+from django.http.response import HttpResponse, StreamingHttpResponse
+from moneyed import Money
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
 from rest_framework_json_api.views import AutoPrefetchMixin
@@ -27,7 +29,6 @@ from bluebottle.funding.serializers import (
 from bluebottle.payouts_dorado.permissions import IsFinancialMember
 from bluebottle.segments.views import ClosedSegmentActivityViewMixin
 from bluebottle.transitions.views import TransitionList
-from bluebottle.utils.admin import prep_field
 from bluebottle.utils.permissions import IsOwner, OneOf, ResourcePermission
 from bluebottle.utils.views import (
     ListAPIView, ListCreateAPIView, RetrieveUpdateAPIView, JsonApiViewMixin,
@@ -96,7 +97,7 @@ class BudgetLineDetail(JsonApiViewMixin, AutoPrefetchMixin, RetrieveUpdateDestro
 
 
 class FundingList(JsonApiViewMixin, AutoPrefetchMixin, ListCreateAPIView):
-    queryset = Funding.objects.all()
+    queryset = Funding.objects.prefetch_related('totals')
     serializer_class = FundingListSerializer
 
     permission_classes = (
@@ -126,7 +127,7 @@ class FundingList(JsonApiViewMixin, AutoPrefetchMixin, ListCreateAPIView):
 class FundingDetail(JsonApiViewMixin, ClosedSegmentActivityViewMixin, AutoPrefetchMixin, RetrieveUpdateAPIView):
     queryset = Funding.objects.select_related(
         'initiative', 'initiative__owner',
-    ).prefetch_related('rewards')
+    ).prefetch_related('rewards', 'totals')
 
     serializer_class = FundingSerializer
     permission_classes = (
@@ -287,6 +288,15 @@ class PaymentList(JsonApiViewMixin, AutoPrefetchMixin, CreateAPIView):
     }
 
 
+class Echo(object):
+    """
+    File-like object that returns the written value, so that the csv writer
+    can be used to generate rows for a streaming response.
+    """
+    def write(self, value):
+        return value
+
+
 class SupportersExportView(PrivateFileView):
     fields = (
         ('user__email', 'Email'),
@@ -297,25 +307,46 @@ class SupportersExportView(PrivateFileView):
         ('reward__title', 'Reward'),
     )
 
+    values = (
+        'user__email', 'user__first_name', 'user__last_name', 'created',
+        'amount', 'amount_currency', 'reward__title',
+    )
+
+    chunk_size = 2000
+
     model = Funding
 
+    def get_rows(self, instance):
+        donations = Donor.objects.filter(
+            activity=instance,
+            status='succeeded'
+        ).order_by('created', 'id').values_list(*self.values)
+
+        for (email, first_name, last_name, created, amount, currency, reward) in donations.iterator(
+            chunk_size=self.chunk_size
+        ):
+            yield [
+                email or '',
+                '{} {}'.format(first_name or '', last_name or '').strip(),
+                created.strftime('%d-%m-%y %H:%M'),
+                currency,
+                Money(amount, currency) if amount else '',
+                reward or '',
+            ]
+
     def get(self, request, *args, **kwargs):
         instance = self.get_object()
+        writer = csv.writer(Echo())
 
-        response = HttpResponse()
-        response['Content-Disposition'] = 'attachment; filename="supporters.csv"'
-        response['Content-Type'] = 'text/csv'
-
-        writer = csv.writer(response)
+        rows = itertools.chain(
+            [[field[1] for field in self.fields]],
+            self.get_rows(instance)
+        )
 
-        writer.writerow([field[1] for field in self.fields])
-        for donation in instance.contributors.filter(
-            status='succeeded'
-        ).instance_of(
-            Donor
-        ):
-            writer.writerow([
-                prep_field(request, donation, field[0]) for field in self.fields
-            ])
+        response = StreamingHttpResponse(
+            (writer.writerow(row) for row in rows),
+            content_type='text/csv'
+        )
+        response['Content-Disposition'] = 'attachment; filename="supporters.csv"'
 
         return response
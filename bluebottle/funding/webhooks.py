@@ -0,0 +1,105 @@
+import logging
+import uuid
+
+from django.db import connection, transaction
+from django.utils.timezone import now
+
+from bluebottle.funding.exception import PaymentException
+
+logger = logging.getLogger(__name__)
+
+handlers = {}
+
+
+class WebhookRetry(Exception):
+    """
+    Processing an event failed, and should be retried later
+    """
+    pass
+
+
+def register(provider):
+    """
+    Register the function that processes the webhook events for `provider`.
+    The function is called with the stored `WebhookEvent`.
+    """
+    def _register(handler):
+        handlers[provider] = handler
+        return handler
+
+    return _register
+
+
+def receive(provider, event_type, payload, payment_key, idempotency_key=None):
+    """
+    Store a verified webhook event and schedule it for processing.
+
+    Events are identified by `idempotency_key` (normally the event id of the provider), so that
+    events that are delivered more than once are only processed once. Events without an id are
+    always processed.
+    Returns the stored event.
+    """
+    from bluebottle.funding.models import WebhookEvent
+    from bluebottle.funding.tasks import process_webhook_events
+
+    event, created = WebhookEvent.objects.get_or_create(
+        provider=provider,
+        idempotency_key=idempotency_key or uuid.uuid4().hex,
+        defaults={
+            'event_type': event_type,
+            'payload': payload,
+            'payment_key': payment_key
+        }
+    )
+
+    if created:
+        process_webhook_events.delay(provider, payment_key, connection.tenant)
+
+    return event
+
+
+def process_events(provider, payment_key, final=False):
+    """
+    Process all new events for a payment, in the order they were received.
+
+    The events are locked while they are processed, so a payment is only handled by one worker
+    at a time. Events that raise a `PaymentException` are marked as failed. Any other error
+    (for example a payment that is not yet created) stops processing, and raises `WebhookRetry`
+    so that the remaining events are processed in order when the task is retried.
+    When `final` is set, these events are marked as failed instead.
+    """
+    from bluebottle.funding.models import WebhookEvent
+
+    handler = handlers[provider]
+    error = None
+
+    with transaction.atomic():
+        events = WebhookEvent.objects.select_for_update().filter(
+            provider=provider, payment_key=payment_key, status='new'
+        ).order_by('created', 'id')
+
+        for event in events:
+            event.attempts += 1
+
+            try:
+                with transaction.atomic():
+                    handler(event)
+            except Exception as e:
+                event.error = str(e)
+                if final or isinstance(e, PaymentException):
+                    logger.error('Failed to process webhook event {}: {}'.format(event, e))
+                    event.status = 'failed'
+                    event.save()
+                    continue
+
+                event.save()
+                error = e
+                break
+
+            event.status = 'processed'
+            event.processed = now()
+            event.error = None
+            event.save()
+
+    if error:
+        raise WebhookRetry(str(error))
@@ -174,3 +174,4 @@ class FlutterwaveBankAccount(BankAccount):
 
 
 from .states import *  # noqa
+from . import webhooks  # noqa
@@ -6,6 +6,7 @@ from django.views.generic import View
 from rest_framework_json_api.views import AutoPrefetchMixin
 from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
+from bluebottle.funding import webhooks
 from bluebottle.funding.authentication import DonorAuthentication
 from bluebottle.funding.exception import PaymentException
 from bluebottle.funding.models import Donor
@@ -58,7 +59,8 @@ class FlutterwaveWebhookView(View):
                 payment.save()
             except Donor.DoesNotExist:
                 return HttpResponseNotFound()
-        check_payment_status(payment)
+
+        webhooks.receive('flutterwave', 'status', data, str(payment.tx_ref))
         return HttpResponse(status=200)
 
 
@@ -0,0 +1,9 @@
+from bluebottle.funding.webhooks import register
+from bluebottle.funding_flutterwave.models import FlutterwavePayment
+from bluebottle.funding_flutterwave.utils import check_payment_status
+
+
+@register('flutterwave')
+def process_flutterwave_event(webhook_event):
+    payment = FlutterwavePayment.objects.get(tx_ref=webhook_event.payment_key)
+    check_payment_status(payment)
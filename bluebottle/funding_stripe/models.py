@@ -634,3 +634,4 @@ class ExternalAccount(BankAccount):
 
 
 from .states import *  # noqa
+from . import webhooks  # noqa
@@ -2,19 +2,17 @@ from builtins import str
 from django.http import HttpResponse
 from django.views.generic import View
 
-from moneyed import Money
-
 from rest_framework import serializers
 from rest_framework.permissions import IsAuthenticated
 from rest_framework_json_api.views import AutoPrefetchMixin
 from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
 
+from bluebottle.funding import webhooks
 from bluebottle.funding.authentication import DonorAuthentication
 from bluebottle.funding.permissions import PaymentPermission
 from bluebottle.funding.serializers import BankAccountSerializer
 from bluebottle.funding.views import PaymentList
-from bluebottle.funding.models import Donor
 from bluebottle.funding_stripe.models import (
     StripePayment, StripePayoutAccount, ExternalAccount
 )
@@ -144,188 +142,100 @@ class ExternalAccountDetails(JsonApiViewMixin, AutoPrefetchMixin, RetrieveUpdate
         serializer.save()
 
 
-class IntentWebHookView(View):
-    def post(self, request, **kwargs):
-        payload = request.body
-        signature_header = request.META['HTTP_STRIPE_SIGNATURE']
-
-        try:
-            event = stripe.Webhook.construct_event(
-                payload, signature_header, stripe.webhook_secret_intents
-            )
-        except stripe.error.SignatureVerificationError:
-            # Invalid signature
-            return HttpResponse('Signature failed to verify', status=400)
-
-        try:
-            if event.type == 'payment_intent.succeeded':
-                payment = self.get_payment(event.data.object.id)
-                if payment.status != payment.states.succeeded.value:
-                    payment.states.succeed()
-                    transfer = stripe.Transfer.retrieve(event.data.object.charges.data[0].transfer)
-                    # Fix this if we're going to support currencies that don't hae smaller units, like yen.
-                    payment.donation.payout_amount = Money(
-                        transfer.amount / 100.0, transfer.currency
-                    )
-                    payment.donation.save()
-                    payment.save()
-
-                return HttpResponse('Updated payment')
-
-            elif event.type == 'payment_intent.payment_failed':
-                payment = self.get_payment(event.data.object.id)
-                if payment.status != payment.states.failed.value:
-                    payment.states.fail(save=True)
-
-                return HttpResponse('Updated payment')
-
-            elif event.type == 'charge.refunded':
-                if not event.data.object.payment_intent:
-                    return HttpResponse('Not an intent payment')
-
-                payment = self.get_payment(event.data.object.payment_intent)
-                payment.states.refund(save=True)
-
-                return HttpResponse('Updated payment')
-            else:
-                return HttpResponse('Skipped event {}'.format(event.type))
-
-        except StripePayment.DoesNotExist:
-            return HttpResponse('Payment not found', status=400)
-
-    def get_payment(self, intent_id):
-        intent = PaymentIntent.objects.get(intent_id=intent_id)
-
-        try:
-            return intent.payment
-        except StripePayment.DoesNotExist:
-            try:
-                intent.donation.payment.payment_intent = intent
-                intent.donation.payment.save()
-                return intent.payment
-            except Donor.payment.RelatedObjectDoesNotExist:
-                return StripePayment.objects.create(payment_intent=intent, donation=intent.donation)
-
-
-class SourceWebHookView(View):
-    def post(self, request, **kwargs):
-        payload = request.body
-        signature_header = request.META['HTTP_STRIPE_SIGNATURE']
+class StripeWebHookView(View):
+    """
+    Verify the signature of a Stripe event, store it and return immediately.
+    The event is processed in the background by the handler registered for `provider`.
+    """
+    provider = None
+    secret = None
 
-        try:
-            event = stripe.Webhook.construct_event(
-                payload, signature_header, stripe.webhook_secret_sources
-            )
-        except stripe.error.SignatureVerificationError:
-            # Invalid signature
-            return HttpResponse('Signature failed to verify', status=400)
+    def get_payment_key(self, event):
+        return event.data.object.id
 
-        try:
-            if event.type == 'source.canceled':
-                payment = self.get_payment_from_source(event.data.object.id)
-                payment.states.cancel(save=True)
-                return HttpResponse('Updated payment')
-
-            if event.type == 'source.failed':
-                payment = self.get_payment_from_source(event.data.object.id)
-                if payment.status != payment.states.failed.value:
-                    payment.states.fail(save=True)
-
-                return HttpResponse('Updated payment')
-
-            if event.type == 'source.chargeable':
-                payment = self.get_payment_from_source(event.data.object.id)
-                payment.do_charge()
-                payment.save()
-
-                return HttpResponse('Updated payment')
-
-            if event.type == 'charge.failed':
-                if event.data.object.payment_intent:
-                    return HttpResponse('Not a source payment')
-                payment = self.get_payment_from_charge(event.data.object.id)
-                if payment.status != payment.states.failed.value:
-                    payment.states.fail(save=True)
-
-                return HttpResponse('Updated payment')
-
-            if event.type == 'charge.succeeded':
-                if event.data.object.payment_intent:
-                    return HttpResponse('Not a source payment')
-                payment = self.get_payment_from_charge(event.data.object.id)
-                if payment.status != payment.states.succeeded.value:
-                    transfer = stripe.Transfer.retrieve(event.data.object.transfer)
-                    payment.donation.payout_amount = Money(
-                        transfer.amount / 100.0, transfer.currency
-                    )
-                    payment.donation.save()
-                    payment.states.succeed(save=True)
+    def skip(self, event):
+        return None
 
-                return HttpResponse('Updated payment')
-
-            if event.type == 'charge.pending':
-                if event.data.object.payment_intent:
-                    return HttpResponse('Not a source payment')
-                payment = self.get_payment_from_charge(event.data.object.id)
-                payment.states.authorize(save=True)
-                return HttpResponse('Updated payment')
-
-            if event.type == 'charge.refunded':
-                if event.data.object.payment_intent:
-                    return HttpResponse('Not a source payment')
-                payment = self.get_payment_from_charge(event.data.object.id)
-                payment.states.refund(save=True)
-
-                return HttpResponse('Updated payment')
-
-            if event.type == 'charge.dispute.closed' and event.data.object.status == 'lost':
-                if event.data.object.payment_intent:
-                    return HttpResponse('Not a source payment')
-                payment = self.get_payment_from_charge(event.data.object.charge)
-                payment.states.dispute(save=True)
-                return HttpResponse('Updated payment')
-
-        except StripePayment.DoesNotExist:
-            return HttpResponse('Payment not found', status=400)
-
-        return HttpResponse('Skipped')
-
-    def get_payment_from_source(self, source_token):
-        return StripeSourcePayment.objects.get(source_token=source_token)
-
-    def get_payment_from_charge(self, charge_token):
-        return StripeSourcePayment.objects.get(charge_token=charge_token)
-
-
-class ConnectWebHookView(View):
     def post(self, request, **kwargs):
-
         payload = request.body
         signature_header = request.META['HTTP_STRIPE_SIGNATURE']
 
         try:
             event = stripe.Webhook.construct_event(
-                payload, signature_header, stripe.webhook_secret_connect
+                payload, signature_header, getattr(stripe, self.secret)
             )
         except stripe.error.SignatureVerificationError:
             # Invalid signature
             return HttpResponse('Signature failed to verify', status=400)
 
-        try:
-            if event.type == 'account.updated':
-                account = self.get_account(event.data.object.id)
-                # Bust cached account
-                if account.account:
-                    del account.account
-                account.check_status()
-                account.save()
-
-                return HttpResponse('Updated payment')
-            else:
-                return HttpResponse('Skipped event {}'.format(event.type))
-
-        except StripePayoutAccount.DoesNotExist:
-            return HttpResponse('Payment not found', status=400)
-
-    def get_account(self, account_id):
-        return StripePayoutAccount.objects.get(account_id=account_id)
+        skipped = self.skip(event)
+        if skipped:
+            return HttpResponse(skipped)
+
+        webhooks.receive(
+            self.provider,
+            event.type,
+            {'id': getattr(event, 'id', None), 'type': event.type, 'data': event.data},
+            self.get_payment_key(event),
+            idempotency_key=getattr(event, 'id', None)
+        )
+        return HttpResponse('Received event')
+
+
+class IntentWebHookView(StripeWebHookView):
+    provider = 'stripe_intent'
+    secret = 'webhook_secret_intents'
+
+    def skip(self, event):
+        if event.type == 'charge.refunded':
+            if not event.data.object.payment_intent:
+                return 'Not an intent payment'
+        elif event.type not in ('payment_intent.succeeded', 'payment_intent.payment_failed'):
+            return 'Skipped event {}'.format(event.type)
+
+    def get_payment_key(self, event):
+        if event.type == 'charge.refunded':
+            return event.data.object.payment_intent
+        return event.data.object.id
+
+
+class SourceWebHookView(StripeWebHookView):
+    provider = 'stripe_source'
+    secret = 'webhook_secret_sources'
+
+    def skip(self, event):
+        if event.type in ('source.canceled', 'source.failed', 'source.chargeable'):
+            return None
+
+        if event.type in (
+            'charge.failed', 'charge.succeeded', 'charge.pending', 'charge.refunded'
+        ) or (
+            event.type == 'charge.dispute.closed' and event.data.object.status == 'lost'
+        ):
+            if event.data.object.payment_intent:
+                return 'Not a source payment'
+            return None
+
+        return 'Skipped'
+
+    def get_payment_key(self, event):
+        if event.type.startswith('source.'):
+            return event.data.object.id
+
+        if event.type == 'charge.dispute.closed':
+            return event.data.object.charge
+
+        # Process charge events in order with the events for their source
+        source = event.data.object.get('source')
+        if isinstance(source, dict) and source.get('id'):
+            return source['id']
+        return event.data.object.id
+
+
+class ConnectWebHookView(StripeWebHookView):
+    provider = 'stripe_connect'
+    secret = 'webhook_secret_connect'
+
+    def skip(self, event):
+        if event.type != 'account.updated':
+            return 'Skipped event {}'.format(event.type)
@@ -0,0 +1,110 @@
+from moneyed import Money
+
+from bluebottle.funding.models import Donor
+from bluebottle.funding.webhooks import register
+from bluebottle.funding_stripe.models import (
+    StripePayment, StripeSourcePayment, StripePayoutAccount, PaymentIntent
+)
+from bluebottle.funding_stripe.utils import stripe
+
+
+def get_event(webhook_event):
+    return stripe.Event.construct_from(webhook_event.payload, stripe.api_key)
+
+
+def get_intent_payment(intent_id):
+    intent = PaymentIntent.objects.get(intent_id=intent_id)
+
+    try:
+        return intent.payment
+    except StripePayment.DoesNotExist:
+        try:
+            intent.donation.payment.payment_intent = intent
+            intent.donation.payment.save()
+            return intent.payment
+        except Donor.payment.RelatedObjectDoesNotExist:
+            return StripePayment.objects.create(payment_intent=intent, donation=intent.donation)
+
+
+@register('stripe_intent')
+def process_intent_event(webhook_event):
+    event = get_event(webhook_event)
+
+    if event.type == 'payment_intent.succeeded':
+        payment = get_intent_payment(event.data.object.id)
+        if payment.status != payment.states.succeeded.value:
+            payment.states.succeed()
+            transfer = stripe.Transfer.retrieve(event.data.object.charges.data[0].transfer)
+            # Fix this if we're going to support currencies that don't hae smaller units, like yen.
+            payment.donation.payout_amount = Money(
+                transfer.amount / 100.0, transfer.currency
+            )
+            payment.donation.save()
+            payment.save()
+
+    elif event.type == 'payment_intent.payment_failed':
+        payment = get_intent_payment(event.data.object.id)
+        if payment.status != payment.states.failed.value:
+            payment.states.fail(save=True)
+
+    elif event.type == 'charge.refunded':
+        payment = get_intent_payment(event.data.object.payment_intent)
+        payment.states.refund(save=True)
+
+
+@register('stripe_source')
+def process_source_event(webhook_event):
+    event = get_event(webhook_event)
+
+    if event.type.startswith('source.'):
+        payment = StripeSourcePayment.objects.get(source_token=event.data.object.id)
+
+        if event.type == 'source.canceled':
+            payment.states.cancel(save=True)
+
+        elif event.type == 'source.failed':
+            if payment.status != payment.states.failed.value:
+                payment.states.fail(save=True)
+
+        elif event.type == 'source.chargeable':
+            payment.do_charge()
+            payment.save()
+
+    elif event.type == 'charge.dispute.closed':
+        payment = StripeSourcePayment.objects.get(charge_token=event.data.object.charge)
+        payment.states.dispute(save=True)
+
+    else:
+        payment = StripeSourcePayment.objects.get(charge_token=event.data.object.id)
+
+        if event.type == 'charge.failed':
+            if payment.status != payment.states.failed.value:
+                payment.states.fail(save=True)
+
+        elif event.type == 'charge.succeeded':
+            if payment.status != payment.states.succeeded.value:
+                transfer = stripe.Transfer.retrieve(event.data.object.transfer)
+                payment.donation.payout_amount = Money(
+                    transfer.amount / 100.0, transfer.currency
+                )
+                payment.donation.save()
+                payment.states.succeed(save=True)
+
+        elif event.type == 'charge.pending':
+            payment.states.authorize(save=True)
+
+        elif event.type == 'charge.refunded':
+            payment.states.refund(save=True)
+
+
+@register('stripe_connect')
+def process_connect_event(webhook_event):
+    event = get_event(webhook_event)
+
+    if event.type == 'account.updated':
+        account = StripePayoutAccount.objects.get(account_id=event.data.object.id)
+        # Bust cached account
+        if account.account:
+            del account.account
+        account.check_status()
+        account.save()
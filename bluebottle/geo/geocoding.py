@@ -0,0 +1,104 @@
+from collections import namedtuple
+from datetime import timedelta
+
+import geocoder
+from django.conf import settings
+from django.contrib.gis.geos import Point
+from django.utils.timezone import now
+
+from bluebottle.utils.utils import get_class
+
+
+GeocodeResult = namedtuple('GeocodeResult', ('position', 'formatted_address'))
+
+
+class BaseGeocoder(object):
+    """
+    Resolve a locality in a country to a position and a formatted address.
+    """
+
+    def geocode(self, locality, country):
+        raise NotImplementedError()
+
+
+class GoogleGeocoder(BaseGeocoder):
+    def geocode(self, locality, country):
+        result = geocoder.google(
+            '{} {}'.format(locality, country.name),
+            key=settings.MAPS_API_KEY
+        )
+        if result.lat and result.lng:
+            return GeocodeResult(
+                Point(x=float(result.lng), y=float(result.lat)),
+                result.raw['formatted_address']
+            )
+
+
+class LocalGeocoder(BaseGeocoder):
+    """
+    Geocoder that does not use the network: it only reuses positions of geolocations
+    we already know. Used for tests and offline installs.
+    """
+
+    def geocode(self, locality, country):
+        from bluebottle.geo.models import Geolocation
+
+        geolocation = Geolocation.objects.filter(
+            locality__iexact=locality, country=country, position__isnull=False
+        ).first()
+
+        if geolocation:
+            return GeocodeResult(geolocation.position, geolocation.formatted_address)
+
+
+def get_geocoder():
+    return get_class(settings.GEOCODER)()
+
+
+def normalize_locality(locality):
+    return locality.strip().lower()
+
+
+def get_cached_geocode(locality, country):
+    """
+    Return the stored geocode result for the locality and country, or None if it was never resolved.
+    Localities that could not be resolved recently return a result without a position.
+    """
+    from bluebottle.geo.models import GeocodeCache
+
+    cached = GeocodeCache.objects.filter(
+        locality=normalize_locality(locality), country=country
+    ).first()
+
+    if cached and (
+        cached.position or
+        cached.created > now() - timedelta(seconds=settings.GEOCODE_NEGATIVE_CACHE_TIMEOUT)
+    ):
+        return GeocodeResult(cached.position, cached.formatted_address)
+
+
+def geocode(locality, country):
+    """
+    Resolve the locality and country, using the stored result if there is one. Results from
+    the geocoder are stored, also when the locality could not be resolved, so every locality
+    is only resolved once.
+    """
+    from bluebottle.geo.models import GeocodeCache
+
+    result = get_cached_geocode(locality, country)
+
+    if result is None:
+        result = get_geocoder().geocode(locality, country)
+
+        GeocodeCache.objects.update_or_create(
+            locality=normalize_locality(locality),
+            country=country,
+            defaults={
+                'position': result.position if result else None,
+                'formatted_address': result.formatted_address if result else None,
+                'created': now(),
+            }
+        )
+
+    if result and result.position:
+        return result
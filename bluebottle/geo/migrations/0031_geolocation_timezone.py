@@ -0,0 +1,29 @@
+# Generated by Django 2.2.24 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+from bluebottle.geo.utils import get_timezone
+
+
+def set_timezone(apps, schema_editor):
+    Geolocation = apps.get_model('geo', 'Geolocation')
+
+    for geolocation in Geolocation.objects.all():
+        geolocation.timezone = get_timezone(geolocation.position)
+        geolocation.save(update_fields=['timezone'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geo', '0030_merge_20211026_1137'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='geolocation',
+            name='timezone',
+            field=models.CharField(blank=True, max_length=100, null=True, verbose_name='Timezone'),
+        ),
+        migrations.RunPython(set_timezone, migrations.RunPython.noop)
+    ]
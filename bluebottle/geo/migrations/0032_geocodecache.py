@@ -0,0 +1,31 @@
+# Generated by Django 2.2.24 on 2026-10-19 11:03
+
+from django.db import migrations, models
+import django.contrib.gis.db.models.fields
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geo', '0031_geolocation_timezone'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GeocodeCache',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('locality', models.CharField(max_length=255, verbose_name='Locality')),
+                ('position', django.contrib.gis.db.models.fields.PointField(null=True, srid=4326)),
+                ('formatted_address', models.CharField(blank=True, max_length=255, null=True, verbose_name='Address')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('country', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='geo.Country')),
+            ],
+            options={
+                'verbose_name': 'geocode cache',
+                'verbose_name_plural': 'geocode cache',
+                'unique_together': {('locality', 'country')},
+            },
+        ),
+    ]
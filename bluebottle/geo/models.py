@@ -1,24 +1,21 @@
 from builtins import object
 
-import geocoder
+import pytz
 from django.conf import settings
 from django.contrib.gis.db.models import PointField
-from django.contrib.gis.geos import Point
-from django.db import models
+from django.db import connection, models, transaction
 from django.template.defaultfilters import slugify
 from django.utils.translation import gettext_lazy as _
 from future.utils import python_2_unicode_compatible
 from parler.models import TranslatedFields
 from sorl.thumbnail import ImageField
-from timezonefinder import TimezoneFinder
 
+from bluebottle.geo.utils import get_timezone
 from bluebottle.utils.models import SortableTranslatableModel
 from bluebottle.utils.validators import FileMimetypeValidator, validate_file_infection
 from .validators import Alpha2CodeValidator, Alpha3CodeValidator, \
     NumericCodeValidator
 
-tf = TimezoneFinder()
-
 
 @python_2_unicode_compatible
 class GeoBaseModel(SortableTranslatableModel):
@@ -195,26 +192,43 @@ class Place(models.Model):
     position = PointField(null=True)
 
     def save(self, *args, **kwargs):
-        if self.locality and self.country and not self.position:
-            result = geocoder.google(
-                '{} {}'.format(self.locality, self.country.name),
-                key=settings.MAPS_API_KEY
-
-            )
-            if result.lat and result.lng:
-                self.position = Point(
-                    x=float(result.lng),
-                    y=float(result.lat)
-                )
+        from bluebottle.geo.geocoding import get_cached_geocode
+        from bluebottle.geo.tasks import geocode_place
 
-                self.formatted_address = result.raw['formatted_address']
+        needs_geocode = self.locality and self.country and not self.position
+        result = None
+        if needs_geocode:
+            result = get_cached_geocode(self.locality, self.country)
+            if result and result.position:
+                self.position = result.position
+                self.formatted_address = result.formatted_address
 
         super().save(*args, **kwargs)
 
+        if needs_geocode and result is None:
+            # Only geocode once the place is committed, so that the task can find it
+            tenant = connection.tenant
+            transaction.on_commit(lambda: geocode_place.delay(self.pk, tenant))
+
     def __str__(self):
         return "{0}, {1}".format(self.locality, self.country)
 
 
+class GeocodeCache(models.Model):
+    locality = models.CharField(_('Locality'), max_length=255)
+    country = models.ForeignKey('geo.Country', on_delete=models.CASCADE)
+
+    position = PointField(null=True)
+    formatted_address = models.CharField(_('Address'), max_length=255, blank=True, null=True)
+
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta(object):
+        unique_together = (('locality', 'country'), )
+        verbose_name = _('geocode cache')
+        verbose_name_plural = _('geocode cache')
+
+
 @python_2_unicode_compatible
 class Geolocation(models.Model):
     street_number = models.CharField(_('Street Number'), max_length=255, blank=True, null=True)
@@ -228,6 +242,8 @@ class Geolocation(models.Model):
 
     position = PointField(null=True)
 
+    timezone = models.CharField(_('Timezone'), max_length=100, blank=True, null=True)
+
     anonymized = False
 
     class JSONAPIMeta(object):
@@ -240,10 +256,11 @@ class Geolocation(models.Model):
             return self.country.name
 
     @property
-    def timezone(self):
-        if self.position:
-            return tf.timezone_at(
-                lng=self.position.x,
-                lat=self.position.y
-            )
-        return 'Europe/Amsterdam'
+    def tzinfo(self):
+        # Geolocations that were not saved since the timezone was added have no timezone yet
+        return pytz.timezone(self.timezone or get_timezone(self.position))
+
+    def save(self, *args, **kwargs):
+        self.timezone = get_timezone(self.position)
+
+        super().save(*args, **kwargs)
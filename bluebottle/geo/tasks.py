@@ -0,0 +1,20 @@
+from celery import shared_task
+
+from bluebottle.clients.utils import LocalTenant
+from bluebottle.geo.geocoding import geocode
+
+
+@shared_task
+def geocode_place(place_id, tenant):
+    from bluebottle.geo.models import Place
+
+    with LocalTenant(tenant, clear_tenant=True):
+        place = Place.objects.filter(pk=place_id, position__isnull=True).first()
+
+        if place and place.locality and place.country:
+            result = geocode(place.locality, place.country)
+
+            if result:
+                place.position = result.position
+                place.formatted_address = result.formatted_address
+                place.save()
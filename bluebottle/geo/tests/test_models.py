@@ -1,8 +1,15 @@
 from builtins import object
+from datetime import timedelta
+
+from django.contrib.gis.geos import Point
 from django.core.exceptions import ValidationError
+from django.utils.timezone import now
+from mock import patch
 
-from bluebottle.test.utils import BluebottleTestCase
-from bluebottle.geo.models import Region, SubRegion, Country
+from bluebottle.geo.geocoding import LocalGeocoder
+from bluebottle.test.utils import BluebottleTestCase, run_on_commit
+from bluebottle.geo.models import Region, SubRegion, Country, GeocodeCache
+from bluebottle.test.factory_models.geo import GeolocationFactory, PlaceFactory
 
 
 class GeoTestsMixin(object):
@@ -143,3 +150,108 @@ class GeoTestCase(BluebottleTestCase):
         self.country.alpha3_code = "XFF"
         self.country.full_clean()
         self.country.save()
+
+
+class GeolocationTimezoneTestCase(BluebottleTestCase):
+    def test_timezone(self):
+        geolocation = GeolocationFactory.create(position=Point(-74.0060, 40.7128))
+        self.assertEqual(geolocation.timezone, 'America/New_York')
+
+    def test_timezone_updated(self):
+        geolocation = GeolocationFactory.create(position=Point(-74.0060, 40.7128))
+
+        geolocation.position = Point(4.8981734, 52.3790565)
+        geolocation.save()
+
+        geolocation.refresh_from_db()
+        self.assertEqual(geolocation.timezone, 'Europe/Amsterdam')
+
+    def test_timezone_no_position(self):
+        geolocation = GeolocationFactory.create(position=None)
+        self.assertEqual(geolocation.timezone, 'Europe/Amsterdam')
+
+
+class PlaceGeocodeTestCase(BluebottleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.geolocation = GeolocationFactory.create(
+            locality='Amsterdam', position=Point(4.8981734, 52.3790565)
+        )
+
+    def test_geocode(self):
+        with run_on_commit():
+            place = PlaceFactory.create(
+                locality='Amsterdam', country=self.geolocation.country, position=None
+            )
+        place.refresh_from_db()
+
+        self.assertEqual(place.position, self.geolocation.position)
+        self.assertEqual(
+            GeocodeCache.objects.get(locality='amsterdam').position,
+            self.geolocation.position
+        )
+
+    def test_geocode_not_committed(self):
+        place = PlaceFactory.create(
+            locality='Amsterdam', country=self.geolocation.country, position=None
+        )
+        place.refresh_from_db()
+
+        self.assertIsNone(place.position)
+
+    def test_geocode_cached(self):
+        with run_on_commit():
+            PlaceFactory.create(
+                locality='Amsterdam', country=self.geolocation.country, position=None
+            )
+        self.geolocation.delete()
+
+        place = PlaceFactory.create(
+            locality='amsterdam ', country=self.geolocation.country, position=None
+        )
+        self.assertEqual(place.position, Point(4.8981734, 52.3790565))
+
+    def test_geocode_unknown(self):
+        with run_on_commit():
+            place = PlaceFactory.create(
+                locality='Rotterdam', country=self.geolocation.country, position=None
+            )
+        place.refresh_from_db()
+
+        self.assertIsNone(place.position)
+        self.assertIsNone(GeocodeCache.objects.get(locality='rotterdam').position)
+
+    def test_geocode_unknown_cached(self):
+        with run_on_commit():
+            PlaceFactory.create(
+                locality='Rotterdam', country=self.geolocation.country, position=None
+            )
+
+        with patch.object(LocalGeocoder, 'geocode') as geocode:
+            with run_on_commit():
+                place = PlaceFactory.create(
+                    locality='Rotterdam', country=self.geolocation.country, position=None
+                )
+
+            geocode.assert_not_called()
+
+        self.assertIsNone(place.position)
+
+    def test_geocode_unknown_expired(self):
+        with run_on_commit():
+            PlaceFactory.create(
+                locality='Rotterdam', country=self.geolocation.country, position=None
+            )
+        GeocodeCache.objects.update(created=now() - timedelta(days=8))
+
+        GeolocationFactory.create(
+            locality='Rotterdam', country=self.geolocation.country, position=Point(4.47, 51.92)
+        )
+
+        with run_on_commit():
+            place = PlaceFactory.create(
+                locality='Rotterdam', country=self.geolocation.country, position=None
+            )
+        place.refresh_from_db()
+
+        self.assertEqual(place.position, Point(4.47, 51.92))
@@ -0,0 +1,35 @@
+from functools import lru_cache
+
+from timezonefinder import TimezoneFinder
+
+DEFAULT_TIMEZONE = 'Europe/Amsterdam'
+
+# Coordinates are rounded to 3 decimals (roughly 100 meters) before resolving the timezone,
+# so that nearby positions share a cache entry.
+PRECISION = 3
+
+
+@lru_cache(maxsize=None)
+def get_timezone_finder():
+    """
+    The timezone finder loads all timezone polygons in memory, so create it only when we actually
+    need it and share it between all callers.
+    """
+    return TimezoneFinder()
+
+
+@lru_cache(maxsize=10000)
+def _timezone_at(lng, lat):
+    return get_timezone_finder().timezone_at(lng=lng, lat=lat)
+
+
+def get_timezone(position):
+    """
+    Return the name of the timezone at `position`, or the default timezone if it can not be resolved.
+    """
+    if not position:
+        return DEFAULT_TIMEZONE
+
+    return _timezone_at(
+        round(position.x, PRECISION), round(position.y, PRECISION)
+    ) or DEFAULT_TIMEZONE
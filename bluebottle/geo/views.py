@@ -1,16 +1,17 @@
 from django.db.models import Q
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from rest_framework.generics import ListAPIView, RetrieveAPIView, CreateAPIView
 from rest_framework_json_api.views import AutoPrefetchMixin
 
+from bluebottle.activities.models import Activity
 from bluebottle.geo.models import Location, Country, Geolocation
+from bluebottle.initiatives.models import Initiative
+from bluebottle.time_based.models import ActivitySlot
 from bluebottle.geo.serializers import LocationSerializer, GeolocationSerializer, OfficeSerializer
-from bluebottle.utils.views import TranslatedApiViewMixin, JsonApiViewMixin
+from bluebottle.utils.views import TranslatedApiViewMixin, JsonApiViewMixin, CachedResponseMixin
 from .serializers import CountrySerializer
 
 
-class CountryList(TranslatedApiViewMixin, ListAPIView):
+class CountryList(CachedResponseMixin, TranslatedApiViewMixin, ListAPIView):
     serializer_class = CountrySerializer
     queryset = Country.objects
 
@@ -18,9 +19,9 @@ class CountryList(TranslatedApiViewMixin, ListAPIView):
         'open', 'running', 'full', 'succeeded', 'partially_funded', 'refunded',
     ]
 
-    @method_decorator(cache_page(3600))
-    def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
+    # `filter[used]` depends on the status of initiatives and activities
+    cache_models = (Country, Location, Geolocation, Initiative, Activity, ActivitySlot)
+    cache_authenticated = True
 
     def get_queryset(self):
         qs = super(CountryList, self).get_queryset()
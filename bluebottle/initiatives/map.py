@@ -0,0 +1,168 @@
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+from bluebottle.geo.models import Location
+from bluebottle.initiatives.models import Initiative
+
+# Number of cells per map tile width that points are clustered in
+CLUSTER_CELLS = 4
+
+# Zoom level from which points are no longer clustered
+MAX_CLUSTER_ZOOM = 16
+
+
+def get_map_key():
+    return '{}.initiative_map_data'.format(connection.tenant.schema_name)
+
+
+def get_row_key(pk):
+    return '{}.initiative_map_data.{}'.format(connection.tenant.schema_name, pk)
+
+
+def get_row(pk, title, slug, theme_id, position, skip_empty):
+    if position is None or (skip_empty and position.coords == (0, 0)):
+        return None
+
+    return {
+        'id': pk,
+        'title': title,
+        'slug': slug,
+        'theme': theme_id,
+        'position': [position.coords[1], position.coords[0]],
+    }
+
+
+def build_map_data():
+    # Without offices, initiatives without a proper place end up at (0, 0)
+    skip_empty = not Location.objects.exists()
+
+    initiatives = Initiative.objects.filter(status='approved').order_by('created').values_list(
+        'pk', 'title', 'slug', 'theme_id', 'place__position', 'location__position'
+    )
+
+    data = {}
+    for pk, title, slug, theme_id, place_position, location_position in initiatives:
+        row = get_row(pk, title, slug, theme_id, place_position or location_position, skip_empty)
+        if row:
+            data[pk] = row
+
+    return skip_empty, data
+
+
+def get_map_data():
+    """
+    Return the map rows of all approved initiatives with a position, by id.
+
+    Every row is cached under its own key, next to an index with the ids of the rows. Changed
+    initiatives only replace their own row, see `update_initiative`, so concurrent updates
+    never overwrite each other. The rows are rebuilt with a single query when the index or one
+    of the rows is missing.
+    """
+    index = cache.get(get_map_key())
+
+    if index is not None:
+        _skip_empty, ids = index
+        rows = cache.get_many([get_row_key(pk) for pk in ids])
+
+        if len(rows) == len(ids):
+            return dict((pk, rows[get_row_key(pk)]) for pk in ids if rows[get_row_key(pk)])
+
+    skip_empty, data = build_map_data()
+
+    cache.set_many(
+        dict((get_row_key(pk), row) for pk, row in data.items()),
+        settings.INITIATIVE_MAP_CACHE_TIMEOUT
+    )
+    cache.set(get_map_key(), (skip_empty, list(data.keys())), settings.INITIATIVE_MAP_CACHE_TIMEOUT)
+
+    return data
+
+
+def set_row(index, pk, row):
+    _skip_empty, ids = index
+    if pk in ids:
+        # Removed rows are kept as `False`, so that the index does not have to change
+        cache.set(get_row_key(pk), row or False, settings.INITIATIVE_MAP_CACHE_TIMEOUT)
+    elif row:
+        # New rows need a new index, which is rebuilt on the next request
+        invalidate()
+
+
+def update_initiative(initiative):
+    """
+    Add, change or remove the row of `initiative` in the cached map data
+    """
+    index = cache.get(get_map_key())
+    if index is None:
+        return
+
+    skip_empty, _ids = index
+
+    row = None
+    if initiative.status == 'approved':
+        row = get_row(
+            initiative.pk, initiative.title, initiative.slug, initiative.theme_id,
+            initiative.position, skip_empty
+        )
+
+    set_row(index, initiative.pk, row)
+
+
+def remove_initiative(pk):
+    index = cache.get(get_map_key())
+    if index is not None:
+        set_row(index, pk, None)
+
+
+def invalidate():
+    cache.delete(get_map_key())
+
+
+def in_bbox(row, bbox):
+    west, south, east, north = bbox
+    latitude, longitude = row['position']
+
+    if not south <= latitude <= north:
+        return False
+
+    if west <= east:
+        return west <= longitude <= east
+
+    # The box crosses the antimeridian
+    return longitude >= west or longitude <= east
+
+
+def cluster(rows, zoom):
+    """
+    Group `rows` in a grid that gets finer with `zoom`. Cells with more than one initiative
+    are returned as a cluster with the average position and the number of initiatives.
+    """
+    if zoom >= MAX_CLUSTER_ZOOM:
+        return list(rows)
+
+    size = 360.0 / 2 ** zoom / CLUSTER_CELLS
+
+    cells = {}
+    for row in rows:
+        latitude, longitude = row['position']
+        cells.setdefault(
+            (math.floor(latitude / size), math.floor(longitude / size)), []
+        ).append(row)
+
+    result = []
+    for cell in cells.values():
+        if len(cell) == 1:
+            result.append(cell[0])
+        else:
+            result.append({
+                'position': [
+                    sum(row['position'][0] for row in cell) / len(cell),
+                    sum(row['position'][1] for row in cell) / len(cell),
+                ],
+                'count': len(cell),
+            })
+
+    return result
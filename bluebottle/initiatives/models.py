@@ -349,3 +349,4 @@ class Theme(SortableTranslatableModel):
 
 
 from bluebottle.initiatives.wallposts import *  # noqa
+from bluebottle.initiatives.signals import *  # noqa
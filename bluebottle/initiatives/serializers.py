@@ -11,7 +11,7 @@ from rest_framework_json_api.serializers import ModelSerializer
 from bluebottle.activities.models import Activity
 from bluebottle.activities.serializers import ActivityListSerializer
 from bluebottle.activities.states import ActivityStateMachine
-from bluebottle.activities.utils import get_stats_for_activities
+from bluebottle.activities.utils import get_cached_stats_for_activities
 from bluebottle.bluebottle_drf2.serializers import (
     ImageSerializer as OldImageSerializer, SorlImageField
 )
@@ -23,7 +23,6 @@ from bluebottle.fsm.serializers import (
 )
 from bluebottle.funding.states import FundingStateMachine
 from bluebottle.geo.models import Location
-from bluebottle.geo.serializers import TinyPointSerializer
 from bluebottle.initiatives.models import Initiative, InitiativePlatformSettings, Theme
 from bluebottle.members.models import Member
 from bluebottle.organizations.models import Organization, OrganizationContact
@@ -129,18 +128,6 @@ class RelatedInitiativeImageContentSerializer(ImageSerializer):
     relationship = 'relatedimage_set'
 
 
-class InitiativeMapSerializer(serializers.ModelSerializer):
-    # Use a standard serializer and tinypoint serializer to keep this request tiny
-    # No need to repeat `type` and `latitude`, `longitude` for every record.
-    position = TinyPointSerializer()
-
-    class Meta(object):
-        model = Initiative
-        fields = (
-            'id', 'title', 'slug', 'position',
-        )
-
-
 class InitiativeSerializer(NoCommitMixin, ModelSerializer):
     status = FSMField(read_only=True)
     image = ImageField(required=False, allow_null=True)
@@ -194,21 +181,30 @@ class InitiativeSerializer(NoCommitMixin, ModelSerializer):
                     Q(initiative__activity_managers=user)
                 ).filter(
                     ~Q(segments__closed=True) |
-                    Q(segments__in=user.segments.filter(closed=True))
+                    Q(segments__in=self.get_closed_segment_ids())
                 )
 
         return activities
 
+    def get_closed_segment_ids(self):
+        """
+        The closed segments of the current user, looked up once per request
+        """
+        if 'closed_segment_ids' not in self.context:
+            user = self.context['request'].user
+            self.context['closed_segment_ids'] = list(
+                user.segments.filter(closed=True).values_list('pk', flat=True)
+            ) if user.is_authenticated else []
+
+        return self.context['closed_segment_ids']
+
     def get_segments(self, instance):
-        segments = []
-        for activity in self.get_activities(instance):
-            for segment in activity.segments.all():
-                if segment not in segments:
-                    segments.append(segment)
-        return segments
+        return Segment.objects.filter(
+            activities__in=self.get_activities(instance).values('pk')
+        ).select_related('segment_type').distinct()
 
     def get_stats(self, obj):
-        return get_stats_for_activities(obj.activities)
+        return get_cached_stats_for_activities(obj, obj.activities)
 
     included_serializers = {
         'categories': 'bluebottle.initiatives.serializers.CategorySerializer',
@@ -0,0 +1,38 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from bluebottle.geo.models import Geolocation, Location
+from bluebottle.initiatives.map import (
+    invalidate as invalidate_map, remove_initiative, update_initiative
+)
+from bluebottle.initiatives.models import Initiative
+
+
+@receiver(post_save, sender=Initiative)
+def update_map_data(sender, instance, **kwargs):
+    # Only update the map once the change is committed, rolled back changes should not show up
+    transaction.on_commit(lambda: update_initiative(instance))
+
+
+@receiver(post_delete, sender=Initiative)
+def remove_map_data(sender, instance, **kwargs):
+    pk = instance.pk
+    transaction.on_commit(lambda: remove_initiative(pk))
+
+
+@receiver(post_save, sender=Geolocation)
+def update_map_data_position(sender, instance, created, **kwargs):
+    def update():
+        for initiative in Initiative.objects.filter(place=instance).select_related('place', 'location'):
+            update_initiative(initiative)
+
+    if not created:
+        transaction.on_commit(update)
+
+
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_map_data(sender, instance, **kwargs):
+    # Offices are used as fallback position, and decide whether (0, 0) is a valid position
+    transaction.on_commit(invalidate_map)
@@ -4,11 +4,13 @@ from builtins import str
 
 from django.contrib.auth.models import Group, Permission
 from django.contrib.gis.geos import Point
+from django.core.cache import cache
 from django.test import TestCase, tag
 from django.test.utils import override_settings
 from django.urls import reverse
 from django.utils.timezone import get_current_timezone, now
 from django_elasticsearch_dsl.test import ESTestCase
+from mock import patch
 from moneyed import Money
 from rest_framework import status
 
@@ -16,6 +18,7 @@ from bluebottle.collect.tests.factories import CollectActivityFactory, CollectCo
 from bluebottle.deeds.tests.factories import DeedFactory, DeedParticipantFactory
 from bluebottle.files.tests.factories import ImageFactory
 from bluebottle.funding.tests.factories import FundingFactory, DonorFactory
+from bluebottle.initiatives.map import get_map_key
 from bluebottle.initiatives.models import Initiative
 from bluebottle.initiatives.models import Theme
 from bluebottle.initiatives.tests.factories import InitiativeFactory
@@ -24,7 +27,7 @@ from bluebottle.segments.tests.factories import SegmentFactory
 from bluebottle.test.factory_models.accounts import BlueBottleUserFactory
 from bluebottle.test.factory_models.geo import GeolocationFactory, LocationFactory, CountryFactory
 from bluebottle.test.factory_models.projects import ThemeFactory
-from bluebottle.test.utils import JSONAPITestClient, BluebottleTestCase, APITestCase
+from bluebottle.test.utils import JSONAPITestClient, BluebottleTestCase, APITestCase, run_on_commit
 from bluebottle.time_based.tests.factories import (
     PeriodActivityFactory, DateActivityFactory, PeriodParticipantFactory, DateParticipantFactory,
     DateActivitySlotFactory
@@ -582,14 +585,26 @@ class InitiativeDetailAPITestCase(InitiativeAPITestCase):
         data = response.json()['data']
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(data['relationships']['activities']['data']), 3)
+        self.assertEqual(
+            set(segment['id'] for segment in data['relationships']['segments']['data']),
+            set([str(open_segment.pk), str(closed_segment.pk)])
+        )
         response = self.client.get(self.url, user=another_user)
         data = response.json()['data']
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(data['relationships']['activities']['data']), 1)
+        self.assertEqual(
+            [segment['id'] for segment in data['relationships']['segments']['data']],
+            [str(open_segment.pk)]
+        )
         response = self.client.get(self.url)
         data = response.json()['data']
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(data['relationships']['activities']['data']), 1)
+        self.assertEqual(
+            [segment['id'] for segment in data['relationships']['segments']['data']],
+            [str(open_segment.pk)]
+        )
 
     def test_deleted_activities(self):
         DateActivityFactory.create(initiative=self.initiative, status='deleted')
@@ -717,6 +732,50 @@ class InitiativeDetailAPITestCase(InitiativeAPITestCase):
             other_collect_activity.realized
         )
 
+    @override_settings(ACTIVITY_STATS_CACHE_TIMEOUT=60)
+    def test_get_stats_cached(self):
+        self.initiative.states.approve(save=True)
+
+        deed_activity = DeedFactory.create(
+            initiative=self.initiative,
+            start=datetime.date.today() - datetime.timedelta(days=10),
+            end=datetime.date.today() - datetime.timedelta(days=5)
+        )
+        deed_activity.states.submit(save=True)
+        deed_activity.states.succeed(save=True)
+        DeedParticipantFactory.create_batch(3, activity=deed_activity)
+
+        response = self.client.get(self.url, user=self.owner)
+        self.assertEqual(response.json()['data']['meta']['stats']['effort'], 3)
+
+        participant = DeedParticipantFactory.create(activity=deed_activity)
+        response = self.client.get(self.url, user=self.owner)
+        self.assertEqual(response.json()['data']['meta']['stats']['effort'], 4)
+
+        participant.states.withdraw(save=True)
+        response = self.client.get(self.url, user=self.owner)
+        self.assertEqual(response.json()['data']['meta']['stats']['effort'], 3)
+
+        period_activity = PeriodActivityFactory.create(
+            initiative=self.initiative,
+            start=datetime.date.today() - datetime.timedelta(weeks=2),
+            deadline=datetime.date.today() - datetime.timedelta(weeks=1),
+            registration_deadline=datetime.date.today() - datetime.timedelta(weeks=3)
+        )
+        period_activity.states.submit(save=True)
+        period_participant = PeriodParticipantFactory.create(activity=period_activity)
+
+        response = self.client.get(self.url, user=self.owner)
+        hours = response.json()['data']['meta']['stats']['hours']
+
+        contribution = period_participant.contributions.get()
+        self.assertEqual(contribution.status, 'succeeded')
+        contribution.value += datetime.timedelta(hours=2)
+        contribution.save()
+
+        response = self.client.get(self.url, user=self.owner)
+        self.assertEqual(response.json()['data']['meta']['stats']['hours'], hours + 2)
+
     def test_get_other(self):
         response = self.client.get(
             self.url,
@@ -1217,6 +1276,121 @@ class InitiativeReviewTransitionListAPITestCase(InitiativeAPITestCase):
         self.assertEqual(initiative.status, 'submitted')
 
 
+class InitiativeMapListAPITestCase(InitiativeAPITestCase):
+    def setUp(self):
+        super(InitiativeMapListAPITestCase, self).setUp()
+        self.url = reverse('initiative-map-list')
+
+        cache.delete(get_map_key())
+
+        self.amsterdam = InitiativeFactory.create_batch(
+            2, status='approved', place=GeolocationFactory.create(position=Point(4.9, 52.37))
+        )
+        self.new_york = InitiativeFactory.create(
+            status='approved', place=GeolocationFactory.create(position=Point(-74.0, 40.7))
+        )
+        InitiativeFactory.create(status='draft')
+
+    def test_get(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(len(data), 3)
+
+        row = [row for row in data if row['id'] == self.new_york.pk][0]
+        self.assertEqual(row, {
+            'id': self.new_york.pk,
+            'title': self.new_york.title,
+            'slug': self.new_york.slug,
+            'theme': self.new_york.theme_id,
+            'position': [40.7, -74.0],
+        })
+
+    def test_get_bbox(self):
+        response = self.client.get(self.url, {'bbox': '0,50,10,55'})
+
+        self.assertEqual(
+            set(row['id'] for row in response.json()),
+            set(initiative.pk for initiative in self.amsterdam)
+        )
+
+        response = self.client.get(self.url, {'bbox': '170,30,-60,45'})
+        self.assertEqual([row['id'] for row in response.json()], [self.new_york.pk])
+
+    def test_get_zoom(self):
+        response = self.client.get(self.url, {'zoom': 3})
+
+        data = response.json()
+        self.assertEqual(len(data), 2)
+
+        clusters = [row for row in data if 'count' in row]
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual(clusters[0]['count'], 2)
+        self.assertAlmostEqual(clusters[0]['position'][0], 52.37)
+
+        response = self.client.get(self.url, {'zoom': 18})
+        self.assertEqual(len(response.json()), 3)
+
+    def test_get_invalid(self):
+        response = self.client.get(self.url, {'bbox': '0,50,10'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.url, {'zoom': 'close'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(INITIATIVE_MAP_CACHE_TIMEOUT=60)
+    def test_get_updated(self):
+        self.assertEqual(len(self.client.get(self.url).json()), 3)
+
+        with patch('bluebottle.initiatives.map.build_map_data') as build_map_data:
+            with run_on_commit():
+                self.new_york.title = 'The Big Apple'
+                self.new_york.save()
+
+                self.new_york.place.position = Point(-73.9, 40.8)
+                self.new_york.place.save()
+
+                self.amsterdam[0].delete()
+
+            data = dict((row['id'], row) for row in self.client.get(self.url).json())
+
+            build_map_data.assert_not_called()
+
+        self.assertEqual(set(data.keys()), set([self.amsterdam[1].pk, self.new_york.pk]))
+        self.assertEqual(data[self.new_york.pk]['title'], 'The Big Apple')
+        self.assertEqual(data[self.new_york.pk]['position'], [40.8, -73.9])
+
+        cache.delete(get_map_key())
+
+    @override_settings(INITIATIVE_MAP_CACHE_TIMEOUT=60)
+    def test_get_added(self):
+        self.assertEqual(len(self.client.get(self.url).json()), 3)
+
+        with run_on_commit():
+            new = InitiativeFactory.create(
+                status='approved', place=GeolocationFactory.create(position=Point(2.35, 48.85))
+            )
+
+        data = dict((row['id'], row) for row in self.client.get(self.url).json())
+        self.assertEqual(len(data), 4)
+        self.assertEqual(data[new.pk]['position'], [48.85, 2.35])
+
+        cache.delete(get_map_key())
+
+    @override_settings(INITIATIVE_MAP_CACHE_TIMEOUT=60)
+    def test_get_not_committed(self):
+        self.assertEqual(len(self.client.get(self.url).json()), 3)
+
+        self.new_york.title = 'The Big Apple'
+        self.new_york.save()
+
+        data = dict((row['id'], row) for row in self.client.get(self.url).json())
+        self.assertNotEqual(data[self.new_york.pk]['title'], 'The Big Apple')
+
+        cache.delete(get_map_key())
+
+
 class InitiativeRedirectTest(TestCase):
     def setUp(self):
         super(InitiativeRedirectTest, self).setUp()
@@ -1,38 +1,41 @@
 from builtins import str
 import uuid
 from django.contrib.contenttypes.models import ContentType
-from django.contrib.gis.geos import Point
 
-from django.core.cache import cache
-from django.db import connection
 from rest_framework import generics
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework_json_api.views import AutoPrefetchMixin
 
 from bluebottle.files.views import ImageContentView
-from bluebottle.funding.models import Funding
-from bluebottle.files.models import RelatedImage
-from bluebottle.geo.models import Location
+from bluebottle.funding.models import Funding, FundingTotal
+from bluebottle.files.models import File, RelatedImage
+from bluebottle.activities.models import Activity
+from bluebottle.geo.models import Geolocation, Location
 from bluebottle.initiatives.filters import InitiativeSearchFilter
+from bluebottle.initiatives.map import cluster, get_map_data, in_bbox
 from bluebottle.initiatives.permissions import (
     InitiativeStatusPermission, InitiativeOwnerPermission
 )
 from bluebottle.initiatives.models import Initiative
 from bluebottle.initiatives.serializers import (
     InitiativeSerializer, InitiativeListSerializer, InitiativeReviewTransitionSerializer,
-    InitiativeMapSerializer, InitiativeRedirectSerializer,
+    InitiativeRedirectSerializer,
     RelatedInitiativeImageSerializer, ThemeSerializer
 )
 from bluebottle.initiatives.models import Theme
+from bluebottle.members.models import Member
+from bluebottle.organizations.models import Organization
+from bluebottle.segments.models import Segment
 from bluebottle.transitions.views import TransitionList
 from bluebottle.utils.permissions import (
     OneOf, ResourcePermission, ResourceOwnerPermission, TenantConditionalOpenClose
 )
 from bluebottle.utils.views import (
     ListCreateAPIView, RetrieveUpdateAPIView, JsonApiViewMixin,
-    CreateAPIView, ListAPIView, TranslatedApiViewMixin, RetrieveAPIView, NoPagination
+    CreateAPIView, ListAPIView, TranslatedApiViewMixin, RetrieveAPIView, NoPagination,
+    CachedResponseMixin, JsonApiCursorPagination
 )
 
 
@@ -55,6 +58,8 @@ class InitiativeList(JsonApiViewMixin, AutoPrefetchMixin, ListCreateAPIView):
         InitiativeSearchFilter,
     )
 
+    pagination_class = JsonApiCursorPagination
+
     filterset_fields = {
         'owner__id': ('exact', 'in',),
     }
@@ -87,31 +92,49 @@ class TinyProjectPagination(PageNumberPagination):
 
 
 class InitiativeMapList(generics.ListAPIView):
+    """
+    Compact map data of all approved initiatives.
+
+    Use `bbox` (`west,south,east,north`) to only get the initiatives on the visible part of
+    the map, and `zoom` to cluster initiatives that are close together at that zoom level.
+    """
     queryset = Initiative.objects
-    serializer_class = InitiativeMapSerializer
 
-    owner_filter_field = 'owner'
+    def get_bbox(self):
+        try:
+            bbox = [float(value) for value in self.request.query_params['bbox'].split(',')]
+        except KeyError:
+            return None
+        except ValueError:
+            raise ValidationError({'bbox': ['Invalid bounding box']})
 
-    def get_queryset(self):
-        queryset = super(InitiativeMapList, self).get_queryset()
-        queryset = queryset.filter(status='approved').all()
-        if not Location.objects.count():
-            # Skip initiatives without proper location
-            queryset = queryset.exclude(place__position=Point(0, 0))
-        return queryset
+        if len(bbox) != 4:
+            raise ValidationError({'bbox': ['Invalid bounding box']})
+
+        return bbox
+
+    def get_zoom(self):
+        try:
+            return max(0, int(self.request.query_params['zoom']))
+        except KeyError:
+            return None
+        except ValueError:
+            raise ValidationError({'zoom': ['Invalid zoom level']})
 
     def list(self, request, *args, **kwargs):
-        cache_key = '{}.initiative_map_data'.format(connection.tenant.schema_name)
-        data = cache.get(cache_key)
-        if not data:
-            queryset = self.get_queryset().order_by('created')
-            serializer = self.get_serializer(queryset, many=True)
-            data = serializer.data
-            cache.set(cache_key, data)
-        return Response(data)
+        bbox = self.get_bbox()
+        zoom = self.get_zoom()
 
+        data = get_map_data().values()
+        if bbox:
+            data = [row for row in data if in_bbox(row, bbox)]
+        if zoom is not None:
+            data = cluster(data, zoom)
 
-class InitiativeDetail(JsonApiViewMixin, AutoPrefetchMixin, RetrieveUpdateAPIView):
+        return Response(list(data))
+
+
+class InitiativeDetail(CachedResponseMixin, JsonApiViewMixin, AutoPrefetchMixin, RetrieveUpdateAPIView):
     queryset = Initiative.objects.select_related(
         'owner', 'reviewer', 'promoter', 'place', 'location',
         'organization', 'organization_contact',
@@ -121,6 +144,11 @@ class InitiativeDetail(JsonApiViewMixin, AutoPrefetchMixin, RetrieveUpdateAPIVie
 
     serializer_class = InitiativeSerializer
 
+    cache_models = (
+        Initiative, Activity, Theme, Location, Geolocation, Organization, Member, File,
+        RelatedImage, Segment, Funding, FundingTotal,
+    )
+
     permission_classes = (
         InitiativeStatusPermission,
         OneOf(ResourcePermission, InitiativeOwnerPermission),
@@ -171,12 +199,14 @@ class InitiativeReviewTransitionList(TransitionList):
     queryset = Initiative.objects.all()
 
 
-class ThemeList(TranslatedApiViewMixin, JsonApiViewMixin, ListAPIView):
+class ThemeList(CachedResponseMixin, TranslatedApiViewMixin, JsonApiViewMixin, ListAPIView):
     serializer_class = ThemeSerializer
     queryset = Theme.objects.filter(disabled=False)
     permission_classes = [TenantConditionalOpenClose, ]
     pagination_class = NoPagination
 
+    cache_models = (Theme, )
+
     def get_queryset(self):
         return super().get_queryset().order_by('translations__name')
 
@@ -0,0 +1,29 @@
+# Generated by Django 2.2.24 on 2022-03-10 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0056_merge_20220301_1627'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='member',
+            name='remote_id',
+            field=models.CharField(blank=True, db_index=True, max_length=75, null=True, verbose_name='remote_id'),
+        ),
+        migrations.AlterField(
+            model_name='member',
+            name='scim_external_id',
+            field=models.CharField(blank=True, db_index=True, max_length=75, null=True, verbose_name='external SCIM id'),
+        ),
+        # Used by case insensitive lookups (`iexact`, `istartswith`) on email, e.g. in SCIM filters
+        migrations.RunSQL(
+            'CREATE INDEX members_member_email_upper_like '
+            'ON members_member (UPPER(email::text) text_pattern_ops);',
+            'DROP INDEX IF EXISTS members_member_email_upper_like;'
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 2.2.24 on 2022-03-14 09:41
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0057_scim_filter_indexes'),
+    ]
+
+    operations = [
+        # Keep the oldest row of duplicates, verified if any of them is
+        migrations.RunSQL(
+            '''
+            UPDATE members_usersegment AS a SET verified = TRUE
+            FROM members_usersegment AS b
+            WHERE a.member_id = b.member_id AND a.segment_id = b.segment_id
+            AND a.id < b.id AND b.verified;
+
+            DELETE FROM members_usersegment AS a
+            USING members_usersegment AS b
+            WHERE a.member_id = b.member_id AND a.segment_id = b.segment_id
+            AND a.id > b.id;
+            ''',
+            migrations.RunSQL.noop
+        ),
+        migrations.AlterUniqueTogether(
+            name='usersegment',
+            unique_together={('member', 'segment')},
+        ),
+    ]
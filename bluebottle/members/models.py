@@ -117,14 +117,16 @@ class Member(BlueBottleBaseUser):
     remote_id = models.CharField(_('remote_id'),
                                  max_length=75,
                                  blank=True,
-                                 null=True)
+                                 null=True,
+                                 db_index=True)
     last_logout = models.DateTimeField(_('Last Logout'), blank=True, null=True)
 
     scim_external_id = models.CharField(
         _('external SCIM id'),
         max_length=75,
         blank=True,
-        null=True
+        null=True,
+        db_index=True
     )
 
     place = models.ForeignKey(Place, null=True, blank=True, on_delete=models.SET_NULL)
@@ -223,6 +225,9 @@ class UserSegment(models.Model):
     segment = models.ForeignKey('segments.segment', on_delete=models.CASCADE)
     verified = models.BooleanField(default=False)
 
+    class Meta(object):
+        unique_together = (('member', 'segment'), )
+
 
 class UserActivity(models.Model):
 
@@ -22,6 +22,10 @@ def member_created_groups(sender, instance, created, **kwargs):
             logger.error('Group \'{}\' could not be found'.format('Authenticated'))
 
 
+# Activities that get the segments of their owner
+OPEN_ACTIVITY_STATUSES = ('draft', 'needs_work', 'submitted', 'open', 'running', 'full', )
+
+
 @receiver(m2m_changed, sender=Member.segments.through)
 def segments_changed(sender, instance, action, pk_set, *args, **kwargs):
     """
@@ -30,17 +34,16 @@ def segments_changed(sender, instance, action, pk_set, *args, **kwargs):
     All closed or succeeded activities remain untouched, so that historical data
     will stay accurate.
     """
-    open_statuses = ('draft', 'needs_work', 'submitted', 'open', 'running', 'full', )
     if action == 'post_add':
         for activity in instance.activities.filter(
-            status__in=open_statuses
+            status__in=OPEN_ACTIVITY_STATUSES
         ):
             for pk in pk_set:
                 activity.segments.add(pk)
 
     if action == 'post_remove':
         for activity in instance.activities.filter(
-            status__in=open_statuses
+            status__in=OPEN_ACTIVITY_STATUSES
         ):
             for pk in pk_set:
                 activity.segments.remove(pk)
@@ -179,9 +179,12 @@ class TransitionMessage(object):
     def get_bcc_addresses(self):
         return []
 
-    def compose_and_send(self, **base_context):
+    def compose(self, **base_context):
         for message in self.get_messages(**base_context):
-            context = self.get_context(message.recipient, **base_context)
+            yield message, self.get_context(message.recipient, **base_context)
+
+    def compose_and_send(self, **base_context):
+        for message, context in self.compose(**base_context):
             message.save()
             message.send(**context)
 
@@ -199,6 +202,27 @@ class TransitionMessage(object):
         )
 
 
+def bulk_send(notifications):
+    """
+    Compose the messages for a list of (notification, context) tuples, save them
+    with a single query and send them.
+    """
+    composed = []
+    for notification, base_context in notifications:
+        try:
+            composed += list(notification.compose(**base_context))
+        except Exception as e:
+            logger.error(e)
+
+    Message.objects.bulk_create([message for message, context in composed])
+
+    for message, context in composed:
+        try:
+            message.send(**context)
+        except Exception as e:
+            logger.error(e)
+
+
 @shared_task
 def compose_and_send(message, tenant):
     from bluebottle.clients.utils import LocalTenant
@@ -0,0 +1,184 @@
+import atexit
+import threading
+import time
+from collections import Counter
+from uuid import uuid4
+
+import regex
+
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.db.models import Case, F, IntegerField, Value, When
+
+from bluebottle.redirects.models import Redirect
+
+# Pending hits are written to the database once this many hits or seconds have passed
+FLUSH_THRESHOLD = 100
+FLUSH_INTERVAL = 60
+
+
+class RedirectTable(object):
+    """
+    All redirects for a tenant, compiled for fast matching.
+
+    Plain redirects are stored in a dict keyed by their path. Regular expression redirects
+    are compiled once, and combined in one pattern that is used to quickly rule out
+    paths that do not match any of them.
+
+    `redirects` should be in the order they are tried in, when more than one matches the
+    first one wins.
+    """
+
+    def __init__(self, redirects):
+        self.paths = {}
+        self.patterns = []
+
+        for position, redirect in enumerate(redirects):
+            self.paths.setdefault(redirect.old_path, (position, redirect))
+
+            if redirect.regular_expression:
+                try:
+                    pattern = regex.compile(redirect.old_path, regex.IGNORECASE)
+                except regex.error:
+                    # old_path does not compile into regex, ignore it
+                    continue
+
+                self.patterns.append((redirect, pattern))
+
+        try:
+            # A branch reset group keeps the group numbers of every alternative intact
+            self.combined = regex.compile(
+                '(?|{})'.format('|'.join(
+                    '(?:{})'.format(redirect.old_path) for redirect, pattern in self.patterns
+                ))
+            ) if self.patterns else None
+        except regex.error:
+            self.combined = None
+
+    def match_path(self, full_path, slashed_full_path=None):
+        matches = [
+            self.paths[path] for path in (full_path, slashed_full_path)
+            if path and path in self.paths
+        ]
+
+        if matches:
+            _position, redirect = min(matches, key=lambda match: match[0])
+            return redirect, redirect.new_path
+
+    def match_pattern(self, full_path):
+        if not self.patterns or (self.combined and not self.combined.match(full_path)):
+            return
+
+        for redirect, pattern in self.patterns:
+            if regex.match(redirect.old_path, full_path):
+                # Convert $1 into \1 (otherwise users would have
+                # to enter \1 via the admin which would have to be escaped)
+                new_path = redirect.new_path.replace('$', '\\')
+                return redirect, regex.sub(pattern, new_path, full_path)
+
+    def match(self, full_path, slashed_full_path=None):
+        return self.match_path(full_path, slashed_full_path) or self.match_pattern(full_path)
+
+
+_tables = {}
+
+
+def get_version_key():
+    return '{}.redirects_version'.format(connection.tenant.schema_name)
+
+
+def invalidate_redirects():
+    cache.set(get_version_key(), uuid4().hex, None)
+
+
+def get_redirect_table():
+    """
+    Return the compiled redirects for the current tenant.
+
+    The table is kept in process, and rebuilt when the version in the shared cache changes.
+    """
+    version = cache.get(get_version_key())
+    if version is None:
+        version = uuid4().hex
+        cache.set(get_version_key(), version, None)
+
+    schema_name = connection.tenant.schema_name
+    cached_version, table = _tables.get(schema_name, (None, None))
+
+    if cached_version != version:
+        table = RedirectTable(Redirect.objects.order_by('fallback_redirect', 'id'))
+        _tables[schema_name] = (version, table)
+
+    return table
+
+
+class HitCounter(object):
+    """
+    Keep track of the number of times a redirect was used, and write them to the database
+    with a single query every FLUSH_INTERVAL seconds or FLUSH_THRESHOLD hits.
+
+    The middleware checks if the hits are due on every response, and the hits that are still
+    pending when the process exits are written by `flush_all`.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hits = {}
+        self.last_flush = {}
+
+    def add(self, redirect):
+        schema_name = connection.tenant.schema_name
+
+        with self.lock:
+            self.hits.setdefault(schema_name, Counter())[redirect.pk] += 1
+            self.last_flush.setdefault(schema_name, time.time())
+
+        self.flush_if_due()
+
+    def flush_if_due(self):
+        schema_name = connection.tenant.schema_name
+
+        with self.lock:
+            pending = sum(self.hits.get(schema_name, {}).values())
+            last_flush = self.last_flush.get(schema_name, time.time())
+
+        if pending and (pending >= FLUSH_THRESHOLD or time.time() - last_flush > FLUSH_INTERVAL):
+            self.flush()
+
+    def flush(self, schema_name=None):
+        schema_name = schema_name or connection.tenant.schema_name
+
+        with self.lock:
+            hits = self.hits.pop(schema_name, None)
+            self.last_flush[schema_name] = time.time()
+
+        if hits:
+            Redirect.objects.filter(pk__in=hits.keys()).update(
+                nr_times_visited=F('nr_times_visited') + Case(
+                    *[When(pk=pk, then=Value(count)) for pk, count in hits.items()],
+                    output_field=IntegerField()
+                )
+            )
+
+    def flush_all(self):
+        """
+        Write the pending hits of all tenants
+        """
+        with self.lock:
+            schema_names = [schema_name for schema_name, hits in self.hits.items() if hits]
+
+        for schema_name in schema_names:
+            connection.set_schema(schema_name)
+            self.flush(schema_name)
+
+
+hit_counter = HitCounter()
+
+
+@atexit.register
+def flush_at_exit():
+    try:
+        hit_counter.flush_all()
+    except DatabaseError:
+        # The database is not available anymore, the pending hits are lost
+        pass
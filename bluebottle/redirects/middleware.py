@@ -1,13 +1,11 @@
 from __future__ import unicode_literals
 
-import regex
-
 from django import http
 from django.conf import settings
 from django.db import connection
 from django.utils.deprecation import MiddlewareMixin
 
-from bluebottle.redirects.models import Redirect
+from bluebottle.redirects.matcher import get_redirect_table, hit_counter
 from bluebottle.utils.models import get_default_language, get_languages
 
 
@@ -20,14 +18,17 @@ class RedirectFallbackMiddleware(MiddlewareMixin):
     """
 
     def process_response(self, request, response):
-        if response.status_code != 404:
-            # No need to check for a redirect for non-404 responses.
-            return response
-
         if connection.tenant.schema_name == 'public':
             # No tenant selected
             return response
 
+        # Write the counted hits, also when no redirects are hit for a while
+        hit_counter.flush_if_due()
+
+        if response.status_code != 404:
+            # No need to check for a redirect for non-404 responses.
+            return response
+
         full_path = request.get_full_path()
         http_host = request.META.get('HTTP_HOST', '')
 
@@ -65,46 +66,17 @@ class RedirectFallbackMiddleware(MiddlewareMixin):
                 return new_path
             return http_host + '/' + language + new_path
 
-        redirects = Redirect.objects.all().order_by('fallback_redirect')
-        for redirect in redirects:
-            # Attempt a regular match
-            if redirect.old_path == full_path:
-                redirect.nr_times_visited += 1
-                redirect.save()
-                return http.HttpResponsePermanentRedirect(
-                    redirect_target(redirect.new_path))
-
-            if settings.APPEND_SLASH and not request.path.endswith('/'):
-                # Try appending a trailing slash.
-                path_len = len(request.path)
-                slashed_full_path = full_path[:path_len] + '/' + full_path[path_len:]
-
-                if redirect.old_path == slashed_full_path:
-                    redirect.nr_times_visited += 1
-                    redirect.save()
-                    return http.HttpResponsePermanentRedirect(
-                        redirect_target(redirect.new_path))
-
-        # Attempt all regular expression redirects
-        reg_redirects = Redirect.objects.filter(
-            regular_expression=True).order_by('fallback_redirect')
-        for redirect in reg_redirects:
-            try:
-                old_path = regex.compile(redirect.old_path, regex.IGNORECASE)
-            except regex.error:
-                # old_path does not compile into regex,
-                # ignore it and move on to the next one
-                continue
-
-            if regex.match(redirect.old_path, full_path):
-                # Convert $1 into \1 (otherwise users would have
-                # to enter \1 via the admin which would have to be escaped)
-                new_path = redirect.new_path.replace('$', '\\')
-                replaced_path = regex.sub(old_path, new_path, full_path)
-                redirect.nr_times_visited += 1
-                redirect.save()
-                return http.HttpResponsePermanentRedirect(
-                    redirect_target(replaced_path))
+        slashed_full_path = None
+        if settings.APPEND_SLASH and not request.path.endswith('/'):
+            # Try appending a trailing slash.
+            path_len = len(request.path)
+            slashed_full_path = full_path[:path_len] + '/' + full_path[path_len:]
+
+        match = get_redirect_table().match(full_path, slashed_full_path)
+        if match:
+            redirect, new_path = match
+            hit_counter.add(redirect)
+            return http.HttpResponsePermanentRedirect(redirect_target(new_path))
 
         # No redirect was found. Return the response.
         return response
@@ -1,5 +1,7 @@
 from builtins import object
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 
 
@@ -43,3 +45,10 @@ class Redirect(models.Model):
 
     def __str__(self):
         return "%s ---> %s" % (self.old_path, self.new_path)
+
+
+@receiver([post_save, post_delete], sender=Redirect)
+def invalidate_redirects(sender, instance, **kwargs):
+    from bluebottle.redirects.matcher import invalidate_redirects
+
+    invalidate_redirects()
@@ -1,10 +1,14 @@
+import time
+
 from django.conf import settings
+from django.db import connection
 from bluebottle.test.utils import BluebottleTestCase
 from django.test.utils import override_settings
 from django.utils import translation
 
 from bluebottle.utils.models import Language
 
+from bluebottle.redirects.matcher import FLUSH_INTERVAL, hit_counter
 from bluebottle.redirects.models import Redirect
 
 
@@ -70,9 +74,67 @@ class RedirectTests(BluebottleTestCase):
                              '{0}{1}'.format(self.test_url,
                                              '/en/my/news/foobar/'),
                              status_code=301, target_status_code=200)
+        hit_counter.flush()
         redirect = Redirect.objects.get(regular_expression=True)
         self.assertEqual(redirect.nr_times_visited, 1)
 
+    def test_regular_expression_no_match(self):
+        Redirect.objects.create(
+            old_path='/news/index/(\d+)/(.*)/',
+            new_path='/my/news/$2/',
+            regular_expression=True)
+        response = self.client.get('/news/index/foobar/')
+        self.assertEqual(response.status_code, 404)
+
+    def test_hits_flushed_in_one_go(self):
+        first = Redirect.objects.create(old_path='/initial', new_path='/new_target/')
+        second = Redirect.objects.create(old_path='/projects/other', new_path='/new_target/')
+
+        for path in ['/initial', '/initial', '/projects/other']:
+            self.client.get(path)
+
+        first.refresh_from_db()
+        self.assertEqual(first.nr_times_visited, 0)
+
+        with self.assertNumQueries(1):
+            hit_counter.flush()
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.nr_times_visited, 2)
+        self.assertEqual(second.nr_times_visited, 1)
+
+    def test_hits_flushed_after_interval(self):
+        hit_counter.flush()
+        redirect = Redirect.objects.create(old_path='/initial', new_path='/new_target/')
+        self.client.get('/initial')
+
+        hit_counter.flush_if_due()
+        redirect.refresh_from_db()
+        self.assertEqual(redirect.nr_times_visited, 0)
+
+        hit_counter.last_flush[connection.tenant.schema_name] = time.time() - FLUSH_INTERVAL - 1
+
+        hit_counter.flush_if_due()
+        redirect.refresh_from_db()
+        self.assertEqual(redirect.nr_times_visited, 1)
+
+    def test_hits_flushed_all(self):
+        redirect = Redirect.objects.create(old_path='/initial', new_path='/new_target/')
+        self.client.get('/initial')
+
+        hit_counter.flush_all()
+
+        redirect.refresh_from_db()
+        self.assertEqual(redirect.nr_times_visited, 1)
+
+    def test_deleted_redirect(self):
+        redirect = Redirect.objects.create(old_path='/initial', new_path='/new_target/')
+        self.assertEqual(self.client.get('/initial').status_code, 301)
+
+        redirect.delete()
+        self.assertEqual(self.client.get('/initial').status_code, 404)
+
     def test_fallback_redirects(self):
         """
         Ensure redirects with fallback_redirect set are the last evaluated
@@ -126,6 +188,25 @@ class RedirectTests(BluebottleTestCase):
                              '{0}{1}'.format(self.test_url, '/en/my/project/foo/details/'),
                              status_code=301, target_status_code=200)
 
+    def test_regular_expression_order(self):
+        """
+        Ensure redirects that match equally are tried in the order they were created
+        """
+        Redirect.objects.create(
+            old_path='/project/b(.*)',
+            new_path='/first/',
+            regular_expression=True)
+
+        Redirect.objects.create(
+            old_path='/project/(.*)',
+            new_path='/second/',
+            regular_expression=True)
+
+        response = self.client.get('/project/bar')
+        self.assertRedirects(response,
+                             '{0}{1}'.format(self.test_url, '/en/first/'),
+                             status_code=301, target_status_code=200)
+
     def test_redirect_external_http(self):
         Redirect.objects.create(
             old_path='/external_http', new_path='http://example.com')
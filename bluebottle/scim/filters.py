@@ -1,27 +1,120 @@
+import re
+
+from django.db.models import Q
 from rest_framework import filters
 from rest_framework.exceptions import ValidationError
 
+TOKEN_RE = re.compile(r'\s*(\(|\)|"(?:[^"\\]|\\.)*"|[^\s()]+)')
+
 
 class SCIMFilter(filters.SearchFilter):
+    """
+    Filter on `attribute op value` expressions, combined with `and`, `or` and parentheses.
+
+    Supported operators are `eq`, `co` and `sw`. Attributes are mapped to model fields with
+    `field_mapping` (or `scim_filter_mapping` on the view), and fields in
+    `case_insensitive_fields` are compared case insensitively. The mapped fields are indexed
+    for `eq` and `sw`, but `co` becomes a `LIKE '%value%'` that can not use those indexes and
+    scans the table.
+    """
     field_mapping = {
-        'userName': 'remote_id',
-        'externalId': 'scim_external_id',
+        'username': 'remote_id',
+        'externalid': 'scim_external_id',
+        'emails': 'email',
+        'emails.value': 'email',
     }
 
-    def filter_queryset(self, request, queryset, view):
-        if 'filter' not in request.query_params:
-            return queryset
+    case_insensitive_fields = ('email', )
+
+    lookups = {
+        'eq': 'exact',
+        'co': 'contains',
+        'sw': 'startswith',
+    }
+
+    def tokenize(self, filter):
+        tokens = []
+        position = 0
+        filter = filter.strip()
+
+        while position < len(filter):
+            match = TOKEN_RE.match(filter, position)
+            if not match:
+                raise ValidationError(f'Unsupported filter: {filter}')
+
+            tokens.append(match.group(1))
+            position = match.end()
+
+        return tokens
+
+    def parse_value(self, value):
+        if value.startswith('"'):
+            return re.sub(r'\\(.)', r'\1', value[1:-1])
+
+        return value
+
+    def parse_comparison(self, tokens, mapping):
+        try:
+            attribute, operator, value = tokens.pop(0), tokens.pop(0).lower(), tokens.pop(0)
+
+            field = mapping[attribute.lower()]
+            lookup = self.lookups[operator]
+        except (IndexError, KeyError):
+            raise ValidationError('Unsupported filter')
+
+        if field in self.case_insensitive_fields:
+            lookup = 'i' + lookup
 
-        filter = request.query_params['filter']
+        return Q(**{'{}__{}'.format(field, lookup): self.parse_value(value)})
 
+    def parse_term(self, tokens, mapping):
+        if tokens and tokens[0] == '(':
+            tokens.pop(0)
+            result = self.parse_expression(tokens, mapping)
+
+            if not tokens or tokens.pop(0) != ')':
+                raise ValidationError('Unsupported filter')
+
+            return result
+
+        return self.parse_comparison(tokens, mapping)
+
+    def parse_and(self, tokens, mapping):
+        result = self.parse_term(tokens, mapping)
+
+        while tokens and tokens[0].lower() == 'and':
+            tokens.pop(0)
+            result &= self.parse_term(tokens, mapping)
+
+        return result
+
+    def parse_expression(self, tokens, mapping):
+        result = self.parse_and(tokens, mapping)
+
+        while tokens and tokens[0].lower() == 'or':
+            tokens.pop(0)
+            result |= self.parse_and(tokens, mapping)
+
+        return result
+
+    def get_filter(self, filter, view=None):
+        mapping = getattr(view, 'scim_filter_mapping', self.field_mapping)
+
+        tokens = self.tokenize(filter)
         try:
-            field, value = filter.split(' eq ')
-            mapped_filter = {
-                self.field_mapping[field]: value
-            }
-        except (ValueError, KeyError):
+            result = self.parse_expression(tokens, mapping)
+        except ValidationError:
             raise ValidationError(f'Unsupported filter: {filter}')
 
+        if tokens:
+            raise ValidationError(f'Unsupported filter: {filter}')
+
+        return result
+
+    def filter_queryset(self, request, queryset, view):
+        if 'filter' not in request.query_params:
+            return queryset
+
         return queryset.filter(
-            **mapped_filter
+            self.get_filter(request.query_params['filter'], view)
         )
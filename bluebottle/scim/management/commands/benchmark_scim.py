@@ -0,0 +1,134 @@
+import time
+import uuid
+
+from django.contrib.auth.models import Group
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from bluebottle.clients.models import Client
+from bluebottle.clients.utils import LocalTenant
+from bluebottle.members.models import Member
+from bluebottle.scim.models import SCIMPlatformSettings
+from bluebottle.scim.views import BulkView, GroupDetailView, UserListView
+
+
+class Command(BaseCommand):
+    help = (
+        'Time provisioning users one request at a time and with a single bulk request, '
+        'replacing group members with PUT and adding them with PATCH, and filtering users. '
+        'All changes are rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tenant', type=str, required=True,
+            help='The schema name of the tenant to run the benchmark on.'
+        )
+        parser.add_argument(
+            '--users', type=int, default=100,
+            help='The number of users to provision.'
+        )
+
+    def get_user_data(self):
+        email = '{}@example.com'.format(uuid.uuid4())
+        return {
+            'schemas': ['urn:ietf:params:scim:schemas:core:2.0:User'],
+            'externalId': email,
+            'userName': email,
+            'active': True,
+            'emails': [{'type': 'work', 'primary': True, 'value': email}],
+            'name': {'givenName': 'Benchmark', 'familyName': 'User'}
+        }
+
+    def request(self, method, view, url, data=None, **kwargs):
+        request = getattr(APIRequestFactory(), method)(
+            url, data, format='json', HTTP_AUTHORIZATION=self.token
+        )
+        response = view(request, **kwargs)
+        response.render()
+
+        if response.status_code >= 400:
+            raise CommandError('Request failed: {}'.format(response.content))
+
+        return response
+
+    def measure(self, name, requests):
+        with CaptureQueriesContext(connection) as queries:
+            start = time.time()
+            for request in requests:
+                request()
+            duration = time.time() - start
+
+        self.stdout.write(
+            '{}: {:.3f}s, {} queries'.format(name, duration, len(queries))
+        )
+
+    def run(self, size):
+        user_list = UserListView.as_view()
+        self.measure(
+            '{} POST requests'.format(size),
+            [
+                lambda: self.request('post', user_list, '/Users', self.get_user_data())
+                for _index in range(size)
+            ]
+        )
+
+        bulk_data = {
+            'schemas': ['urn:ietf:params:scim:api:messages:2.0:BulkRequest'],
+            'Operations': [
+                {'method': 'POST', 'path': '/Users', 'data': self.get_user_data()}
+                for _index in range(size)
+            ]
+        }
+        self.measure(
+            '1 bulk request with {} operations'.format(size),
+            [lambda: self.request('post', BulkView.as_view(), '/Bulk', bulk_data)]
+        )
+
+        group = Group.objects.create(name='SCIM benchmark {}'.format(uuid.uuid4()))
+        group_detail = GroupDetailView.as_view()
+        members = [
+            {'value': 'goodup-user-{}'.format(pk)}
+            for pk in Member.objects.filter(
+                is_superuser=False, is_anonymized=False
+            ).values_list('pk', flat=True)[:size]
+        ]
+
+        self.request('put', group_detail, '/Groups', {'members': members[:-1]}, pk=group.pk)
+        self.measure(
+            'PUT group with {} members'.format(len(members)),
+            [lambda: self.request('put', group_detail, '/Groups', {'members': members}, pk=group.pk)]
+        )
+
+        patch_data = {
+            'schemas': ['urn:ietf:params:scim:api:messages:2.0:PatchOp'],
+            'Operations': [{'op': 'add', 'path': 'members', 'value': members[-1:]}]
+        }
+        self.request('patch', group_detail, '/Groups', {
+            'Operations': [{'op': 'remove', 'path': 'members', 'value': members[-1:]}]
+        }, pk=group.pk)
+        self.measure(
+            'PATCH group, adding 1 member',
+            [lambda: self.request('patch', group_detail, '/Groups', patch_data, pk=group.pk)]
+        )
+
+        for query in ('emails eq "benchmark@example.com"', 'emails sw "bench"'):
+            self.measure(
+                'Filter users on `{}`'.format(query),
+                [lambda: self.request('get', user_list, '/Users', {'filter': query})]
+            )
+
+    def handle(self, *args, **options):
+        try:
+            client = Client.objects.get(schema_name=options['tenant'])
+        except Client.DoesNotExist:
+            raise CommandError('Unknown tenant: {}'.format(options['tenant']))
+
+        with LocalTenant(client, clear_tenant=True):
+            self.token = 'Bearer {}'.format(SCIMPlatformSettings.objects.get().bearer_token)
+
+            with transaction.atomic():
+                self.run(options['users'])
+                transaction.set_rollback(True)
@@ -4,15 +4,15 @@ SERVICE_PROVIDER_CONFIG = {
     "schemas":
     ["urn:ietf:params:scim:schemas:core:2.0:ServiceProviderConfig"],
     "patch": {
-        "supported": False
+        "supported": True
         },
     "bulk": {
-        "supported": False,
-        "maxOperations": 0,
-        "maxPayloadSize": 0,
+        "supported": True,
+        "maxOperations": 1000,
+        "maxPayloadSize": 1048576,
         },
     "filter": {
-        "supported": False,
+        "supported": True,
         "maxResults": 1000
         },
     "changePassword": {
@@ -1,3 +1,4 @@
+import re
 from builtins import object
 from django.contrib.auth.models import Group
 from django.urls import reverse
@@ -8,6 +9,26 @@ from rest_framework import serializers, validators
 
 from bluebottle.members.models import Member
 
+# `members[value eq "goodup-user-1"]`
+MEMBER_PATH_RE = re.compile(r'^members\[value eq "?(?P<value>[^"\]]+)"?\]$', re.IGNORECASE)
+
+# Attributes that are sent along with group patches, but that cannot be changed
+PATCH_IGNORED_PATHS = ('id', 'displayname', 'externalid', )
+
+
+def get_member_ids(ids):
+    """
+    Return the ids of the existing members in `ids`, ignoring invalid ids
+    """
+    valid_ids = []
+    for pk in ids:
+        try:
+            valid_ids.append(int(pk))
+        except (TypeError, ValueError):
+            pass
+
+    return list(Member.objects.filter(pk__in=valid_ids).values_list('pk', flat=True))
+
 
 class NonNestedSerializer(serializers.Serializer):
     def __init__(self, *args, **kwargs):
@@ -196,17 +217,85 @@ class SCIMGroupSerializer(serializers.ModelSerializer):
 
     def update(self, obj, data):
         members = data.pop('user_set')
-        obj.user_set.clear()
-        for member in members:
-            try:
-                user = Member.objects.get(pk=member['pk'])
-                obj.user_set.add(user)
-                if obj.name == 'Staff':
-                    user.is_staff = True
-                    user.save()
-            except Member.DoesNotExist:
-                pass
-            except ValueError:
-                pass
+        user_ids = get_member_ids(member['pk'] for member in members)
+
+        obj.user_set.set(user_ids)
+        if obj.name == 'Staff':
+            Member.objects.filter(pk__in=user_ids).update(is_staff=True)
 
         return super(SCIMGroupSerializer, self).update(obj, data)
+
+    def patch(self, obj, operations):
+        """
+        Apply the operations of a PatchOp request to the members of `obj`
+        """
+        for operation in operations:
+            op, path, value = operation['op'], operation.get('path'), operation.get('value')
+
+            if not path:
+                # The changed attributes are in the value, e.g. `{"members": [...]}`
+                if not isinstance(value, dict) or 'members' not in value:
+                    continue
+                path, value = 'members', value['members']
+
+            match = MEMBER_PATH_RE.match(path)
+            if match:
+                values = [match.group('value')]
+            elif path.lower() == 'members':
+                values = [member.get('value') for member in value or [] if isinstance(member, dict)]
+            elif path.lower() in PATCH_IGNORED_PATHS:
+                continue
+            else:
+                raise serializers.ValidationError(
+                    {'path': ['Unsupported path: {}'.format(path)]}, code='invalidPath'
+                )
+
+            user_ids = get_member_ids(
+                str(value).replace('goodup-user-', '') for value in values if value
+            )
+
+            if op == 'add':
+                obj.user_set.add(*user_ids)
+                if obj.name == 'Staff':
+                    Member.objects.filter(pk__in=user_ids).update(is_staff=True)
+            elif op == 'remove' and not match and not value:
+                obj.user_set.clear()
+            elif op == 'remove':
+                obj.user_set.remove(*user_ids)
+            elif op == 'replace':
+                obj.user_set.set(user_ids)
+                if obj.name == 'Staff':
+                    Member.objects.filter(pk__in=user_ids).update(is_staff=True)
+
+        return obj
+
+
+class PatchOperationSerializer(serializers.Serializer):
+    op = serializers.ChoiceField(choices=('add', 'remove', 'replace'))
+    path = serializers.CharField(required=False)
+    value = serializers.JSONField(required=False)
+
+    def to_internal_value(self, data):
+        # Some identity providers send `Add` and `Replace`
+        if isinstance(data, dict) and isinstance(data.get('op'), str):
+            data = dict(data, op=data['op'].lower())
+
+        return super(PatchOperationSerializer, self).to_internal_value(data)
+
+
+class SCIMPatchSerializer(serializers.Serializer):
+    schemas = serializers.ListField(child=serializers.CharField(), required=False)
+    Operations = PatchOperationSerializer(many=True)
+
+
+class BulkOperationSerializer(serializers.Serializer):
+    method = serializers.ChoiceField(choices=('POST', 'PUT', 'PATCH', 'DELETE'))
+    bulkId = serializers.CharField(required=False)
+    path = serializers.CharField()
+    data = serializers.JSONField(required=False)
+
+
+class SCIMBulkSerializer(serializers.Serializer):
+    schemas = serializers.ListField(child=serializers.CharField(), required=False)
+    failOnErrors = serializers.IntegerField(required=False, min_value=1)
+    Operations = BulkOperationSerializer(many=True)
@@ -94,10 +94,13 @@ class SCIMServiceProviderConfigViewTest(SCIMEndpointTestCaseMixin, BluebottleTes
         data = response.data
         self.assertEqual(response.status_code, 200)
         self.assertEqual(
-            data['bulk']['supported'], False
+            data['bulk']['supported'], True
         )
         self.assertEqual(
-            data['filter']['supported'], False
+            data['bulk']['maxOperations'], 1000
+        )
+        self.assertEqual(
+            data['filter']['supported'], True
         )
         self.assertEqual(
             data['etag']['supported'], False
@@ -106,7 +109,7 @@ class SCIMServiceProviderConfigViewTest(SCIMEndpointTestCaseMixin, BluebottleTes
             data['sort']['supported'], False
         )
         self.assertEqual(
-            data['patch']['supported'], False
+            data['patch']['supported'], True
         )
         self.assertEqual(
             data['changePassword']['supported'], False
@@ -326,6 +329,37 @@ class SCIMUserListTest(AuthenticatedSCIMEndpointTestCaseMixin, BluebottleTestCas
         self.assertEqual(data['totalResults'], 1)
         self.assertEqual(data['startIndex'], 1)
 
+    def test_get_filtered_combined(self):
+        query = urlencode({
+            'filter': 'userName eq "{}" or (externalId eq "{}" and emails sw "{}")'.format(
+                self.users[0].remote_id,
+                self.users[1].scim_external_id,
+                self.users[1].email[:5].upper()
+            )
+        })
+        response = self.client.get(
+            '{}?{}'.format(self.url, query),
+            token=self.token
+        )
+        data = response.json()
+        self.assertEqual(data['totalResults'], 2)
+        self.assertEqual(
+            set(resource['userName'] for resource in data['Resources']),
+            set([self.users[0].remote_id, self.users[1].remote_id])
+        )
+
+    def test_get_filtered_contains(self):
+        query = urlencode({
+            'filter': 'emails.value co "{}"'.format(self.users[0].email.split('@')[0].upper())
+        })
+        response = self.client.get(
+            '{}?{}'.format(self.url, query),
+            token=self.token
+        )
+        data = response.json()
+        self.assertEqual(data['totalResults'], 1)
+        self.assertEqual(data['Resources'][0]['userName'], self.users[0].remote_id)
+
     def test_get_invalid_filter(self):
         response = self.client.get(
             self.url + f"?filter=userName ge {self.users[0].remote_id}",
@@ -384,6 +418,35 @@ class SCIMUserListTest(AuthenticatedSCIMEndpointTestCaseMixin, BluebottleTestCas
         self.assertEqual(data['startIndex'], 12)
         self.assertEqual(len(data['Resources']), 0)
 
+    def test_get_cursor(self):
+        ids = []
+        cursor = ''
+
+        while cursor is not None:
+            response = self.client.get(
+                '{}?{}'.format(self.url, urlencode({'count': 4, 'cursor': cursor})),
+                token=self.token
+            )
+            self.assertEqual(response.status_code, 200)
+
+            data = response.data
+            self.assertEqual(data['totalResults'], 10)
+            self.assertFalse('startIndex' in data)
+            self.assertTrue(len(data['Resources']) <= 4)
+
+            ids += [resource['id'] for resource in data['Resources']]
+            cursor = data.get('nextCursor')
+
+        self.assertEqual(len(ids), 10)
+        self.assertEqual(ids, sorted(ids, key=lambda id: int(id.split('-')[-1])))
+
+    def test_get_invalid_cursor(self):
+        response = self.client.get(
+            '{}?{}'.format(self.url, urlencode({'cursor': 'invalid'})),
+            token=self.token
+        )
+        self.assertEqual(response.status_code, 404)
+
     @override_settings(SEND_WELCOME_MAIL=True)
     def test_post(self):
         """
@@ -730,6 +793,16 @@ class SCIMGroupListTest(AuthenticatedSCIMEndpointTestCaseMixin, BluebottleTestCa
             ['urn:ietf:params:scim:api:messages:2.0:ListResponse']
         )
 
+    def test_get_filtered(self):
+        response = self.client.get(
+            '{}?{}'.format(self.url, urlencode({'filter': 'displayName eq "Staff"'})),
+            token=self.token
+        )
+
+        data = response.data
+        self.assertEqual(data['totalResults'], 1)
+        self.assertEqual(data['Resources'][0]['displayName'], 'Staff')
+
     def test_post(self):
         """
         Test authenticated request
@@ -886,3 +959,267 @@ class SCIMGroupDetailTest(AuthenticatedSCIMEndpointTestCaseMixin, BluebottleTest
             token=self.token
         )
         self.assertEqual(len(response.data['members']), 1)
+
+    def test_patch_add(self):
+        new_user = BlueBottleUserFactory.create()
+        request_data = {
+            'schemas': ['urn:ietf:params:scim:api:messages:2.0:PatchOp'],
+            'Operations': [{
+                'op': 'Add',
+                'path': 'members',
+                'value': [
+                    {'value': 'goodup-user-{}'.format(new_user.pk)},
+                    {'value': 'goodup-user-1234'},
+                    {'value': 'goodup-user-bla-bla-bla'},
+                ]
+            }]
+        }
+        response = self.client.patch(
+            self.url,
+            data=request_data,
+            token=self.token
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['members']), 2)
+        self.assertTrue(self.group in new_user.groups.all())
+        self.assertTrue(self.group in self.user.groups.all())
+
+    def test_patch_add_to_staff(self):
+        new_user = BlueBottleUserFactory.create()
+        group = Group.objects.get(name='Staff')
+        request_data = {
+            'schemas': ['urn:ietf:params:scim:api:messages:2.0:PatchOp'],
+            'Operations': [{
+                'op': 'add',
+                'value': {
+                    'members': [{'value': 'goodup-user-{}'.format(new_user.pk)}]
+                }
+            }]
+        }
+        response = self.client.patch(
+            reverse('scim-group-detail', args=(group.pk, )),
+            data=request_data,
+            token=self.token
+        )
+
+        self.assertEqual(response.status_code, 200)
+        new_user.refresh_from_db()
+        self.assertTrue(new_user.is_staff)
+        self.assertTrue(group in new_user.groups.all())
+
+    def test_patch_remove(self):
+        other_user = BlueBottleUserFactory.create()
+        other_user.groups.add(self.group)
+
+        request_data = {
+            'schemas': ['urn:ietf:params:scim:api:messages:2.0:PatchOp'],
+            'Operations': [{
+                'op': 'remove',
+                'path': 'members[value eq "goodup-user-{}"]'.format(self.user.pk),
+            }]
+        }
+        response = self.client.patch(
+            self.url,
+            data=request_data,
+            token=self.token
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['members']), 1)
+        self.assertFalse(self.group in self.user.groups.all())
+        self.assertTrue(self.group in other_user.groups.all())
+
+    def test_patch_replace(self):
+        new_user = BlueBottleUserFactory.create()
+        request_data = {
+            'schemas': ['urn:ietf:params:scim:api:messages:2.0:PatchOp'],
+            'Operations': [{
+                'op': 'replace',
+                'path': 'members',
+                'value': [{'value': 'goodup-user-{}'.format(new_user.pk)}]
+            }, {
+                'op': 'replace',
+                'path': 'displayName',
+                'value': 'Other name'
+            }]
+        }
+        response = self.client.patch(
+            self.url,
+            data=request_data,
+            token=self.token
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['displayName'], 'test')
+        self.assertEqual(
+            [member['value'] for member in response.data['members']],
+            ['goodup-user-{}'.format(new_user.pk)]
+        )
+
+    def test_patch_invalid(self):
+        request_data = {
+            'schemas': ['urn:ietf:params:scim:api:messages:2.0:PatchOp'],
+            'Operations': [{
+                'op': 'add',
+                'path': 'permissions',
+                'value': 'everything'
+            }]
+        }
+        response = self.client.patch(
+            self.url,
+            data=request_data,
+            token=self.token
+        )
+        self.assertEqual(response.status_code, 400)
+
+        request_data['Operations'][0]['op'] = 'move'
+        response = self.client.patch(
+            self.url,
+            data=request_data,
+            token=self.token
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class SCIMBulkTest(AuthenticatedSCIMEndpointTestCaseMixin, BluebottleTestCase):
+    @property
+    def url(self):
+        return reverse('scim-bulk')
+
+    def setUp(self):
+        self.group = Group.objects.create(name='test')
+        self.user = SCIMUserFactory.create()
+
+        super(SCIMBulkTest, self).setUp()
+
+    def get_user_data(self, email):
+        return {
+            'schemas': ['urn:ietf:params:scim:schemas:core:2.0:User'],
+            'externalId': email,
+            'userName': email,
+            'active': True,
+            'emails': [{'type': 'work', 'primary': True, 'value': email}],
+            'name': {'givenName': 'Tester', 'familyName': 'Example'}
+        }
+
+    def test_post(self):
+        request_data = {
+            'schemas': ['urn:ietf:params:scim:api:messages:2.0:BulkRequest'],
+            'Operations': [{
+                'method': 'POST',
+                'path': '/Users',
+                'bulkId': 'new-user',
+                'data': self.get_user_data('new@example.com')
+            }, {
+                'method': 'PATCH',
+                'path': '/Groups/goodup-group-{}'.format(self.group.pk),
+                'data': {
+                    'schemas': ['urn:ietf:params:scim:api:messages:2.0:PatchOp'],
+                    'Operations': [{
+                        'op': 'add',
+                        'path': 'members',
+                        'value': [
+                            {'value': 'bulkId:new-user'},
+                            {'value': 'goodup-user-{}'.format(self.user.pk)},
+                        ]
+                    }]
+                }
+            }, {
+                'method': 'DELETE',
+                'path': '/Users/goodup-user-{}'.format(self.user.pk),
+            }]
+        }
+
+        response = self.client.post(self.url, request_data, token=self.token)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.data
+        self.assertEqual(
+            data['schemas'], ['urn:ietf:params:scim:api:messages:2.0:BulkResponse']
+        )
+        self.assertEqual(
+            [operation['status'] for operation in data['Operations']],
+            ['201', '200', '204']
+        )
+
+        new_user = Member.objects.get(email='new@example.com')
+        self.assertEqual(data['Operations'][0]['bulkId'], 'new-user')
+        self.assertEqual(
+            data['Operations'][0]['location'],
+            reverse('scim-user-detail', args=(new_user.pk, ))
+        )
+        self.assertTrue(self.group in new_user.groups.all())
+
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.is_anonymized)
+
+    def test_post_errors(self):
+        request_data = {
+            'schemas': ['urn:ietf:params:scim:api:messages:2.0:BulkRequest'],
+            'failOnErrors': 1,
+            'Operations': [{
+                'method': 'POST',
+                'path': '/Users',
+                'data': self.get_user_data('new@example.com')
+            }, {
+                'method': 'PUT',
+                'path': '/Users/goodup-user-1234',
+                'data': self.get_user_data('other@example.com')
+            }, {
+                'method': 'POST',
+                'path': '/Users',
+                'data': self.get_user_data('third@example.com')
+            }]
+        }
+
+        response = self.client.post(self.url, request_data, token=self.token)
+
+        self.assertEqual(response.status_code, 200)
+        operations = response.data['Operations']
+        self.assertEqual(len(operations), 2)
+        self.assertEqual(operations[0]['status'], '201')
+        self.assertEqual(operations[1]['status'], '404')
+        self.assertEqual(operations[1]['response']['status'], 404)
+
+        self.assertTrue(Member.objects.filter(email='new@example.com').exists())
+        self.assertFalse(Member.objects.filter(email='third@example.com').exists())
+
+    def test_post_unsupported(self):
+        request_data = {
+            'schemas': ['urn:ietf:params:scim:api:messages:2.0:BulkRequest'],
+            'Operations': [{
+                'method': 'POST',
+                'path': '/Groups',
+                'data': {'displayName': 'Other group'}
+            }, {
+                'method': 'DELETE',
+                'path': '/Bulk',
+            }, {
+                'method': 'PATCH',
+                'path': '/Users/goodup-user-{}'.format(self.user.pk),
+                'data': {}
+            }]
+        }
+
+        response = self.client.post(self.url, request_data, token=self.token)
+
+        self.assertEqual(
+            [operation['status'] for operation in response.data['Operations']],
+            ['405', '404', '405']
+        )
+
+    def test_post_too_many(self):
+        request_data = {
+            'schemas': ['urn:ietf:params:scim:api:messages:2.0:BulkRequest'],
+            'Operations': [{
+                'method': 'DELETE',
+                'path': '/Users/goodup-user-{}'.format(self.user.pk),
+            }] * 1001
+        }
+
+        response = self.client.post(self.url, request_data, token=self.token)
+
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(response.data['scimType'], 'tooMany')
+        self.assertFalse(Member.objects.get(pk=self.user.pk).is_anonymized)
@@ -3,7 +3,7 @@ from bluebottle.scim.views import (
     ServiceProviderConfigView, SchemaListView, SchemaRetrieveView,
     ResourceTypeRetrieveView, ResourceTypeListView,
     UserListView, UserDetailView,
-    GroupListView, GroupDetailView
+    GroupListView, GroupDetailView, BulkView
 )
 
 
@@ -53,4 +53,9 @@ urlpatterns = [
         GroupDetailView.as_view(),
         name='scim-group-detail'
     ),
+    url(
+        r'^Bulk$',
+        BulkView.as_view(),
+        name='scim-bulk'
+    ),
 ]
@@ -3,16 +3,21 @@ from builtins import object
 from django.http import Http404
 
 from django.contrib.auth.models import Group
+from django.db import transaction
+from django.urls import Resolver404, resolve, reverse
 
 from rest_framework import (
     generics, response, permissions, authentication, exceptions,
     renderers, parsers
 )
 
+from bluebottle.bluebottle_drf2.pagination import CursorPaginationMixin
 from bluebottle.members.models import Member
 
 from bluebottle.scim.models import SCIMPlatformSettings
-from bluebottle.scim.serializers import SCIMMemberSerializer, SCIMGroupSerializer
+from bluebottle.scim.serializers import (
+    SCIMMemberSerializer, SCIMGroupSerializer, SCIMPatchSerializer, SCIMBulkSerializer
+)
 from bluebottle.scim import scim_data
 from bluebottle.scim.filters import SCIMFilter
 
@@ -20,11 +25,35 @@ from bluebottle.scim.filters import SCIMFilter
 from rest_framework import pagination
 
 
-class SCIMPaginator(pagination.LimitOffsetPagination):
+class SCIMPaginator(CursorPaginationMixin, pagination.LimitOffsetPagination):
     default_limit = 1000
     limit_query_param = 'count'
     offset_query_param = 'startIndex'
 
+    # Cursor based pagination (RFC 9865): `cursor` and `nextCursor`
+    cursor_query_param = 'cursor'
+    cursor_ordering = ('id', )
+
+    def get_cursor_page_size(self, request):
+        return self.get_limit(request)
+
+    def paginate_cursor(self, queryset, request, view=None):
+        # SCIM list responses always contain the total number of results
+        self.count = self.get_count(queryset)
+        return super(SCIMPaginator, self).paginate_cursor(queryset, request, view)
+
+    def get_cursor_paginated_response(self, data):
+        result = {
+            'totalResults': self.count,
+            'Resources': data,
+            'itemsPerPage': len(data),
+            'schemas': ['urn:ietf:params:scim:api:messages:2.0:ListResponse'],
+        }
+        if self.cursor:
+            result['nextCursor'] = self.cursor
+
+        return response.Response(result)
+
     def get_paginated_response(self, data):
         return response.Response({
             'totalResults': self.count,
@@ -179,7 +208,163 @@ class GroupListView(SCIMViewMixin, generics.ListAPIView):
     queryset = Group.objects.exclude(name__in=('Anonymous', 'Authenticated', ))
     serializer_class = SCIMGroupSerializer
 
+    scim_filter_mapping = {
+        'displayname': 'name',
+    }
+
 
 class GroupDetailView(SCIMViewMixin, generics.RetrieveUpdateAPIView):
     queryset = Group.objects.exclude(name__in=('Anonymous', 'Authenticated', ))
     serializer_class = SCIMGroupSerializer
+
+    def perform_patch(self, instance, data):
+        patch = SCIMPatchSerializer(data=data)
+        if not patch.is_valid():
+            raise exceptions.ValidationError(
+                {'Operations': ['Invalid patch operations']}, code='invalidSyntax'
+            )
+
+        with transaction.atomic():
+            self.get_serializer(instance).patch(instance, patch.validated_data['Operations'])
+
+    def patch(self, request, *args, **kwargs):
+        instance = self.get_object()
+        self.perform_patch(instance, request.data)
+
+        return response.Response(self.get_serializer(instance).data)
+
+
+class TooManyOperations(exceptions.APIException):
+    status_code = 413
+    default_detail = 'Too many operations'
+    default_code = 'tooMany'
+
+
+class BulkView(SCIMViewMixin, generics.GenericAPIView):
+    """
+    Perform a list of POST, PUT, PATCH and DELETE operations on the other SCIM endpoints.
+
+    All operations run in a single transaction, with a savepoint per operation, so failed
+    operations are rolled back without affecting the others. Resources created in the
+    request can be referenced in later operations with `bulkId:<id>`.
+    """
+    serializer_class = SCIMBulkSerializer
+    max_operations = 1000
+
+    def get_base_path(self):
+        url = reverse('scim-bulk')
+        return url[:-len('Bulk')]
+
+    def replace_bulk_ids(self, value, bulk_ids):
+        if isinstance(value, str):
+            for bulk_id, resource_id in bulk_ids.items():
+                value = value.replace('bulkId:{}'.format(bulk_id), resource_id)
+            return value
+        elif isinstance(value, list):
+            return [self.replace_bulk_ids(item, bulk_ids) for item in value]
+        elif isinstance(value, dict):
+            return dict(
+                (key, self.replace_bulk_ids(item, bulk_ids)) for key, item in value.items()
+            )
+
+        return value
+
+    def get_operation_view(self, method, path):
+        try:
+            match = resolve(self.get_base_path() + path.lstrip('/'))
+        except Resolver404:
+            raise exceptions.NotFound('Resource not found: {}'.format(path))
+
+        view_class = getattr(match.func, 'view_class', None)
+        if not view_class or not issubclass(view_class, SCIMViewMixin) or view_class is BulkView:
+            raise exceptions.NotFound('Resource not found: {}'.format(path))
+
+        view = view_class(request=self.request, args=match.args, kwargs=match.kwargs, format_kwarg=None)
+
+        if method == 'PATCH' and not hasattr(view, 'perform_patch'):
+            raise exceptions.MethodNotAllowed(method)
+        if method.lower() not in view.http_method_names or not hasattr(view, method.lower()):
+            raise exceptions.MethodNotAllowed(method)
+
+        return view
+
+    def perform_operation(self, view, method, data):
+        if method == 'POST':
+            serializer = view.get_serializer(data=data)
+            serializer.is_valid(raise_exception=True)
+            view.perform_create(serializer)
+            return 201, serializer.data
+        else:
+            instance = view.get_object()
+
+            if method == 'PUT':
+                serializer = view.get_serializer(instance, data=data)
+                serializer.is_valid(raise_exception=True)
+                view.perform_update(serializer)
+                return 200, serializer.data
+            elif method == 'PATCH':
+                view.perform_patch(instance, data)
+                return 200, view.get_serializer(instance).data
+            else:
+                view.perform_destroy(instance)
+                return 204, None
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            raise exceptions.ValidationError(
+                {'Operations': ['Invalid bulk operations']}, code='invalidSyntax'
+            )
+
+        operations = serializer.validated_data['Operations']
+        if len(operations) > self.max_operations:
+            raise TooManyOperations(
+                'The maximum number of operations is {}'.format(self.max_operations)
+            )
+
+        fail_on_errors = serializer.validated_data.get('failOnErrors')
+
+        bulk_ids = {}
+        results = []
+        errors = 0
+
+        with transaction.atomic():
+            for operation in operations:
+                method = operation['method']
+                bulk_id = operation.get('bulkId')
+
+                result = {'method': method}
+                if bulk_id:
+                    result['bulkId'] = bulk_id
+
+                view = self
+                try:
+                    with transaction.atomic():
+                        path = self.replace_bulk_ids(operation['path'], bulk_ids)
+                        view = self.get_operation_view(method, path)
+                        status_code, data = self.perform_operation(
+                            view, method, self.replace_bulk_ids(operation.get('data'), bulk_ids)
+                        )
+                except (exceptions.APIException, Http404) as exc:
+                    error = view.handle_exception(exc)
+                    result['status'] = str(error.status_code)
+                    result['response'] = error.data
+                    errors += 1
+                else:
+                    result['status'] = str(status_code)
+                    if data:
+                        result['location'] = str(data['meta']['location'])
+                        if bulk_id:
+                            bulk_ids[bulk_id] = data['id']
+                    else:
+                        result['location'] = self.get_base_path() + path.lstrip('/')
+
+                results.append(result)
+
+                if fail_on_errors and errors >= fail_on_errors:
+                    break
+
+        return response.Response({
+            'schemas': ['urn:ietf:params:scim:api:messages:2.0:BulkResponse'],
+            'Operations': results
+        })
@@ -0,0 +1,70 @@
+from collections import namedtuple
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import connection
+
+from bluebottle.segments.models import Segment, SegmentType
+
+AliasMap = namedtuple('AliasMap', ('types', 'segments'))
+
+# Alias maps per tenant, as (version, alias map)
+_alias_maps = {}
+
+
+def get_version_key():
+    return '{}.segments.alias_version'.format(connection.tenant.schema_name)
+
+
+def get_version():
+    version = cache.get(get_version_key())
+    if version is None:
+        version = uuid4().hex
+        cache.set(get_version_key(), version, None)
+
+    return version
+
+
+def invalidate():
+    """
+    Rebuild the alias maps of the current tenant in all processes
+    """
+    cache.set(get_version_key(), uuid4().hex, None)
+
+
+def normalize(alias):
+    return alias.strip().lower()
+
+
+def build_alias_map():
+    segments = {}
+    for pk, segment_type_id, alternate_names in Segment.objects.order_by('pk').values_list(
+        'pk', 'segment_type_id', 'alternate_names'
+    ):
+        for name in alternate_names:
+            segments.setdefault((segment_type_id, normalize(name)), pk)
+
+    return AliasMap(dict(SegmentType.objects.values_list('slug', 'pk')), segments)
+
+
+def get_alias_map():
+    """
+    Return the segment types by slug and the segments by (segment type id, alias) for the
+    current tenant.
+
+    The map is kept in memory, and only rebuilt when a segment or segment type changed, so
+    resolving SSO segment claims does not need any queries.
+    """
+    version = get_version()
+    schema_name = connection.tenant.schema_name
+
+    try:
+        cached_version, alias_map = _alias_maps[schema_name]
+    except KeyError:
+        cached_version = alias_map = None
+
+    if cached_version != version:
+        alias_map = build_alias_map()
+        _alias_maps[schema_name] = (version, alias_map)
+
+    return alias_map
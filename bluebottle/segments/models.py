@@ -3,8 +3,8 @@ from PIL import ImageColor
 from colorfield.fields import ColorField
 from django.conf import settings
 from django_better_admin_arrayfield.models.fields import ArrayField
-from django.db import models
-from django.db.models.signals import post_save
+from django.db import connection, models, transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.template.defaultfilters import slugify
 from django.utils.translation import gettext_lazy as _
@@ -203,13 +203,22 @@ class Segment(models.Model):
 
 @receiver(post_save)
 def connect_members_to_segments(sender, instance, created, **kwargs):
-    from bluebottle.members.models import Member
-    if isinstance(instance, Segment):
-        if instance.email_domains:
-            for email_domain in instance.email_domains:
-                for member in Member.objects\
-                        .exclude(segments=instance)\
-                        .filter(email__endswith=email_domain)\
-                        .all():
-
-                    member.segments.add(instance)
+    from bluebottle.segments.tasks import connect_members_to_segment
+
+    if isinstance(instance, Segment) and instance.email_domains:
+        # Wait for the commit, so the task sees the saved segment and its email domains
+        tenant = connection.tenant
+        transaction.on_commit(
+            lambda: connect_members_to_segment.delay(instance.pk, tenant)
+        )
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_segment_aliases(sender, instance, **kwargs):
+    from bluebottle.segments.aliases import invalidate
+
+    if isinstance(instance, (Segment, SegmentType)):
+        # Invalidate again after the commit, so other processes do not rebuild with the old data
+        invalidate()
+        transaction.on_commit(invalidate)
@@ -3,7 +3,7 @@ from builtins import object
 from rest_framework import serializers
 
 from bluebottle.activities.models import Activity
-from bluebottle.activities.utils import get_stats_for_activities
+from bluebottle.activities.utils import get_cached_stats_for_activities
 from bluebottle.bluebottle_drf2.serializers import SorlImageField
 from bluebottle.initiatives.models import Initiative
 from bluebottle.segments.models import Segment, SegmentType
@@ -73,7 +73,7 @@ class SegmentDetailSerializer(SegmentListSerializer):
         )
 
     def get_stats(self, obj):
-        return get_stats_for_activities(obj.activities.all())
+        return get_cached_stats_for_activities(obj, obj.activities.all())
 
     class Meta(SegmentListSerializer.Meta):
         fields = SegmentListSerializer.Meta.fields + (
@@ -0,0 +1,108 @@
+import logging
+
+from celery import shared_task, current_task
+from django.db.models import Q
+
+from bluebottle.clients.utils import LocalTenant
+from bluebottle.utils.documents import update_related_documents
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1000
+
+
+def get_members_for_segment(segment):
+    """
+    Members with an email address in one of the segment's email domains,
+    that are not yet part of the segment.
+    """
+    from bluebottle.members.models import Member
+
+    query = Q()
+    for email_domain in segment.email_domains:
+        query |= Q(email__endswith=email_domain)
+
+    return Member.objects.filter(query).exclude(segments=segment)
+
+
+def add_segment_to_activities(segment, member_ids):
+    """
+    Add the segment to the open activities of `member_ids`, like `segments_changed` does
+    for members that are added one by one.
+    """
+    from bluebottle.activities.cache import invalidate_stats
+    from bluebottle.activities.models import Activity
+    from bluebottle.cms.cache import invalidate
+    from bluebottle.members.signals import OPEN_ACTIVITY_STATUSES
+    from bluebottle.segments.models import Segment
+    from bluebottle.utils.cache import invalidate_for
+
+    through = Activity.segments.through
+    activity_ids = Activity.objects.filter(
+        owner_id__in=member_ids, status__in=OPEN_ACTIVITY_STATUSES
+    ).exclude(segments=segment).values_list('pk', flat=True)
+
+    created = through.objects.bulk_create(
+        [through(activity_id=activity_id, segment=segment) for activity_id in activity_ids],
+        ignore_conflicts=True
+    )
+    if created:
+        # `bulk_create` skips `m2m_changed`, so invalidate what its receivers would have
+        invalidate_stats('segment', [segment.pk])
+        invalidate('activities')
+        invalidate_for(Activity, Segment)
+
+
+def add_members_to_segment(segment, task=None):
+    """
+    Add all members matching the segment's email domains to the segment.
+
+    The through table rows are inserted in chunks with `bulk_create`, and the segment is
+    added to the open activities of the added members. Both skip the `m2m_changed` signal,
+    so the documents related to the added members are reindexed in one go afterwards.
+    Returns the number of added members.
+    """
+    from bluebottle.members.models import Member, UserSegment
+
+    if not segment.email_domains:
+        return 0
+
+    member_ids = list(
+        get_members_for_segment(segment).order_by('pk').values_list('pk', flat=True)
+    )
+    total = len(member_ids)
+
+    for start in range(0, total, CHUNK_SIZE):
+        chunk = member_ids[start:start + CHUNK_SIZE]
+
+        # Ignore rows that a concurrent run inserted in the meantime
+        UserSegment.objects.bulk_create(
+            [UserSegment(member_id=member_id, segment=segment) for member_id in chunk],
+            ignore_conflicts=True
+        )
+        add_segment_to_activities(segment, chunk)
+
+        if task is not None:
+            task.update_state(
+                state='PROGRESS',
+                meta={'progress': float(min(start + CHUNK_SIZE, total)) / total}
+            )
+
+    if member_ids:
+        update_related_documents(Member.objects.filter(pk__in=member_ids))
+
+    logger.info('Added {} members to segment {}'.format(total, segment.pk))
+    return total
+
+
+@shared_task
+def connect_members_to_segment(segment_id, tenant):
+    from bluebottle.segments.models import Segment
+
+    with LocalTenant(tenant, clear_tenant=True):
+        try:
+            segment = Segment.objects.get(pk=segment_id)
+        except Segment.DoesNotExist:
+            return 0
+
+        return add_members_to_segment(segment, task=current_task)
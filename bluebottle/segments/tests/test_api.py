@@ -3,6 +3,8 @@ import datetime
 from builtins import range
 from builtins import str
 
+from django.core.cache import cache
+from django.test.utils import override_settings
 from django.urls import reverse
 from django.utils.timezone import now
 from moneyed import Money
@@ -18,6 +20,9 @@ from bluebottle.segments.serializers import SegmentDetailSerializer, SegmentPubl
 from bluebottle.segments.tests.factories import SegmentFactory, SegmentTypeFactory
 from bluebottle.test.factory_models.accounts import BlueBottleUserFactory
 from bluebottle.test.utils import BluebottleTestCase, JSONAPITestClient, APITestCase
+from bluebottle.activities.models import Activity
+from bluebottle.time_based.models import DateActivity
+from bluebottle.utils.cache import get_statistics, get_versions
 from bluebottle.time_based.tests.factories import PeriodActivityFactory, \
     PeriodParticipantFactory, DateActivityFactory, \
     DateActivitySlotFactory, DateParticipantFactory
@@ -148,6 +153,71 @@ class SegmentListAPITestCase(BluebottleTestCase):
         )
 
 
+@override_settings(RESPONSE_CACHE_TIMEOUT=300)
+class SegmentListCacheAPITestCase(BluebottleTestCase):
+
+    def setUp(self):
+        super(SegmentListCacheAPITestCase, self).setUp()
+        cache.clear()
+
+        self.client = JSONAPITestClient()
+
+        self.url = reverse('segment-list')
+        self.segment_type = SegmentTypeFactory.create()
+        self.segments = SegmentFactory.create_batch(
+            5,
+            segment_type=self.segment_type
+        )
+
+    def test_cached(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+
+        cached = self.client.get(self.url)
+        self.assertEqual(cached.status_code, status.HTTP_200_OK)
+        self.assertEqual(cached['X-Cache'], 'HIT')
+        self.assertEqual(cached.content, response.content)
+        self.assertEqual(cached['ETag'], response['ETag'])
+
+        self.assertEqual(get_statistics(), {'hits': 1, 'misses': 1})
+
+    def test_invalidate(self):
+        self.client.get(self.url)
+        SegmentFactory.create(segment_type=self.segment_type)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(len(response.json()['data']), 6)
+
+    def test_invalidate_without_view(self):
+        versions = get_versions([Segment, Activity, DateActivity])
+
+        SegmentFactory.create(segment_type=self.segment_type)
+        DateActivityFactory.create()
+
+        new_versions = get_versions([Segment, Activity, DateActivity])
+        for version, new_version in zip(versions, new_versions):
+            self.assertNotEqual(version, new_version)
+
+    def test_etag(self):
+        response = self.client.get(self.url)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_authenticated(self):
+        response = self.client.get(self.url, user=BlueBottleUserFactory.create())
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.has_header('X-Cache'))
+
+    def test_closed(self):
+        self.client.get(self.url)
+        MemberPlatformSettings.objects.update(closed=True)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
 class SegmentDetailAPITestCase(APITestCase):
 
     def setUp(self):
@@ -1,7 +1,11 @@
+import factory
+
+from bluebottle.cms.cache import get_highlighted_activity_ids
 from bluebottle.test.factory_models.accounts import BlueBottleUserFactory
-from bluebottle.test.utils import BluebottleTestCase
+from bluebottle.test.utils import BluebottleTestCase, run_on_commit
 from bluebottle.segments.tests.factories import SegmentTypeFactory, SegmentFactory
 from bluebottle.segments.models import Segment
+from bluebottle.segments.tasks import add_members_to_segment
 from bluebottle.deeds.tests.factories import DeedFactory
 
 
@@ -84,11 +88,12 @@ class MemberSegmentTestCase(BluebottleTestCase):
         jan = BlueBottleUserFactory.create(
             email='jan.keizer@paling-sound.nl'
         )
-        segment = SegmentFactory.create(
-            segment_type=self.segment_type,
-            email_domains=['leidse-zangers.nl'],
-            closed=True
-        )
+        with run_on_commit():
+            segment = SegmentFactory.create(
+                segment_type=self.segment_type,
+                email_domains=['leidse-zangers.nl'],
+                closed=True
+            )
 
         self.assertEqual(robbie.segments.first(), segment)
         self.assertEqual(jan.segments.first(), None)
@@ -118,3 +123,65 @@ class MemberSegmentTestCase(BluebottleTestCase):
         activity = DeedFactory.create(owner=user)
 
         self.assertEqual(len(activity.segments.all()), 0)
+
+    def test_add_email_domain_to_existing_segment(self):
+        robbie = BlueBottleUserFactory.create(
+            email='rubberen.robbie@leidse-zangers.nl'
+        )
+        jan = BlueBottleUserFactory.create(
+            email='jan.keizer@paling-sound.nl'
+        )
+        segment = SegmentFactory.create(
+            segment_type=self.segment_type,
+            email_domains=['leidse-zangers.nl'],
+        )
+
+        segment.email_domains.append('paling-sound.nl')
+        with run_on_commit():
+            segment.save()
+
+        self.assertEqual(list(robbie.segments.all()), [segment])
+        self.assertEqual(list(jan.segments.all()), [segment])
+
+    def test_add_members_to_segment(self):
+        BlueBottleUserFactory.create_batch(
+            3, email=factory.Sequence(lambda n: 'user-{}@leidse-zangers.nl'.format(n))
+        )
+        BlueBottleUserFactory.create(email='jan.keizer@paling-sound.nl')
+
+        segment = SegmentFactory.create(segment_type=self.segment_type)
+        segment.email_domains = ['leidse-zangers.nl']
+
+        self.assertEqual(add_members_to_segment(segment), 3)
+        self.assertEqual(segment.users.count(), 3)
+
+        self.assertEqual(add_members_to_segment(segment), 0)
+        self.assertEqual(segment.users.count(), 3)
+
+    def test_add_members_to_segment_activities(self):
+        member = BlueBottleUserFactory.create(email='rubberen.robbie@leidse-zangers.nl')
+        open_activity = DeedFactory.create(owner=member, status='open')
+        succeeded_activity = DeedFactory.create(owner=member, status='succeeded')
+        other_activity = DeedFactory.create(status='open')
+
+        segment = SegmentFactory.create(segment_type=self.segment_type)
+        segment.email_domains = ['leidse-zangers.nl']
+
+        self.assertEqual(add_members_to_segment(segment), 1)
+
+        self.assertTrue(segment in open_activity.segments.all())
+        self.assertFalse(segment in succeeded_activity.segments.all())
+        self.assertFalse(segment in other_activity.segments.all())
+
+    def test_add_members_to_segment_highlighted_activities(self):
+        member = BlueBottleUserFactory.create(email='rubberen.robbie@leidse-zangers.nl')
+        activity = DeedFactory.create(owner=member, status='open', highlight=True)
+
+        segment = SegmentFactory.create(segment_type=self.segment_type, closed=True)
+        segment.email_domains = ['leidse-zangers.nl']
+
+        self.assertTrue(activity.pk in get_highlighted_activity_ids())
+
+        add_members_to_segment(segment)
+
+        self.assertFalse(activity.pk in get_highlighted_activity_ids())
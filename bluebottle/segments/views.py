@@ -7,7 +7,7 @@ from bluebottle.segments.serializers import (
     SegmentDetailSerializer, SegmentPublicDetailSerializer, SegmentListSerializer, SegmentTypeSerializer
 )
 from bluebottle.utils.permissions import TenantConditionalOpenClose
-from bluebottle.utils.views import ListAPIView, RetrieveAPIView, JsonApiViewMixin
+from bluebottle.utils.views import ListAPIView, RetrieveAPIView, JsonApiViewMixin, CachedResponseMixin
 from rest_framework import exceptions
 
 
@@ -34,19 +34,23 @@ class SegmentPagination(PageNumberPagination):
     page_size = 100
 
 
-class SegmentTypeList(JsonApiViewMixin, ListAPIView):
+class SegmentTypeList(CachedResponseMixin, JsonApiViewMixin, ListAPIView):
     serializer_class = SegmentTypeSerializer
     queryset = SegmentType.objects.filter(is_active=True).prefetch_related('segments')
     permission_classes = [TenantConditionalOpenClose, ]
 
+    cache_models = (SegmentType, Segment)
 
-class SegmentList(JsonApiViewMixin, ListAPIView):
+
+class SegmentList(CachedResponseMixin, JsonApiViewMixin, ListAPIView):
     serializer_class = SegmentListSerializer
     queryset = Segment.objects.filter(segment_type__is_active=True).select_related('segment_type')
 
     permission_classes = [TenantConditionalOpenClose, ]
     pagination_class = SegmentPagination
 
+    cache_models = (SegmentType, Segment)
+
 
 class SegmentDetail(JsonApiViewMixin, RetrieveAPIView):
     serializer_class = SegmentDetailSerializer
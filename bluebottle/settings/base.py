@@ -1008,6 +1008,15 @@ FLUENT_CONTENTS_CACHE_OUTPUT = False
 
 CACHE_MIDDLEWARE_SECONDS = 0
 
+# Responses of public API endpoints, see `bluebottle.utils.views.CachedResponseMixin`
+RESPONSE_CACHE_TIMEOUT = 5 * 60
+
+# Impact stats of initiatives and segments, see `bluebottle.activities.cache`
+ACTIVITY_STATS_CACHE_TIMEOUT = 60 * 60
+
+# Map data of approved initiatives, see `bluebottle.initiatives.map`
+INITIATIVE_MAP_CACHE_TIMEOUT = 60 * 60
+
 # Amounts shown in donation modal
 DONATION_AMOUNTS = {
     'EUR': (25, 50, 75, 100),
@@ -1045,6 +1054,10 @@ GEOPOSITION_GOOGLE_MAPS_API_KEY = ''
 STATIC_MAPS_API_KEY = ''
 STATIC_MAPS_API_SECRET = ''
 
+GEOCODER = 'bluebottle.geo.geocoding.GoogleGeocoder'
+# Localities that could not be resolved are only tried again after this many seconds
+GEOCODE_NEGATIVE_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
 # django money settings
 OPEN_EXCHANGE_RATES_APP_ID = 'c2cedc60485a48efa65631d5230c23e1'
 RATES_CACHE_TIMEOUT = 60 * 60 * 24
@@ -187,8 +187,14 @@ CACHES = {
 }
 
 AXES_CACHE = 'axes_cache'
+
+# The cache is not cleared between tests
+RESPONSE_CACHE_TIMEOUT = 0
+ACTIVITY_STATS_CACHE_TIMEOUT = 0
+INITIATIVE_MAP_CACHE_TIMEOUT = 0
 STATIC_MAPS_API_KEY = 'someinvalidapikey'
 STATIC_MAPS_API_SECRET = 'fpqFpdo4RY9GDc-xxawF6Ipmp3Y='
+GEOCODER = 'bluebottle.geo.geocoding.LocalGeocoder'
 
 DEFAULT_CURRENCY = 'EUR'
 
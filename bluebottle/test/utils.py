@@ -58,6 +58,25 @@ def css_dict(style):
         raise ValueError('Could not parse CSS: %s (%s)' % (style, e))
 
 
+@contextmanager
+def run_on_commit():
+    """
+    Run the `transaction.on_commit` callbacks that are registered in the block.
+
+    Tests run in a transaction that is never committed, so these callbacks would never run.
+    Callbacks that register new callbacks are run as well.
+    """
+    start = len(connection.run_on_commit)
+    yield
+
+    while len(connection.run_on_commit) > start:
+        callbacks = connection.run_on_commit[start:]
+        del connection.run_on_commit[start:]
+
+        for _sids, callback in callbacks:
+            callback()
+
+
 class InitProjectDataMixin(object):
     def init_projects(self):
         from django.core import management
@@ -12,7 +12,6 @@ from django_admin_inline_paginator.admin import TabularInlinePaginated
 from django_summernote.widgets import SummernoteWidget
 from parler.admin import SortedRelatedFieldListFilter, TranslatableAdmin
 from parler.utils.views import get_language_parameter
-from pytz import timezone
 
 from bluebottle.activities.admin import ActivityChildAdmin, ContributorChildAdmin, ContributionChildAdmin, ActivityForm
 from bluebottle.fsm.admin import StateMachineFilter, StateMachineAdmin
@@ -499,7 +498,7 @@ class DateSlotAdmin(SlotAdmin):
 
     def get_form(self, request, obj=None, **kwargs):
         if obj and not obj.is_online and obj.location:
-            local_start = obj.start.astimezone(timezone(obj.location.timezone))
+            local_start = obj.start.astimezone(obj.location.tzinfo)
             platform_start = obj.start.astimezone(get_current_timezone())
             offset = local_start.utcoffset() - platform_start.utcoffset()
 
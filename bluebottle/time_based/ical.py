@@ -0,0 +1,140 @@
+import hashlib
+
+import icalendar
+from django.core.cache import cache
+from django.core.signing import BadSignature, Signer
+from django.db import connection
+from django.urls import reverse
+from django.utils.http import urlencode
+from django.utils.timezone import utc
+from django.utils.translation import get_language, gettext_lazy as _
+
+from bluebottle.members.utils import get_jwt_secret
+from bluebottle.time_based.models import DateActivitySlot
+
+EVENT_CACHE_TIMEOUT = 24 * 60 * 60  # a day
+
+CALENDAR_START = b'BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//GoodUp//Bluebottle//EN\r\n'
+CALENDAR_END = b'END:VCALENDAR\r\n'
+
+FEED_SALT = 'bluebottle.time_based.ical.feed'
+
+
+def get_event_key(slot):
+    return '{}.ical.slot.{}.{}.{}.{}'.format(
+        connection.tenant.schema_name,
+        get_language(),
+        slot.pk,
+        slot.updated.timestamp(),
+        slot.activity.updated.timestamp(),
+    )
+
+
+def get_event(slot):
+    activity = slot.activity
+
+    event = icalendar.Event()
+    event.add('summary', activity.title)
+
+    details = activity.details
+    if slot.is_online and slot.online_meeting_url:
+        details += _('\nJoin: {url}').format(url=slot.online_meeting_url)
+
+    event.add('description', details)
+    event.add('url', activity.get_absolute_url())
+    event.add('dtstart', slot.start.astimezone(utc))
+    event.add('dtend', (slot.start + slot.duration).astimezone(utc))
+    event['uid'] = slot.uid
+
+    organizer = icalendar.vCalAddress('MAILTO:{}'.format(activity.owner.email))
+    organizer.params['cn'] = icalendar.vText(activity.owner.full_name)
+
+    event['organizer'] = organizer
+    if slot.location:
+        event['location'] = icalendar.vText(slot.location.formatted_address)
+
+    return event.to_ical()
+
+
+def get_events(slots):
+    """
+    Return the VEVENTs for `slots`, in order.
+
+    Events are cached by slot and the `updated` timestamps of the slot and its activity,
+    so a changed slot or activity gets a new cache entry.
+    """
+    keys = [get_event_key(slot) for slot in slots]
+    cached = cache.get_many(keys)
+
+    missing = {}
+    for key, slot in zip(keys, slots):
+        if key not in cached:
+            missing[key] = get_event(slot)
+
+    if missing:
+        cache.set_many(missing, EVENT_CACHE_TIMEOUT)
+        cached.update(missing)
+
+    return [cached[key] for key in keys]
+
+
+def get_etag(slots):
+    return '"{}"'.format(
+        hashlib.md5('.'.join(get_event_key(slot) for slot in slots).encode('utf-8')).hexdigest()
+    )
+
+
+def generate_calendar(slots):
+    yield CALENDAR_START
+    for event in get_events(slots):
+        yield event
+    yield CALENDAR_END
+
+
+def get_calendar(slots):
+    return b''.join(generate_calendar(slots))
+
+
+def get_feed_slots(user):
+    """
+    All slots `user` is registered and accepted for, with everything needed to render them
+    """
+    return DateActivitySlot.objects.filter(
+        slot_participants__participant__user=user,
+        slot_participants__status='registered',
+        slot_participants__participant__status='accepted',
+        status__in=['open', 'full', 'finished'],
+        start__isnull=False,
+        duration__isnull=False,
+    ).exclude(
+        activity__status__in=['cancelled', 'deleted', 'rejected'],
+    ).select_related(
+        'activity', 'activity__owner', 'location'
+    ).order_by('start', 'id')
+
+
+def get_feed_signer(user):
+    """
+    Feed urls are added to calendar clients once, so the signature does not expire. Instead
+    it is signed with a secret per user, that changes when the user logs out or changes
+    their password, like the JWT tokens do.
+    """
+    return Signer(key='{}{}'.format(get_jwt_secret(user), user.password), salt=FEED_SALT)
+
+
+def get_feed_value(url):
+    # The same path exists on every tenant
+    return '{}:{}'.format(connection.tenant.schema_name, url)
+
+
+def get_feed_url(user):
+    url = reverse('date-ical-feed', args=(user.pk, ))
+    signature = get_feed_signer(user).sign(get_feed_value(url))
+    return '{}?{}'.format(url, urlencode({'signature': signature}))
+
+
+def check_feed_signature(user, url, signature):
+    try:
+        return get_feed_signer(user).unsign(signature) == get_feed_value(url)
+    except BadSignature:
+        return False
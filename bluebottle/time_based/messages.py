@@ -5,7 +5,6 @@ from django.contrib.admin.options import get_content_type_for_model
 from django.template import defaultfilters
 from django.utils.timezone import get_current_timezone, now
 from django.utils.translation import pgettext_lazy as pgettext
-from pytz import timezone
 
 from bluebottle.clients.utils import tenant_url
 from bluebottle.notifications.messages import TransitionMessage
@@ -18,7 +17,7 @@ from bluebottle.time_based.models import (
 
 def get_slot_info(slot):
     if slot.location and not slot.is_online:
-        tz = timezone(slot.location.timezone)
+        tz = slot.location.tzinfo
     else:
         tz = get_current_timezone()
 
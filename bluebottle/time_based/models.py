@@ -1,13 +1,11 @@
 from html import unescape
 from urllib.parse import urlencode
 
-import pytz
 from django.db import connection
 from django.utils import timezone
 from django.utils.html import strip_tags
 from djchoices.choices import DjangoChoices, ChoiceItem
 from parler.models import TranslatableModel, TranslatedFields
-from timezonefinder import TimezoneFinder
 
 from bluebottle.activities.models import Activity, Contributor, Contribution
 from bluebottle.files.fields import PrivateDocumentField
@@ -20,9 +18,6 @@ from bluebottle.time_based.validators import (
 from bluebottle.utils.models import ValidatedModelMixin, AnonymizationMixin
 from bluebottle.utils.utils import get_current_host, get_current_language
 from bluebottle.utils.widgets import get_human_readable_duration
-
-tf = TimezoneFinder()
-
 from builtins import object
 from django.db import models
 from django.utils.translation import gettext_lazy as _
@@ -75,11 +70,7 @@ class TimeBasedActivity(Activity):
     @property
     def local_timezone(self):
         if self.location and self.location.position:
-            tz_name = tf.timezone_at(
-                lng=self.location.position.x,
-                lat=self.location.position.y
-            )
-            return pytz.timezone(tz_name)
+            return self.location.tzinfo
 
     @property
     def utc_offset(self):
@@ -235,11 +226,7 @@ class ActivitySlot(TriggerMixin, AnonymizationMixin, ValidatedModelMixin, models
     @property
     def local_timezone(self):
         if self.location and self.location.position:
-            tz_name = tf.timezone_at(
-                lng=self.location.position.x,
-                lat=self.location.position.y
-            )
-            return pytz.timezone(tz_name)
+            return self.location.tzinfo
 
     @property
     def utc_offset(self):
@@ -346,11 +333,7 @@ class DateActivitySlot(ActivitySlot):
     @property
     def local_timezone(self):
         if self.location and self.location.position:
-            tz_name = tf.timezone_at(
-                lng=self.location.position.x,
-                lat=self.location.position.y
-            )
-            return pytz.timezone(tz_name)
+            return self.location.tzinfo
 
     @property
     def utc_offset(self):
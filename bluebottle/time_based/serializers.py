@@ -20,6 +20,7 @@ from bluebottle.activities.utils import (
 from bluebottle.bluebottle_drf2.serializers import PrivateFileSerializer
 from bluebottle.files.serializers import PrivateDocumentSerializer, PrivateDocumentField
 from bluebottle.fsm.serializers import TransitionSerializer, AvailableTransitionsField
+from bluebottle.time_based.ical import get_feed_url
 from bluebottle.time_based.models import (
     TimeBasedActivity, DateActivity, PeriodActivity,
     DateParticipant, PeriodParticipant, TimeContribution, DateActivitySlot,
@@ -332,9 +333,13 @@ class DateActivitySerializer(DateActivitySlotInfoMixin, TimeBasedBaseSerializer)
         user = self.context['request'].user
 
         user_id = user.pk if user.is_authenticated else 0
-        return {
+        links = {
             'ical': reverse_signed('date-ical', args=(instance.pk, user_id)),
         }
+        if user.is_authenticated:
+            links['ical-feed'] = get_feed_url(user)
+
+        return links
 
     def get_my_contributor(self, instance):
         user = self.context['request'].user
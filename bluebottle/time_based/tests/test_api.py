@@ -20,6 +20,7 @@ from bluebottle.test.factory_models.accounts import BlueBottleUserFactory
 from bluebottle.test.factory_models.geo import LocationFactory, PlaceFactory
 from bluebottle.test.factory_models.projects import ThemeFactory
 from bluebottle.test.utils import BluebottleTestCase, JSONAPITestClient, get_first_included_by_type
+from bluebottle.time_based.ical import get_feed_signer
 from bluebottle.time_based.models import SlotParticipant, Skill
 from bluebottle.time_based.tests.factories import (
     DateActivityFactory, PeriodActivityFactory,
@@ -418,7 +419,7 @@ class TimeBasedDetailAPIViewTestCase():
         data = response.json()['data']
         export_url = data['attributes']['participants-export-url']['url']
         export_response = self.client.get(export_url)
-        sheet = load_workbook(filename=BytesIO(export_response.content)).get_active_sheet()
+        sheet = load_workbook(filename=BytesIO(b"".join(export_response.streaming_content))).get_active_sheet()
         self.assertEqual(sheet['A1'].value, 'Email')
         self.assertEqual(sheet['B1'].value, 'Name')
         self.assertEqual(sheet['C1'].value, 'Motivation')
@@ -462,7 +463,7 @@ class TimeBasedDetailAPIViewTestCase():
         data = response.json()['data']
         export_url = data['attributes']['participants-export-url']['url']
         export_response = self.client.get(export_url)
-        sheet = load_workbook(filename=BytesIO(export_response.content)).get_active_sheet()
+        sheet = load_workbook(filename=BytesIO(b"".join(export_response.streaming_content))).get_active_sheet()
         self.assertEqual(sheet['A1'].value, 'Email')
         self.assertEqual(sheet['B1'].value, 'Name')
         self.assertEqual(sheet['C1'].value, 'Motivation')
@@ -725,6 +726,27 @@ class DateDetailAPIViewTestCase(TimeBasedDetailAPIViewTestCase, BluebottleTestCa
             )
         )
 
+    def test_export_slots(self):
+        initiative_settings = InitiativePlatformSettings.load()
+        initiative_settings.enable_participant_exports = True
+        initiative_settings.save()
+
+        user = BlueBottleUserFactory.create(first_name='Bart', last_name='Lacroix')
+        self.participant_factory.create(activity=self.activity, user=user, motivation=None)
+
+        response = self.client.get(self.url, user=self.activity.owner)
+        export_url = response.json()['data']['attributes']['participants-export-url']['url']
+        export_response = self.client.get(export_url)
+        sheet = load_workbook(filename=BytesIO(b"".join(export_response.streaming_content))).get_active_sheet()
+
+        self.assertEqual(sheet['A2'].value, user.email)
+        self.assertEqual(sheet['B2'].value, 'Bart Lacroix')
+        self.assertEqual(sheet['C2'].value, None)
+        self.assertEqual(sheet['E2'].value, 'accepted')
+
+        self.assertTrue(sheet['F1'].value.startswith(self.slot.title or str(self.slot)))
+        self.assertEqual(sheet['F2'].value, 'registered')
+
     def test_get_my_contributor(self):
         participant = DateParticipantFactory.create(activity=self.activity)
         response = self.client.get(self.url, user=participant.user)
@@ -2729,6 +2751,110 @@ class DateIcalTestCase(BluebottleTestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
 
+class DateIcalFeedTestCase(BluebottleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.activity = DateActivityFactory.create(
+            title='Pollute Katwijk Beach',
+            slots=[]
+        )
+        self.slots = DateActivitySlotFactory.create_batch(
+            3,
+            activity=self.activity,
+            is_online=True,
+            online_meeting_url='http://example.com'
+        )
+        DateActivitySlotFactory.create()
+
+        self.user = BlueBottleUserFactory.create()
+        DateParticipantFactory.create(activity=self.activity, user=self.user)
+
+        self.client = JSONAPITestClient()
+        response = self.client.get(
+            reverse('date-detail', args=(self.activity.pk,)), user=self.user
+        )
+        self.signed_url = response.json()['data']['attributes']['links']['ical-feed']
+        self.unsigned_url = reverse('date-ical-feed', args=(self.user.pk,))
+
+    def get_calendar(self, response):
+        return icalendar.Calendar.from_ical(b''.join(response.streaming_content))
+
+    def test_get(self):
+        response = self.client.get(self.signed_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.get('content-type'), 'text/calendar')
+        self.assertTrue(response.get('etag'))
+
+        events = self.get_calendar(response).walk('vevent')
+        self.assertEqual(
+            [str(event['uid']) for event in events],
+            [slot.uid for slot in self.slots]
+        )
+        for event in events:
+            self.assertEqual(str(event['summary']), self.activity.title)
+
+    def test_get_not_modified(self):
+        response = self.client.get(self.signed_url)
+        etag = response.get('etag')
+
+        response = self.client.get(self.signed_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_get_changed(self):
+        response = self.client.get(self.signed_url)
+        etag = response.get('etag')
+
+        self.activity.title = 'Clean Katwijk Beach'
+        self.activity.save()
+
+        response = self.client.get(self.signed_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.get('etag'), etag)
+
+        for event in self.get_calendar(response).walk('vevent'):
+            self.assertEqual(str(event['summary']), 'Clean Katwijk Beach')
+
+    def test_get_other_user(self):
+        url = self.signed_url.replace(
+            self.unsigned_url, reverse('date-ical-feed', args=(BlueBottleUserFactory.create().pk,))
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_get_no_signature(self):
+        response = self.client.get(self.unsigned_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_get_other_tenant(self):
+        signature = get_feed_signer(self.user).sign('other:{}'.format(self.unsigned_url))
+        response = self.client.get(
+            '{}?{}'.format(self.unsigned_url, urllib.parse.urlencode({'signature': signature}))
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_get_after_logout(self):
+        self.user.last_logout = now()
+        self.user.save()
+
+        response = self.client.get(self.signed_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_get_after_password_change(self):
+        self.user.set_password('some-new-password')
+        self.user.save()
+
+        response = self.client.get(self.signed_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_get_inactive(self):
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.get(self.signed_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
 class SkillApiTestCase(BluebottleTestCase):
 
     def setUp(self):
@@ -2,6 +2,7 @@ from datetime import timedelta
 
 from django.utils.timezone import now
 
+from bluebottle.geo.models import Geolocation
 from bluebottle.test.utils import BluebottleTestCase
 from bluebottle.time_based.tests.factories import (
     DateActivityFactory, DateActivitySlotFactory, PeriodActivityFactory
@@ -98,3 +99,9 @@ class DateActivityModelTestCase(BluebottleTestCase):
         self.assertEqual(self.slotB.sequence, 1)
         self.assertEqual(self.slotC.sequence, 2)
         self.assertEqual(self.slotD.sequence, 3)
+
+    def test_local_timezone_not_stored(self):
+        Geolocation.objects.filter(pk=self.slotA.location.pk).update(timezone=None)
+        self.slotA.location.refresh_from_db()
+
+        self.assertEqual(str(self.slotA.local_timezone), 'Europe/Berlin')
@@ -13,6 +13,7 @@ from bluebottle.time_based.views import (
     DateSlotDetailView, DateSlotListView,
     SlotParticipantListView, SlotParticipantDetailView, SlotParticipantTransitionList,
     DateActivityIcalView, ActivitySlotIcalView, DateParticipantExportView, PeriodParticipantExportView,
+    DateActivityIcalFeedView,
     SlotRelatedParticipantList, SkillList, SkillDetail
 )
 
@@ -49,6 +50,10 @@ urlpatterns = [
         DateActivityIcalView.as_view(),
         name='date-ical'),
 
+    url(r'^/date/ical/feed/(?P<user_id>\d+)$',
+        DateActivityIcalFeedView.as_view(),
+        name='date-ical-feed'),
+
     url(r'^/slot/ical/(?P<pk>\d+)$',
         ActivitySlotIcalView.as_view(),
         name='slot-ical'),
@@ -1,11 +1,14 @@
 from datetime import datetime, time
 
 import dateutil
-import icalendar
-from django.db.models import Q
-from django.http import HttpResponse
-from django.utils.timezone import utc, get_current_timezone
-from django.utils.translation import gettext_lazy as _
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import CharField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Concat, Trim
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_cache_control
+from django.utils.timezone import get_current_timezone
+from django.views.generic import View
 from rest_framework.exceptions import ValidationError
 
 from bluebottle.activities.permissions import (
@@ -14,8 +17,12 @@ from bluebottle.activities.permissions import (
     ActivitySegmentPermission
 )
 from bluebottle.clients import properties
+from bluebottle.members.models import Member
 from bluebottle.segments.models import SegmentType
 from bluebottle.segments.views import ClosedSegmentActivityViewMixin
+from bluebottle.time_based.ical import (
+    check_feed_signature, generate_calendar, get_calendar, get_etag, get_feed_slots
+)
 from bluebottle.time_based.models import (
     DateActivity, PeriodActivity,
     DateParticipant, PeriodParticipant,
@@ -41,16 +48,17 @@ from bluebottle.time_based.serializers import (
     SlotParticipantTransitionSerializer, SkillSerializer
 )
 from bluebottle.transitions.views import TransitionList
-from bluebottle.utils.admin import prep_field
+from bluebottle.utils.cache import not_modified
 from bluebottle.utils.permissions import (
     OneOf, ResourcePermission, ResourceOwnerPermission, TenantConditionalOpenClose
 )
 from bluebottle.utils.views import (
     RetrieveUpdateAPIView, RetrieveUpdateDestroyAPIView, ListCreateAPIView,
     CreateAPIView, ListAPIView, JsonApiViewMixin,
-    PrivateFileView, TranslatedApiViewMixin, RetrieveAPIView, JsonApiPagination
+    PrivateFileView, TranslatedApiViewMixin, RetrieveAPIView, JsonApiPagination,
+    CachedResponseMixin
 )
-from bluebottle.utils.xlsx import generate_xlsx_response
+from bluebottle.utils.xlsx import generate_xlsx_streaming_response
 
 
 class TimeBasedActivityListView(JsonApiViewMixin, ListCreateAPIView):
@@ -364,37 +372,13 @@ class DateActivityIcalView(PrivateFileView):
 
     def get(self, *args, **kwargs):
         instance = super(DateActivityIcalView, self).get_object()
-        calendar = icalendar.Calendar()
         slots = instance.slots.filter(
             status__in=['open', 'full', 'finished'],
-        )
+        ).select_related('activity', 'activity__owner', 'location')
         if kwargs.get('user_id'):
             slots = slots.filter(slot_participants__participant__user__id=kwargs['user_id'])
 
-        for slot in slots:
-            event = icalendar.Event()
-            event.add('summary', instance.title)
-
-            details = instance.details
-            if slot.is_online and slot.online_meeting_url:
-                details += _('\nJoin: {url}').format(url=slot.online_meeting_url)
-
-            event.add('description', details)
-            event.add('url', instance.get_absolute_url())
-            event.add('dtstart', slot.start.astimezone(utc))
-            event.add('dtend', (slot.start + slot.duration).astimezone(utc))
-            event['uid'] = slot.uid
-
-            organizer = icalendar.vCalAddress('MAILTO:{}'.format(instance.owner.email))
-            organizer.params['cn'] = icalendar.vText(instance.owner.full_name)
-
-            event['organizer'] = organizer
-            if slot.location:
-                event['location'] = icalendar.vText(slot.location.formatted_address)
-
-            calendar.add_component(event)
-
-        response = HttpResponse(calendar.to_ical(), content_type='text/calendar')
+        response = HttpResponse(get_calendar(list(slots)), content_type='text/calendar')
         response['Content-Disposition'] = 'attachment; filename="%s.ics"' % (
             instance.slug
         )
@@ -405,140 +389,158 @@ class ActivitySlotIcalView(PrivateFileView):
     queryset = DateActivitySlot.objects.exclude(
         status__in=['cancelled', 'deleted', 'rejected'],
         activity__status__in=['cancelled', 'deleted', 'rejected'],
-    )
+    ).select_related('activity', 'activity__owner', 'location')
 
     max_age = 30 * 60  # half an hour
 
     def get(self, *args, **kwargs):
         instance = self.get_object()
-        calendar = icalendar.Calendar()
 
-        slot = icalendar.Event()
-        slot.add('summary', instance.activity.title)
+        response = HttpResponse(get_calendar([instance]), content_type='text/calendar')
+        response['Content-Disposition'] = 'attachment; filename="%s.ics"' % (
+            instance.activity.slug
+        )
 
-        details = instance.activity.details
-        if instance.is_online and instance.online_meeting_url:
-            details += _('\nJoin: {url}').format(url=instance.online_meeting_url)
+        return response
 
-        slot.add('description', details)
-        slot.add('url', instance.activity.get_absolute_url())
-        slot.add('dtstart', instance.start.astimezone(utc))
-        slot.add('dtend', (instance.start + instance.duration).astimezone(utc))
-        slot['uid'] = instance.uid
 
-        organizer = icalendar.vCalAddress('MAILTO:{}'.format(instance.activity.owner.email))
-        organizer.params['cn'] = icalendar.vText(instance.activity.owner.full_name)
+class DateActivityIcalFeedView(View):
+    """
+    Calendar feed with all slots a user joined, for calendar clients to subscribe to.
 
-        slot['organizer'] = organizer
-        if instance.location:
-            slot['location'] = icalendar.vText(instance.location.formatted_address)
+    Clients poll the feed, so it supports conditional requests: the ETag changes whenever
+    one of the slots or activities in the feed changes.
+    """
+    max_age = 5 * 60  # 5 minutes
 
-        calendar.add_component(slot)
+    def get(self, request, user_id):
+        signature = request.GET.get('signature')
+        if not signature:
+            raise Http404()
 
-        response = HttpResponse(calendar.to_ical(), content_type='text/calendar')
-        response['Content-Disposition'] = 'attachment; filename="%s.ics"' % (
-            instance.activity.slug
-        )
+        user = get_object_or_404(Member, pk=user_id, is_active=True)
+        if not check_feed_signature(user, request.path, signature):
+            raise Http404()
 
-        return response
+        slots = list(get_feed_slots(user))
+
+        response = StreamingHttpResponse(generate_calendar(slots), content_type='text/calendar')
+        response['ETag'] = get_etag(slots)
+        patch_cache_control(response, private=True, max_age=self.max_age)
 
+        return not_modified(request, response)
 
-class DateParticipantExportView(PrivateFileView):
+
+class ParticipantExportView(PrivateFileView):
+    """
+    Export the participants of an activity to XLSX.
+
+    The rows come from a single query, with the segments of the user aggregated per
+    segment type, and are written to the sheet while iterating over the query.
+    """
     fields = (
         ('user__email', 'Email'),
-        ('user__full_name', 'Name'),
+        ('full_name', 'Name'),
         ('motivation', 'Motivation'),
         ('created', 'Registration Date'),
         ('status', 'Status')
     )
 
-    model = DateActivity
+    participant_model = None
 
     def get_segment_types(self):
         return SegmentType.objects.all()
 
-    def get(self, request, *args, **kwargs):
-        activity = self.get_object()
-        slots = activity.active_slots.order_by('start')
-        filename = 'participants for {}.xlsx'.format(activity.title)
-        title_row = [field[1] for field in self.fields]
-        for segment_type in self.get_segment_types():
-            title_row.append(segment_type.name)
-        for slot in slots:
-            title_row.append(
-                "{}\n{}".format(slot.title or str(slot), slot.start.strftime('%d-%m-%y %H:%M %Z'))
-            )
-        sheet = [title_row]
-        for participant in activity.contributors.instance_of(DateParticipant).prefetch_related('user__segments'):
-            row = [prep_field(request, participant, field[0]) for field in self.fields]
-            for segment_type in self.get_segment_types():
-                segments = ", ".join(
-                    participant.user.segments.filter(
-                        segment_type=segment_type
-                    ).values_list('name', flat=True)
+    def get_columns(self, activity):
+        """
+        Return the (annotation, title) pairs for the columns after `fields`
+        """
+        return [
+            (
+                'segment_{}'.format(segment_type.pk),
+                segment_type.name,
+                ArrayAgg(
+                    'user__segments__name',
+                    filter=Q(user__segments__segment_type=segment_type),
+                    ordering=('user__segments__name', )
                 )
-                row.append(segments)
-            for slot in slots:
-                slot_participant = slot.slot_participants.filter(participant=participant).first()
-                if slot_participant:
-                    row.append(slot_participant.status)
-                else:
-                    row.append('-')
-            sheet.append(row)
-
-        return generate_xlsx_response(filename=filename, data=sheet)
+            )
+            for segment_type in self.get_segment_types()
+        ]
 
+    def get_participants(self, activity, columns):
+        return self.participant_model.objects.filter(
+            activity=activity
+        ).annotate(
+            full_name=Trim(Concat('user__first_name', Value(' '), 'user__last_name')),
+            **dict((name, expression) for name, _title, expression in columns)
+        ).order_by('created', 'pk').values_list(
+            *[field for field, _title in self.fields] + [name for name, _title, _expression in columns]
+        )
 
-class PeriodParticipantExportView(PrivateFileView):
-    fields = (
-        ('user__email', 'Email'),
-        ('user__full_name', 'Name'),
-        ('motivation', 'Motivation'),
-        ('created', 'Registration Date'),
-        ('status', 'Status')
-    )
+    def format_value(self, value):
+        if isinstance(value, datetime):
+            return value.strftime('%d-%m-%y %H:%M')
+        if isinstance(value, list):
+            return ', '.join(item for item in value if item)
+        return value or ''
 
-    model = PeriodActivity
+    def get_rows(self, activity):
+        columns = self.get_columns(activity)
+        yield [field[1] for field in self.fields] + [title for _name, title, _expression in columns]
 
-    def get_segment_types(self):
-        return SegmentType.objects.all()
+        for values in self.get_participants(activity, columns).iterator(chunk_size=1000):
+            yield [self.format_value(value) for value in values]
 
     def get(self, request, *args, **kwargs):
         activity = self.get_object()
         filename = 'participants for {}.xlsx'.format(activity.title)
 
-        sheet = []
-        title_row = [field[1] for field in self.fields]
-        for segment_type in self.get_segment_types():
-            title_row.append(segment_type.name)
-        sheet.append(title_row)
+        return generate_xlsx_streaming_response(filename=filename, rows=self.get_rows(activity))
 
-        for t, participant in enumerate(
-            activity.contributors.instance_of(PeriodParticipant).prefetch_related('user__segments')
-        ):
-            row = [prep_field(request, participant, field[0]) for field in self.fields]
-            for segment_type in self.get_segment_types():
-                segments = ", ".join(
-                    participant.user.segments.filter(
-                        segment_type=segment_type
-                    ).values_list('name', flat=True)
+
+class DateParticipantExportView(ParticipantExportView):
+    model = DateActivity
+    participant_model = DateParticipant
+
+    def get_columns(self, activity):
+        columns = super(DateParticipantExportView, self).get_columns(activity)
+
+        for slot in activity.active_slots.order_by('start'):
+            columns.append((
+                'slot_{}'.format(slot.pk),
+                "{}\n{}".format(slot.title or str(slot), slot.start.strftime('%d-%m-%y %H:%M %Z')),
+                Coalesce(
+                    Subquery(
+                        SlotParticipant.objects.filter(
+                            slot=slot, participant=OuterRef('pk')
+                        ).values('status')[:1],
+                        output_field=CharField()
+                    ),
+                    Value('-')
                 )
-                row.append(segments)
-            sheet.append(row)
+            ))
+
+        return columns
 
-        return generate_xlsx_response(filename=filename, data=sheet)
+
+class PeriodParticipantExportView(ParticipantExportView):
+    model = PeriodActivity
+    participant_model = PeriodParticipant
 
 
 class SkillPagination(JsonApiPagination):
     page_size = 100
 
 
-class SkillList(TranslatedApiViewMixin, JsonApiViewMixin, ListAPIView):
+class SkillList(CachedResponseMixin, TranslatedApiViewMixin, JsonApiViewMixin, ListAPIView):
     serializer_class = SkillSerializer
     queryset = Skill.objects.filter(disabled=False)
     permission_classes = [TenantConditionalOpenClose, ]
     pagination_class = SkillPagination
 
+    cache_models = (Skill, )
+
     def get_queryset(self):
         lang = self.request.LANGUAGE_CODE or properties.LANGUAGE_CODE
         return super().get_queryset().translated(lang).order_by('translations__name')
@@ -4,8 +4,9 @@ from django.contrib.auth import get_user_model
 from django.db import IntegrityError
 
 from bluebottle.geo.models import Location
-from bluebottle.members.models import MemberPlatformSettings
-from bluebottle.segments.models import Segment, SegmentType
+from bluebottle.members.models import MemberPlatformSettings, UserSegment
+from bluebottle.segments.aliases import get_alias_map, normalize
+from bluebottle.segments.models import Segment
 from bluebottle.token_auth.exceptions import TokenAuthenticationError
 from bluebottle.token_auth.utils import get_settings
 
@@ -60,6 +61,12 @@ class BaseTokenAuthentication():
                 pass
 
     def get_segments_from_data(self, data):
+        """
+        Return the ids of the segments in `data`, per segment type id
+        """
+        alias_map = get_alias_map()
+        create_segments = None
+
         segment_list = {}
         segment_data = [
             (field, value)
@@ -69,46 +76,64 @@ class BaseTokenAuthentication():
         for (path, value) in segment_data:
             type_slug = path.split('.')[-1]
             try:
-                segment_type = SegmentType.objects.get(slug=type_slug)
-            except SegmentType.DoesNotExist:
+                segment_type_id = alias_map.types[type_slug]
+            except KeyError:
                 logger.info('SSO Error: Missing segment type: {}'.format(type_slug))
                 return
 
             if not isinstance(value, (list, tuple)):
                 value = [value]
-            segment_list[segment_type.id] = []
+            segment_list[segment_type_id] = []
             for val in value:
                 try:
-                    segment = Segment.objects.filter(
-                        segment_type__slug=type_slug,
-                    ).extra(
-                        where=['%s ILIKE ANY (alternate_names)'],
-                        params=[val, ]
-                    ).get()
-                    segment_list[segment_type.id].append(segment)
-                except Segment.DoesNotExist:
-                    if MemberPlatformSettings.load().create_segments:
-                        segment = Segment.objects.create(
-                            segment_type=segment_type,
-                            name=val,
-                            alternate_names=[val]
-                        )
-                        segment_list[segment_type.id].append(segment)
-                except IntegrityError:
-                    pass
+                    segment_list[segment_type_id].append(
+                        alias_map.segments[(segment_type_id, normalize(val))]
+                    )
+                except KeyError:
+                    if create_segments is None:
+                        create_segments = MemberPlatformSettings.load().create_segments
+
+                    if create_segments:
+                        try:
+                            segment = Segment.objects.create(
+                                segment_type_id=segment_type_id,
+                                name=val,
+                                alternate_names=[val]
+                            )
+                            segment_list[segment_type_id].append(segment.pk)
+
+                            # Other values in the claims, e.g. a different casing, resolve
+                            # to the new segment instead of creating another one
+                            alias_map.segments[(segment_type_id, normalize(val))] = segment.pk
+                        except IntegrityError:
+                            pass
         return segment_list
 
     def set_segments(self, user, data):
         segment_list = self.get_segments_from_data(data)
-        for segment_type_id, segments in segment_list.items():
-            if (
-                segments != user.segments.filter(segment_type__id=segment_type_id) and
-                not user.segments.filter(
-                    segment_type__id=segment_type_id, usersegment__verified=True
-                ).count()
-            ):
-                user.segments.remove(*user.segments.filter(segment_type__id=segment_type_id))
-                user.segments.add(*segments)
+        if not segment_list:
+            return
+
+        current = {}
+        verified = set()
+        for segment_id, segment_type_id, is_verified in UserSegment.objects.filter(
+            member=user
+        ).values_list('segment_id', 'segment__segment_type_id', 'verified'):
+            current.setdefault(segment_type_id, set()).add(segment_id)
+            if is_verified:
+                verified.add(segment_type_id)
+
+        removed = set()
+        added = set()
+        for segment_type_id, segment_ids in segment_list.items():
+            if segment_type_id not in verified:
+                removed |= current.get(segment_type_id, set()) - set(segment_ids)
+                added |= set(segment_ids) - current.get(segment_type_id, set())
+
+        if removed:
+            user.segments.remove(*removed)
+        if added:
+            user.segments.add(*added)
 
     def get_or_create_user(self, data):
         """
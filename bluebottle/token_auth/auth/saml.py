@@ -1,8 +1,11 @@
 from future import standard_library
 standard_library.install_aliases()
+import hashlib
+import json
 import logging
 import urllib.parse
 
+from django.db import connection
 from onelogin.saml2.auth import OneLogin_Saml2_Auth
 from onelogin.saml2.errors import OneLogin_Saml2_Error
 from onelogin.saml2.settings import OneLogin_Saml2_Settings
@@ -13,6 +16,65 @@ from bluebottle.token_auth.auth.base import BaseTokenAuthentication
 
 logger = logging.getLogger(__name__)
 
+# Parsed settings and rendered SP metadata per tenant, as (config hash, value)
+_saml_settings = {}
+_sp_metadata = {}
+
+
+def get_config_hash(config):
+    return hashlib.md5(
+        json.dumps(config, sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+
+
+def get_cached(values, config, build):
+    """
+    Return the value in `values` for the current tenant, or build it with `build` when it
+    does not exist yet or was built for a different `config`.
+    """
+    schema_name = connection.tenant.schema_name
+    config_hash = get_config_hash(config)
+
+    try:
+        cached_hash, value = values[schema_name]
+        if cached_hash == config_hash:
+            return value
+    except KeyError:
+        pass
+
+    value = build()
+    values[schema_name] = (config_hash, value)
+    return value
+
+
+def get_saml_settings(config):
+    """
+    The parsed SAML settings for `config`, so certificates and IdP settings are not parsed
+    again on every SSO request.
+    """
+    return get_cached(_saml_settings, config, lambda: OneLogin_Saml2_Settings(config))
+
+
+def get_sp_metadata(config):
+    """
+    The rendered and validated SP metadata for `config`
+    """
+    def build():
+        saml_settings = OneLogin_Saml2_Settings(
+            settings=config,
+            custom_base_path=config.get('base_path', None),
+            sp_validation_only=True
+        )
+        metadata = saml_settings.get_sp_metadata()
+        errors = saml_settings.validate_metadata(metadata)
+        if len(errors):
+            logger.error('Saml configuration error: {}'.format(errors))
+            raise TokenAuthenticationError(', '.join(errors))
+
+        return metadata
+
+    return get_cached(_sp_metadata, config, build)
+
 
 def get_saml_request(request):
     http_host = request.META.get('HTTP_HOST', None)
@@ -41,7 +103,9 @@ class SAMLAuthentication(BaseTokenAuthentication):
 
     def __init__(self, request, **kwargs):
         super(SAMLAuthentication, self).__init__(request, **kwargs)
-        self.auth = OneLogin_Saml2_Auth(get_saml_request(request), self.settings)
+        self.auth = OneLogin_Saml2_Auth(
+            get_saml_request(request), get_saml_settings(self.settings)
+        )
 
     def sso_url(self, target_url=None):
         result = self.auth.login(
@@ -65,16 +129,7 @@ class SAMLAuthentication(BaseTokenAuthentication):
                 return relay_state
 
     def get_metadata(self):
-        base_path = self.settings.get('base_path', None)
-        saml_settings = OneLogin_Saml2_Settings(settings=self.settings,
-                                                custom_base_path=base_path,
-                                                sp_validation_only=True)
-        metadata = saml_settings.get_sp_metadata()
-        errors = saml_settings.validate_metadata(metadata)
-        if len(errors):
-            logger.error('Saml configuration error: {}'.format(errors))
-            raise TokenAuthenticationError(', '.join(errors))
-        return metadata
+        return get_sp_metadata(self.settings)
 
     def process_logout(self):
         # Logout
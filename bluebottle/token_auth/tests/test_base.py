@@ -5,6 +5,7 @@ from django.contrib.auth import get_user_model
 from bluebottle.members.models import MemberPlatformSettings
 from bluebottle.test.factory_models.accounts import BlueBottleUserFactory
 from bluebottle.test.factory_models.geo import LocationFactory
+from bluebottle.segments.models import Segment
 from bluebottle.segments.tests.factories import SegmentFactory, SegmentTypeFactory
 from bluebottle.members.models import UserSegment
 from bluebottle.token_auth.auth.base import BaseTokenAuthentication
@@ -374,6 +375,27 @@ class TestBaseTokenAuthentication(TestCase):
             self.assertEqual(user.segments.first().name, 'Online Marketing')
             self.assertEqual(user.segments.first().alternate_names, ['Online Marketing'])
 
+    @patch.object(
+        BaseTokenAuthentication,
+        'authenticate_request',
+        return_value={
+            'remote_id': 'test@example.com',
+            'email': 'test@example.com',
+            'segment.team': ['Online Marketing', 'online marketing '],
+        }
+    )
+    def test_user_created_segments_list_no_match_create_duplicate(self, authenticate_request):
+        member_settings = MemberPlatformSettings.load()
+        member_settings.create_segments = True
+        member_settings.save()
+        team = SegmentTypeFactory.create(name='Team')
+
+        with self.settings(TOKEN_AUTH={}):
+            user, created = self.auth.authenticate()
+
+            self.assertEqual(len(user.segments.all()), 1)
+            self.assertEqual(Segment.objects.filter(segment_type=team).count(), 1)
+
     @patch.object(
         BaseTokenAuthentication,
         'authenticate_request',
@@ -11,6 +11,7 @@ from onelogin.saml2.utils import OneLogin_Saml2_Utils
 from bluebottle.segments.tests.factories import SegmentTypeFactory, SegmentFactory
 from bluebottle.test.factory_models.accounts import BlueBottleUserFactory
 from bluebottle.test.factory_models.geo import LocationFactory
+from bluebottle.token_auth.auth import saml
 from bluebottle.token_auth.auth.saml import SAMLAuthentication
 from bluebottle.token_auth.exceptions import TokenAuthenticationError
 from bluebottle.token_auth.tests.saml_settings import TOKEN_AUTH2_SETTINGS, TOKEN_AUTH_SETTINGS
@@ -523,6 +524,46 @@ class TestSAMLTokenAuthentication(TestCase):
                 ['Marketing']
             )
 
+    def test_parse_segments_changed_alias(self):
+        settings = dict(**TOKEN_AUTH_SETTINGS)
+        settings.update(
+            assertion_mapping={
+                'email': 'mail',
+                'remote_id': 'nameId',
+                'segment.segment': ['segment', 'section'],
+            }
+        )
+
+        segment_type = SegmentTypeFactory.create(slug='segment')
+        segment = SegmentFactory.create(
+            segment_type=segment_type,
+            name='Marketing',
+        )
+
+        with self.settings(TOKEN_AUTH=settings):
+            user = BlueBottleUserFactory.create()
+            request = self._request('get', '/sso/redirect', HTTP_HOST='www.stuff.com')
+            auth_backend = SAMLAuthentication(request)
+
+            auth_backend.set_segments(user, {
+                'segment.segment': ['MarkCom']
+            })
+            self.assertEqual(list(user.segments.all()), [])
+
+            segment.alternate_names.append('MarkCom')
+            segment.save()
+
+            auth_backend.set_segments(user, {
+                'segment.segment': ['markcom']
+            })
+            self.assertEqual(list(user.segments.all()), [segment])
+
+            user.segments.through.objects.filter(member=user).update(verified=True)
+            auth_backend.set_segments(user, {
+                'segment.segment': ['Sales']
+            })
+            self.assertEqual(list(user.segments.all()), [segment])
+
     def test_parse_user_missing(self):
         settings = dict(**TOKEN_AUTH_SETTINGS)
         settings.update(
@@ -606,3 +647,44 @@ class TestSAMLTokenAuthentication(TestCase):
             self.assertEqual(
                 result['location.slug'], ''
             )
+
+    def test_settings_cached(self):
+        request = self._request('get', '/sso/redirect', HTTP_HOST='www.stuff.com')
+
+        with self.settings(TOKEN_AUTH=TOKEN_AUTH_SETTINGS):
+            first = SAMLAuthentication(request)
+            second = SAMLAuthentication(request)
+
+            self.assertIs(first.auth.get_settings(), second.auth.get_settings())
+
+        settings = dict(
+            TOKEN_AUTH_SETTINGS,
+            sp=dict(TOKEN_AUTH_SETTINGS['sp'], entityId='http://other.com/metadata')
+        )
+        with self.settings(TOKEN_AUTH=settings):
+            other = SAMLAuthentication(request)
+
+            self.assertIsNot(first.auth.get_settings(), other.auth.get_settings())
+            self.assertEqual(
+                other.auth.get_settings().get_sp_data()['entityId'],
+                'http://other.com/metadata'
+            )
+
+    @patch.dict(saml._sp_metadata, clear=True)
+    @patch('bluebottle.token_auth.auth.saml.OneLogin_Saml2_Settings.validate_metadata', return_value=[])
+    def test_metadata_cached(self, validate_metadata):
+        request = self._request('get', '/sso/metadata', HTTP_HOST='www.stuff.com')
+
+        with self.settings(TOKEN_AUTH=TOKEN_AUTH_SETTINGS):
+            metadata = SAMLAuthentication(request).get_metadata()
+            self.assertEqual(SAMLAuthentication(request).get_metadata(), metadata)
+            self.assertEqual(validate_metadata.call_count, 1)
+
+        settings = dict(
+            TOKEN_AUTH_SETTINGS,
+            sp=dict(TOKEN_AUTH_SETTINGS['sp'], entityId='http://other.com/metadata')
+        )
+        with self.settings(TOKEN_AUTH=settings):
+            metadata = SAMLAuthentication(request).get_metadata()
+            self.assertTrue('http://other.com/metadata' in str(metadata))
+            self.assertEqual(validate_metadata.call_count, 2)
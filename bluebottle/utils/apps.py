@@ -11,3 +11,6 @@ class UtilsConfig(AppConfig):
         import bluebottle.utils.monkey_patch_parler  # noqa
         import bluebottle.utils.monkey_patch_password_validators  # noqa
         import bluebottle.utils.monkey_patch_jet  # noqa
+
+        # Invalidate cached responses on every save, also outside of the web process
+        import bluebottle.utils.cache  # noqa
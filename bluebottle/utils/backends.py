@@ -1,5 +1,5 @@
 from builtins import object
-from django.contrib.auth.models import Group, Permission
+from django.contrib.auth.models import Permission
 
 
 class AnonymousAuthenticationBackend(object):
@@ -27,10 +27,21 @@ class AnonymousAuthenticationBackend(object):
         if user.is_authenticated:
             return False
 
-        try:
-            group = Group.objects.get(name=self.group_name)
-            (app_label, codename) = perm.split('.')
-            group.permissions.get(codename=codename, content_type__app_label=app_label)
-            return True
-        except (Permission.DoesNotExist, Group.DoesNotExist):
-            return False
+        return perm in self.get_group_permissions(user)
+
+    def get_group_permissions(self, user, obj=None):
+        """
+        The permissions of the anonymous group, cached on the user so that they are only loaded
+        once per request.
+        """
+        if user.is_authenticated:
+            return set()
+
+        if not hasattr(user, '_anonymous_perm_cache'):
+            user._anonymous_perm_cache = set(
+                '{}.{}'.format(app_label, codename) for app_label, codename in Permission.objects.filter(
+                    group__name=self.group_name
+                ).values_list('content_type__app_label', 'codename')
+            )
+
+        return user._anonymous_perm_cache
@@ -0,0 +1,148 @@
+import hashlib
+from uuid import uuid4
+
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
+from django.db.models.base import ModelBase
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+from django.utils.translation import get_language
+
+from bluebottle.members.models import MemberPlatformSettings
+
+# Models that change the permissions of anonymous users, and are part of every cache key
+GLOBAL_MODELS = (MemberPlatformSettings, Group, )
+
+
+def get_model_name(model):
+    return model._meta.label_lower
+
+
+def get_version_key(name):
+    return '{}.response_cache.{}_version'.format(connection.tenant.schema_name, name)
+
+
+def get_versions(models):
+    keys = sorted(get_version_key(get_model_name(model)) for model in models)
+    versions = cache.get_many(keys)
+
+    for key in keys:
+        if key not in versions:
+            versions[key] = uuid4().hex
+            cache.set(key, versions[key], None)
+
+    return [versions[key] for key in keys]
+
+
+def invalidate(*models):
+    """
+    Invalidate all cached responses that depend on `models`
+    """
+    for model in models:
+        cache.set(get_version_key(get_model_name(model)), uuid4().hex, None)
+
+
+def get_models(cls):
+    """
+    `cls` and the models it inherits from, e.g. `Activity` for `DateActivity`
+    """
+    return [
+        base for base in cls.__mro__
+        if isinstance(base, ModelBase) and hasattr(base, '_meta') and not base._meta.abstract
+    ]
+
+
+def invalidate_for(*classes):
+    """
+    Invalidate the cached responses that depend on instances of `classes`.
+
+    This does not depend on which views are loaded, so changes in celery tasks, management
+    commands and shells invalidate cached responses too.
+    """
+    invalidate(*set(model for cls in classes if cls for model in get_models(cls)))
+
+
+def get_statistics_key(name, schema_name=None):
+    return '{}.response_cache.{}'.format(schema_name or connection.tenant.schema_name, name)
+
+
+def count(name):
+    key = get_statistics_key(name)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+def get_statistics(schema_name=None):
+    """
+    The number of hits and misses of the response cache
+    """
+    return dict(
+        (name, cache.get(get_statistics_key(name, schema_name), 0))
+        for name in ('hits', 'misses')
+    )
+
+
+def get_response_key(request, models):
+    versions = get_versions(set(models) | set(GLOBAL_MODELS))
+    key = hashlib.md5(
+        '{}.{}'.format('.'.join(versions), request.get_full_path()).encode('utf-8')
+    ).hexdigest()
+
+    return '{}.response_cache.response.{}.{}'.format(
+        connection.tenant.schema_name, get_language(), key
+    )
+
+
+def get_cached_response(key):
+    cached = cache.get(key)
+    if cached is None:
+        count('misses')
+        return None
+
+    count('hits')
+    content, content_type, etag = cached
+    response = HttpResponse(content, content_type=content_type)
+    response['ETag'] = etag
+    response['X-Cache'] = 'HIT'
+    return response
+
+
+def set_cached_response(key, response):
+    etag = '"{}"'.format(hashlib.md5(response.content).hexdigest())
+    response['ETag'] = etag
+    response['X-Cache'] = 'MISS'
+    cache.set(
+        key, (response.content, response['Content-Type'], etag), settings.RESPONSE_CACHE_TIMEOUT
+    )
+
+
+def not_modified(request, response):
+    """
+    Return a 304 response if the client already has the current version of `response`
+    """
+    etag = response.get('ETag')
+    if etag and etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+        not_modified = HttpResponseNotModified()
+        not_modified['ETag'] = etag
+        return not_modified
+
+    return response
+
+
+def invalidate_saved(sender, **kwargs):
+    invalidate_for(sender)
+
+
+def invalidate_m2m(sender, instance, model=None, action=None, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_for(instance.__class__, model)
+
+
+post_save.connect(invalidate_saved, weak=False, dispatch_uid='response-cache-post-save')
+post_delete.connect(invalidate_saved, weak=False, dispatch_uid='response-cache-post-delete')
+m2m_changed.connect(invalidate_m2m, weak=False, dispatch_uid='response-cache-m2m-changed')
@@ -1,3 +1,4 @@
+from django.core.exceptions import ObjectDoesNotExist
 from django.db import connection
 
 from django_elasticsearch_dsl import Index
@@ -17,3 +18,42 @@ class MultiTenantIndex(Index):
             value = value.replace(connection.tenant.schema_name + '-', '')
 
         self.__name = value
+
+
+def update_related_documents(queryset):
+    """
+    Update the documents that depend on the instances in `queryset`.
+
+    Instead of updating the related documents per instance, the related instances are collected
+    first and every document is updated with a single bulk request.
+    """
+    from django_elasticsearch_dsl.apps import DEDConfig
+    from django_elasticsearch_dsl.registries import registry
+
+    if not DEDConfig.autosync_enabled():
+        return
+
+    instances = list(queryset)
+    if not instances:
+        return
+
+    model = instances[0].__class__
+    documents = [
+        document for document in registry.get_documents()
+        if model in document.django.related_models
+    ]
+
+    for document in documents:
+        document_instance = document()
+        related = {}
+        for instance in instances:
+            try:
+                related_instances = document_instance.get_instances_from_related(instance) or []
+            except ObjectDoesNotExist:
+                related_instances = []
+
+            for related_instance in related_instances:
+                related[related_instance.pk] = related_instance
+
+        if related:
+            document_instance.update(list(related.values()))
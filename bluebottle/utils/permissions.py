@@ -114,6 +114,14 @@ class BasePermission(permissions.BasePermission):
         message = 'has_action_permission() must be implemented on {}'.format(self)
         raise NotImplementedError(message)
 
+    def prepare_objects(self, user, objs):
+        """ Load the data needed to check the permissions on a list of objects at once.
+
+        Called by the permission fields before `has_object_action_permission` is called
+        for the objects in a list response.
+        """
+        pass
+
 
 class IsOwnerOrReadOnly(BasePermission):
     def has_action_permission(self, action, user, model_cls):
@@ -206,10 +214,15 @@ class RelatedResourceOwnerPermission(ResourceOwnerPermission):
 class TenantConditionalOpenClose(BasePermission):
     """ Allows access only to authenticated users. """
 
+    @property
+    def platform_closed(self):
+        if not hasattr(self, '_platform_closed'):
+            self._platform_closed = MemberPlatformSettings.objects.get().closed
+        return self._platform_closed
+
     def has_object_action_permission(self, action, user, obj):
         try:
-            settings = MemberPlatformSettings.objects.get()
-            if settings.closed:
+            if self.platform_closed:
                 return user and user.is_authenticated
         except AttributeError:
             pass
@@ -217,8 +230,7 @@ class TenantConditionalOpenClose(BasePermission):
 
     def has_action_permission(self, action, user, model_cls):
         try:
-            settings = MemberPlatformSettings.objects.get()
-            if settings.closed:
+            if self.platform_closed:
                 return user and user.is_authenticated
         except AttributeError:
             pass
@@ -238,26 +250,34 @@ def OneOf(*permission_classes):
     class OneOf(BasePermission):
         permissions = permission_classes
 
+        def __init__(self, *args, **kwargs):
+            super(OneOf, self).__init__(*args, **kwargs)
+            self.instances = [perm() for perm in self.permissions]
+
+        def prepare_objects(self, user, objs):
+            for perm in self.instances:
+                perm.prepare_objects(user, objs)
+
         def has_parent_permission(self, action, user, parent, model):
             return any(
                 (
-                    perm().has_parent_permission(action, user, parent, model) and
-                    perm().has_action_permission(action, user, model)
-                ) for perm in self.permissions
+                    perm.has_parent_permission(action, user, parent, model) and
+                    perm.has_action_permission(action, user, model)
+                ) for perm in self.instances
             )
 
         def has_object_action_permission(self, action, user, obj):
             return any(
                 (
-                    perm().has_object_action_permission(action, user, obj) and
-                    perm().has_action_permission(action, user, obj._meta.model)
-                ) for perm in self.permissions
+                    perm.has_object_action_permission(action, user, obj) and
+                    perm.has_action_permission(action, user, obj._meta.model)
+                ) for perm in self.instances
             )
 
         def has_action_permission(self, *args, **kwargs):
             return any(
-                perm().has_action_permission(*args, **kwargs) for
-                perm in self.permissions
+                perm.has_action_permission(*args, **kwargs) for
+                perm in self.instances
             )
 
     return OneOf
@@ -99,6 +99,91 @@ class MLStripper(HTMLParser):
         return ''.join(self.fed)
 
 
+# The view class and init kwargs for each view name. The view does not depend on the
+# url arguments, so it only needs to be resolved once.
+_view_classes = {}
+
+
+def get_view_class(view_name, args):
+    if view_name not in _view_classes:
+        view_func = resolve(reverse(view_name, args=args)).func
+        _view_classes[view_name] = (view_func.view_class, view_func.view_initkwargs)
+
+    return _view_classes[view_name]
+
+
+class PermissionEvaluator(object):
+    """
+    Evaluate permissions for all permission fields in a response.
+
+    The evaluator is shared through the serializer context, so that every view is only
+    instantiated once per request, action permissions are only checked once per view and method,
+    and permissions get the chance to load the data for a whole page of objects at once.
+    """
+
+    def __init__(self, context):
+        self.context = context
+        self.user = context['request'].user
+        self.views = {}
+        self.action_permissions = {}
+        self.prepared = {}
+
+    @classmethod
+    def from_context(cls, context):
+        if 'permission_evaluator' not in context:
+            context['permission_evaluator'] = cls(context)
+
+        return context['permission_evaluator']
+
+    def get_view(self, view_name, args):
+        if view_name not in self.views:
+            view_class, initkwargs = get_view_class(view_name, args)
+            view = view_class(**initkwargs)
+            self.views[view_name] = (view, view.get_permissions())
+
+        return self.views[view_name]
+
+    def get_objects(self, value):
+        """
+        The objects on the current page, or just `value` if there is no page
+        """
+        paginator = getattr(self.context.get('view'), 'paginator', None)
+
+        objects = getattr(getattr(paginator, 'page', None), 'object_list', None)
+        if not isinstance(objects, list):
+            # See `CursorPaginationMixin`
+            objects = getattr(paginator, 'cursor_page', None)
+
+        if isinstance(objects, list) and value in objects:
+            return objects
+
+        return [value]
+
+    def prepare(self, view_name, permissions, value):
+        prepared = self.prepared.setdefault(view_name, set())
+
+        if value.pk not in prepared:
+            objects = [
+                obj for obj in self.get_objects(value)
+                if isinstance(obj, value.__class__) and obj.pk not in prepared
+            ]
+
+            for permission in permissions:
+                permission.prepare_objects(self.user, objects)
+
+            prepared.update(obj.pk for obj in objects)
+
+    def has_action_permission(self, view_name, method, view, permissions):
+        key = (view_name, method)
+        if key not in self.action_permissions:
+            self.action_permissions[key] = all(
+                perm.has_action_permission(method, self.user, view.model)
+                for perm in permissions
+            )
+
+        return self.action_permissions[key]
+
+
 class BasePermissionField(serializers.Field):
     """ Field that can be used to return permission of the current and related view.
 
@@ -116,11 +201,13 @@ class BasePermissionField(serializers.Field):
 
     def _get_view(self, value):
         args = [getattr(value, arg) for arg in self.view_args]
-        view_func = resolve(reverse(self.view_name, args=args)).func
+        return self.evaluator.get_view(self.view_name, args)
 
-        return view_func.view_class(**view_func.view_initkwargs)
+    @property
+    def evaluator(self):
+        return PermissionEvaluator.from_context(self.context)
 
-    def _method_permissions(self, method, user, view, value):
+    def _method_permissions(self, method, user, view, permissions, value):
         message = '_method_permissions() must be implemented on {}'.format(self)
         raise NotImplementedError(message)
 
@@ -138,13 +225,13 @@ class BasePermissionField(serializers.Field):
         }
         """
 
-        view = self._get_view(value)
+        view, view_permissions = self._get_view(value)
 
         # Loop over all methods and check the permissions on the view
         permissions = {}
         user = self.context['request'].user
         for method in view.allowed_methods:
-            permissions[method] = self._method_permissions(method, user, view, value)
+            permissions[method] = self._method_permissions(method, user, view, view_permissions, value)
         return permissions
 
 
@@ -154,30 +241,32 @@ class PermissionField(BasePermissionField):
 
     (E.g.) the permissions field on the current user object
     """
-    def _method_permissions(self, method, user, view, value):
-        return all(perm.has_action_permission(
-            method, user, view.model
-        ) for perm in view.get_permissions())
+    def _method_permissions(self, method, user, view, permissions, value):
+        return self.evaluator.has_action_permission(self.view_name, method, view, permissions)
 
 
 class ResourcePermissionField(BasePermissionField):
     """ Field that can be used to return permissions for a view with object. """
 
-    def _method_permissions(self, method, user, view, value):
+    def _method_permissions(self, method, user, view, permissions, value):
+        if not self.evaluator.has_action_permission(self.view_name, method, view, permissions):
+            return False
+
+        self.evaluator.prepare(self.view_name, permissions, value)
         return all(
-            (perm.has_object_action_permission(method, user, value) and
-             perm.has_action_permission(method, user, view.model))
-            for perm in view.get_permissions())
+            perm.has_object_action_permission(method, user, value)
+            for perm in permissions
+        )
 
 
 class RelatedResourcePermissionField(BasePermissionField):
     """ Field that can be used to return permission for a related view. """
 
-    def _method_permissions(self, method, user, view, value):
+    def _method_permissions(self, method, user, view, permissions, value):
         return all(
             (perm.has_parent_permission(method, user, value, view.model) and
              perm.has_action_permission(method, user, view.model))
-            for perm in view.get_permissions())
+            for perm in permissions)
 
 
 class CaptchaField(serializers.CharField):
@@ -36,3 +36,12 @@ class AnonymousAuthenticationBackendTest(BluebottleTestCase):
         self.group.delete()
 
         self.assertFalse(self.anonymous_user.has_perm(self.permission_string))
+
+    def test_permissions_cached(self):
+        """ Test that the permissions of the anonymous group are only loaded once per user"""
+        self.group.permissions.add(self.permission)
+
+        with self.assertNumQueries(1):
+            self.assertTrue(self.anonymous_user.has_perm(self.permission_string))
+            self.assertTrue(self.anonymous_user.has_perm(self.permission_string))
+            self.assertFalse(self.anonymous_user.has_perm('sites.change_site'))
@@ -21,7 +21,9 @@ from django.test.utils import override_settings
 from django.utils.encoding import force_bytes
 
 from moneyed import Money
+from rest_framework.request import Request
 
+from bluebottle.bluebottle_drf2.pagination import BluebottleCursorPagination
 from bluebottle.members.models import Member
 from bluebottle.test.factory_models.accounts import BlueBottleUserFactory
 from bluebottle.test.utils import BluebottleTestCase
@@ -693,3 +695,42 @@ class GetClientIPTestCase(TestCase):
 
         ip = get_client_ip(request)
         self.assertEqual(ip, '127.0.0.1')
+
+
+class CursorPaginationTestCase(BluebottleTestCase):
+    def setUp(self):
+        super(CursorPaginationTestCase, self).setUp()
+        BlueBottleUserFactory.create_batch(5)
+
+    def paginate(self, queryset, cursor=''):
+        pagination = BluebottleCursorPagination()
+        pagination.page_size = 2
+        pagination.cursor_ordering = ('-date_joined', '-id')
+        request = Request(RequestFactory().get('/', {'cursor': cursor}))
+
+        page = pagination.paginate_queryset(queryset, request, view=None)
+        return page, pagination
+
+    def test_paginate(self):
+        ids = []
+        cursor = ''
+        while cursor is not None:
+            page, pagination = self.paginate(Member.objects.all(), cursor)
+            ids += [member.pk for member in page]
+            cursor = pagination.cursor
+
+        self.assertEqual(
+            ids, list(Member.objects.order_by('-date_joined', '-id').values_list('pk', flat=True))
+        )
+
+    def test_paginate_values(self):
+        ids = []
+        cursor = ''
+        while cursor is not None:
+            page, pagination = self.paginate(Member.objects.values('id', 'date_joined'), cursor)
+            ids += [member['id'] for member in page]
+            cursor = pagination.cursor
+
+        self.assertEqual(
+            ids, list(Member.objects.order_by('-date_joined', '-id').values_list('pk', flat=True))
+        )
@@ -1,10 +1,12 @@
 from builtins import object
+from collections import OrderedDict
 import mimetypes
 import os
 
 import icalendar
 
 import magic
+from django.conf import settings
 from django.core.paginator import Paginator
 from django.core.signing import TimestampSigner, BadSignature
 from django.db.models import Case, When, IntegerField
@@ -14,10 +16,13 @@ from django.utils.functional import cached_property
 from django.views.generic import TemplateView
 from django.views.generic.base import View
 from django.views.generic.detail import DetailView
+from elasticsearch.exceptions import RequestError
 from parler.utils.i18n import get_language
 from rest_framework import generics
 from rest_framework import views, response
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
 from rest_framework_json_api.exceptions import exception_handler
 from rest_framework_json_api.pagination import JsonApiPageNumberPagination
 from rest_framework_json_api.parsers import JSONParser
@@ -25,8 +30,10 @@ from rest_framework_json_api.views import AutoPrefetchMixin
 from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 from taggit.models import Tag
 
+from bluebottle.bluebottle_drf2.pagination import CursorPaginationMixin
 from bluebottle.bluebottle_drf2.renderers import BluebottleJSONAPIRenderer
 from bluebottle.clients import properties
+from bluebottle.utils import cache as response_cache
 from bluebottle.utils.permissions import ResourcePermission
 from .models import Language
 from .serializers import LanguageSerializer
@@ -236,6 +243,17 @@ class TranslatedApiViewMixin(object):
         return qs
 
 
+def order_by_pks(queryset, pks):
+    """
+    Order `queryset` in the order of `pks`, for example the order of search results
+    """
+    preserved_order = Case(
+        *[When(pk=pk, then=pos) for pos, pk in enumerate(pks)],
+        output_field=IntegerField()
+    )
+    return queryset.annotate(search_order=preserved_order).order_by('search_order')
+
+
 class ESPaginator(Paginator):
     @cached_property
     def count(self):
@@ -274,11 +292,7 @@ class ESPaginator(Paginator):
                 pks = search.to_queryset().values_list('id', flat=True)
                 queryset = search.to_queryset()
 
-            preserved_order = Case(
-                *[When(pk=pk, then=pos) for pos, pk in enumerate(pks)],
-                output_field=IntegerField()
-            )
-            page.object_list = queryset.annotate(search_order=preserved_order).order_by('search_order')
+            page.object_list = order_by_pks(queryset, pks)
         else:
             page = self._get_page(self.object_list[bottom:top], number, self)
 
@@ -291,6 +305,69 @@ class JsonApiPagination(JsonApiPageNumberPagination):
     django_paginator_class = ESPaginator
 
 
+class JsonApiCursorPagination(CursorPaginationMixin, JsonApiPagination):
+    """
+    Pagination with `page[cursor]`, for deep pages of large lists.
+
+    Lists from the database use keyset pagination on `cursor_ordering`, lists from
+    elasticsearch use `search_after` on the sort of the search, with the document id as
+    tie breaker. Pass an empty `page[cursor]` to get the first page.
+    """
+    cursor_query_param = 'page[cursor]'
+
+    def paginate_search(self, queryset, search, request):
+        self.request = request
+        page_size = self.get_cursor_page_size(request)
+
+        sort = list(search.to_dict().get('sort') or ['_score']) + [{'_id': 'asc'}]
+        search = search.sort(*sort)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            values = self.decode_cursor(cursor)
+            if not isinstance(values, list) or len(values) != len(sort):
+                raise NotFound('Invalid cursor')
+
+            search = search.extra(search_after=values)
+
+        try:
+            hits = list(search[:page_size + 1].execute())
+        except RequestError:
+            # Values that do not match the type of the sort fields
+            raise NotFound('Invalid cursor')
+        page = hits[:page_size]
+
+        if len(hits) > page_size:
+            self.cursor = self.encode_cursor(list(page[-1].meta.sort))
+        else:
+            self.cursor = None
+
+        pks = [hit.meta.id for hit in page]
+        self.cursor_page = list(order_by_pks(queryset.filter(pk__in=pks), pks))
+        return self.cursor_page
+
+    def paginate_cursor(self, queryset, request, view=None):
+        if isinstance(queryset, tuple):
+            return self.paginate_search(*queryset, request=request)
+
+        return super(JsonApiCursorPagination, self).paginate_cursor(queryset, request, view)
+
+    def get_cursor_paginated_response(self, data):
+        return Response({
+            'results': data,
+            'meta': {
+                'pagination': OrderedDict([
+                    ('cursor', self.cursor),
+                ])
+            },
+            'links': OrderedDict([
+                ('first', self.get_cursor_link('')),
+                ('next', self.get_next_cursor_link()),
+                ('prev', None),
+            ])
+        })
+
+
 class JsonApiViewMixin(AutoPrefetchMixin):
 
     pagination_class = JsonApiPagination
@@ -303,6 +380,50 @@ class JsonApiViewMixin(AutoPrefetchMixin):
         return exception_handler
 
 
+class CachedResponseMixin(object):
+    """
+    Cache the rendered responses of GET requests by anonymous users.
+
+    Responses are cached per tenant, language and url, and are invalidated when any of
+    `cache_models` changes. Cached responses have an ETag, so that clients can use
+    `If-None-Match` to get a 304.
+
+    Set `cache_authenticated` if the response does not depend on the user.
+    """
+    cache_models = ()
+    cache_authenticated = False
+
+    def use_response_cache(self, request):
+        return (
+            settings.RESPONSE_CACHE_TIMEOUT and
+            request.method == 'GET' and
+            (self.cache_authenticated or not request.user.is_authenticated)
+        )
+
+    def get(self, request, *args, **kwargs):
+        # View permissions are checked before this, in `initial`. Object permissions are
+        # only checked on a miss: the key contains the versions of the objects, groups and
+        # platform settings they depend on, so a hit was allowed when it was cached.
+        # Responses of views with `cache_authenticated` should not depend on the user.
+        if self.use_response_cache(request):
+            self.response_cache_key = response_cache.get_response_key(request, self.cache_models)
+            cached = response_cache.get_cached_response(self.response_cache_key)
+            if cached:
+                return cached
+
+        return super(CachedResponseMixin, self).get(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super(CachedResponseMixin, self).finalize_response(request, response, *args, **kwargs)
+
+        key = getattr(self, 'response_cache_key', None)
+        if key and isinstance(response, Response) and response.status_code == 200:
+            response.render()
+            response_cache.set_cached_response(key, response)
+
+        return response_cache.not_modified(request, response)
+
+
 class NoPagination(PageNumberPagination):
     page_size = 10000
 
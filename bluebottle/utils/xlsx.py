@@ -1,22 +1,30 @@
-import os
+import tempfile
 
 import xlsxwriter
-from django.http import HttpResponse
+from django.http import FileResponse
 
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
 
-def generate_xlsx(filename, data):
-    workbook = xlsxwriter.Workbook(filename, {'remove_timezone': True})
+
+def generate_xlsx_file(rows):
+    """
+    Write `rows` to a temporary XLSX file.
+
+    The workbook is written in constant memory mode, which flushes each row to disk, so
+    `rows` can be a generator over a large queryset.
+    """
+    output = tempfile.TemporaryFile()
+    workbook = xlsxwriter.Workbook(output, {'remove_timezone': True, 'constant_memory': True})
     worksheet = workbook.add_worksheet()
-    for t, row in enumerate(data):
+    for t, row in enumerate(rows):
         worksheet.write_row(t, 0, row)
     workbook.close()
-    return filename
+
+    output.seek(0)
+    return output
 
 
-def generate_xlsx_response(filename, data):
-    filename = generate_xlsx(filename, data)
-    file_path = os.path.join(os.path.dirname(os.path.realpath(__name__)), filename)
-    response = HttpResponse(open(file_path, 'rb').read())
-    response['Content-Type'] = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+def generate_xlsx_streaming_response(filename, rows):
+    response = FileResponse(generate_xlsx_file(rows), content_type=XLSX_CONTENT_TYPE)
     response['Content-Disposition'] = f'attachment; filename="{filename}"'
     return response
@@ -1,4 +1,6 @@
 from builtins import str
+from urllib.parse import parse_qs, urlparse
+
 from django.contrib.auth.models import Group, Permission
 from django.urls import reverse
 from djmoney.money import Money
@@ -619,6 +621,49 @@ class TestPinnedWallpost(BluebottleTestCase):
         self.assertEqual(response.data['results'][5]['author']['id'], self.initiator.id)
         self.assertEqual(response.data['results'][5]['pinned'], False)
 
+    def test_pinned_wallposts_cursor(self):
+        MediaWallpostFactory.create(author=self.initiator, content_object=self.initiative)
+        MediaWallpostFactory.create(author=self.user, content_object=self.initiative)
+        MediaWallpostFactory.create(author=self.initiator, content_object=self.initiative)
+        MediaWallpostFactory.create_batch(3, author=self.user, content_object=self.initiative)
+
+        params = {'parent_id': self.initiative.id, 'parent_type': 'initiative'}
+        expected = [
+            wallpost['id'] for wallpost in
+            self.client.get(self.wallpost_url, params, token=self.user_token).data['results']
+        ]
+
+        ids = []
+        pinned = []
+        cursor = ''
+        while cursor is not None:
+            response = self.client.get(
+                self.wallpost_url,
+                dict(params, cursor=cursor, page_size=2),
+                token=self.user_token
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(len(response.data['results']) <= 2)
+
+            ids += [wallpost['id'] for wallpost in response.data['results']]
+            pinned += [wallpost['pinned'] for wallpost in response.data['results']]
+
+            cursor = None
+            if response.data['next']:
+                cursor = parse_qs(urlparse(response.data['next']).query)['cursor'][0]
+
+        self.assertEqual(ids, expected)
+        self.assertEqual(len(set(ids)), 6)
+        self.assertEqual(pinned, [True, False, False, False, False, False])
+
+    def test_wallposts_invalid_cursor(self):
+        response = self.client.get(
+            self.wallpost_url,
+            {'parent_id': self.initiative.id, 'parent_type': 'initiative', 'cursor': 'invalid'},
+            token=self.user_token
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
 
 class InitiativeWallpostTest(BluebottleTestCase):
     def setUp(self):
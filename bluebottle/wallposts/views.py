@@ -7,7 +7,7 @@ from rest_framework.generics import RetrieveDestroyAPIView
 
 from rest_framework.throttling import UserRateThrottle
 
-from bluebottle.bluebottle_drf2.pagination import BluebottlePagination
+from bluebottle.bluebottle_drf2.pagination import BluebottlePagination, BluebottleCursorPagination
 from bluebottle.utils.permissions import (
     OneOf, ResourcePermission, RelatedResourceOwnerPermission, ResourceOwnerPermission
 )
@@ -108,7 +108,8 @@ class ParentTypeFilterMixin(object):
 class WallpostList(WallpostOwnerFilterMixin, ParentTypeFilterMixin, ListAPIView):
     queryset = Wallpost.objects.all()
     serializer_class = WallpostSerializer
-    pagination_class = BluebottlePagination
+    pagination_class = BluebottleCursorPagination
+    cursor_ordering = ('-pinned', '-created', '-id')
     permission_classes = (
         OneOf(ResourcePermission, RelatedResourceOwnerPermission),
         DonationOwnerPermission,
@@ -116,8 +117,9 @@ class WallpostList(WallpostOwnerFilterMixin, ParentTypeFilterMixin, ListAPIView)
     )
 
 
-class WallpostPagination(BluebottlePagination):
+class WallpostPagination(BluebottleCursorPagination):
     page_size = 5
+    cursor_ordering = ('-pinned', '-created', '-id')
 
 
 class TextWallpostList(WallpostOwnerFilterMixin, ParentTypeFilterMixin, SetAuthorMixin, ListCreateAPIView):